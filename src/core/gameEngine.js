@@ -201,7 +201,7 @@ export class GameEngine {
         const intersects = raycaster.intersectObjects(this.scene.children);
         if (intersects.length > 0) {
             const clickedObject = intersects[0];
-            this.blockSystem.handleBlockClick(clickedObject, this.inventorySystem);
+            this.blockSystem.handleBlockClick(clickedObject, this.inventorySystem, this.audioSystem);
         }
     }
 
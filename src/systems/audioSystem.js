@@ -6,6 +6,13 @@
 
 import { AUDIO_CONSTANTS } from '../constants/audio.js';
 
+// tests/python/audio_bank.py formatı
+const SOUND_BANK_PATH = '/assets/audio/soundbank.bin';
+const SOUND_BANK_MAGIC = 'SKYA';
+const SOUND_BANK_VERSION = 1;
+const SOUND_BANK_HEADER_SIZE = 18;
+const SOUND_BANK_FLAG_DEFLATE = 0x01;
+
 export class AudioSystem {
     constructor() {
         this.audioContext = null;
@@ -32,6 +39,16 @@ export class AudioSystem {
     }
 
     async loadSounds() {
+        // Önce tests/python/audio_bank.py ile önceden üretilmiş sound bank'i dene:
+        // tek istek, decodeAudioData ve örnek örnek sentez yok
+        try {
+            const bank = await this.loadSoundBank(SOUND_BANK_PATH);
+            bank.forEach((buffer, name) => this.sounds.set(name, buffer));
+            return;
+        } catch (error) {
+            console.warn('Sound bank unavailable, loading individual files:', error);
+        }
+
         const soundFiles = {
             click: '/assets/audio/click.mp3',
             place: '/assets/audio/place.mp3',
@@ -41,7 +58,8 @@ export class AudioSystem {
             music: '/assets/audio/ambient.mp3'
         };
 
-        for (const [name, path] of Object.entries(soundFiles)) {
+        // Dosyalar sırayla değil paralel indirilir
+        await Promise.all(Object.entries(soundFiles).map(async ([name, path]) => {
             try {
                 const audio = await this.loadAudioFile(path);
                 this.sounds.set(name, audio);
@@ -50,7 +68,79 @@ export class AudioSystem {
                 // Ses yüklenemezse alternatif oluştur
                 this.createAlternativeSound(name);
             }
+        }));
+    }
+
+    async loadSoundBank(path) {
+        const response = await fetch(path);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status} for ${path}`);
+        }
+        const buffer = await response.arrayBuffer();
+        const view = new DataView(buffer);
+
+        // Header: magic, version, flags, channels, bits, sampleRate, count, indexSize
+        const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+        if (magic !== SOUND_BANK_MAGIC) {
+            throw new Error('Not a SkyWorld sound bank');
+        }
+        if (view.getUint8(4) !== SOUND_BANK_VERSION) {
+            throw new Error(`Unsupported sound bank version: ${view.getUint8(4)}`);
+        }
+        const flags = view.getUint8(5);
+        const channels = view.getUint8(6);
+        const bits = view.getUint8(7);
+        const sampleRate = view.getUint32(8, true);
+        const count = view.getUint16(12, true);
+        const indexSize = view.getUint32(14, true);
+
+        const decoder = new TextDecoder();
+        const entries = [];
+        let offset = SOUND_BANK_HEADER_SIZE;
+        for (let i = 0; i < count; i++) {
+            const nameLength = view.getUint8(offset);
+            const name = decoder.decode(new Uint8Array(buffer, offset + 1, nameLength));
+            offset += 1 + nameLength;
+            entries.push({
+                name,
+                byteOffset: view.getUint32(offset, true),
+                frames: view.getUint32(offset + 4, true)
+            });
+            offset += 8;
+        }
+
+        // Veri bölümü 4 bayta hizalı; sıkıştırılmışsa tarayıcı içinde açılır
+        let data = buffer;
+        let dataStart = Math.ceil((SOUND_BANK_HEADER_SIZE + indexSize) / 4) * 4;
+        if (flags & SOUND_BANK_FLAG_DEFLATE) {
+            const stream = new Blob([new Uint8Array(buffer, dataStart)]).stream()
+                .pipeThrough(new DecompressionStream('deflate'));
+            data = await new Response(stream).arrayBuffer();
+            dataStart = 0;
+        }
+
+        const sounds = new Map();
+        for (const entry of entries) {
+            const audioBuffer = this.audioContext.createBuffer(channels, entry.frames, sampleRate);
+            const start = dataStart + entry.byteOffset;
+            const samples = bits === 32
+                ? new Float32Array(data, start, entry.frames * channels)
+                : new Int16Array(data, start, entry.frames * channels);
+            const scale = bits === 32 ? 1 : 1 / 32768;
+
+            for (let channel = 0; channel < channels; channel++) {
+                const channelData = audioBuffer.getChannelData(channel);
+                if (channels === 1 && bits === 32) {
+                    channelData.set(samples);
+                    continue;
+                }
+                for (let i = 0; i < entry.frames; i++) {
+                    channelData[i] = samples[i * channels + channel] * scale;
+                }
+            }
+            sounds.set(entry.name, audioBuffer);
         }
+        return sounds;
     }
 
     async loadAudioFile(path) {
@@ -227,12 +317,15 @@ export class AudioSystem {
     }
 
     // Oyun olayları için ses fonksiyonları
-    onBlockPlaced() {
-        this.playSound('place', 0.5);
+    onBlockPlaced(blockType) {
+        // Sound bank varsa malzemeye özel varyantı çal
+        const variant = `place_${blockType}`;
+        this.playSound(this.sounds.has(variant) ? variant : 'place', 0.5);
     }
 
-    onBlockBroken() {
-        this.playSound('break', 0.5);
+    onBlockBroken(blockType) {
+        const variant = `break_${blockType}`;
+        this.playSound(this.sounds.has(variant) ? variant : 'break', 0.5);
     }
 
     onPlayerJump() {
@@ -112,7 +112,7 @@ export class BlockSystem {
         this.updateChunkMesh(chunk);
     }
 
-    handleBlockClick(intersection, inventorySystem) {
+    handleBlockClick(intersection, inventorySystem, audioSystem) {
         const point = intersection.point;
         const face = intersection.face;
         
@@ -126,12 +126,14 @@ export class BlockSystem {
             // Envantere ekle
             const blockType = intersection.object.userData.blockType;
             inventorySystem.addItem(blockType, 1);
+            audioSystem.onBlockBroken(blockType);
         } else {
             // Blok yerleştir
             const selectedBlock = inventorySystem.getSelectedBlock();
             if (selectedBlock !== BLOCK_TYPES.AIR) {
                 this.setBlock(blockPos.x, blockPos.y, blockPos.z, selectedBlock);
                 inventorySystem.removeItem(selectedBlock, 1);
+                audioSystem.onBlockPlaced(selectedBlock);
             }
         }
     }
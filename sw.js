@@ -30,6 +30,8 @@ const urlsToCache = [
   '/docs/API.md',
   'https://cdn.jsdelivr.net/npm/three@0.160.0/build/three.module.js'
 ];
+// İçerik hash'i taşıyan URL'ler; build (tests/python/asset_pipeline.py) doldurur
+const hashedUrls = new Set([]);
 
 // Install event - Cache files
 self.addEventListener('install', (event) => {
@@ -39,7 +41,14 @@ self.addEventListener('install', (event) => {
     caches.open(CACHE_NAME)
       .then((cache) => {
         console.log('Service Worker: Caching files');
-        return cache.addAll(urlsToCache);
+        // Hash'li URL eski cache'te varsa içerik değişmemiştir ve ağdan tekrar
+        // indirilmez; index.html gibi sabit isimli dosyalar her zaman indirilir
+        return Promise.all(urlsToCache.map((url) => {
+          if (!hashedUrls.has(url)) {
+            return cache.add(url);
+          }
+          return caches.match(url).then((cached) => (cached ? cache.put(url, cached) : cache.add(url)));
+        }));
       })
       .catch((error) => {
         console.error('Service Worker: Cache install failed', error);
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Static Asset Build Pipeline
+@author MiniMax Agent
+
+Bu dosya production build adımını içerir: her asset içerik hash'i ile
+isimlendirilir, modül import yolları yeni isimlere göre yeniden yazılır,
+.gz/.br kardeş dosyaları paralel üretilir ve sw.js için cache listesi
+(urlsToCache) otomatik oluşturulur. Değişmeyen girdiler hash cache
+sayesinde bir sonraki build'de atlanır.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import logging
+import concurrent.futures
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli opsiyonel; yoksa sadece .gz üretilir
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# dev.sh build_prod ile aynı girdi seti
+DEFAULT_INCLUDES = ('index.html', '404.html', 'sw.js', 'site.webmanifest', 'src', 'assets', 'docs')
+
+# Sadece referansları yeniden yazılabilen dosyalar fingerprint alır
+FINGERPRINT_EXTENSIONS = {'.js', '.css'}
+TEXT_EXTENSIONS = {'.html', '.js', '.css', '.json', '.md', '.webmanifest', '.svg', '.txt'}
+# .bin: audio_bank.py'nin ürettiği ham PCM sound bank
+COMPRESS_EXTENSIONS = TEXT_EXTENSIONS | {'.bin'}
+STABLE_NAMES = {'sw.js'}
+
+MIN_COMPRESS_SIZE = 512
+HASH_LENGTH = 10
+CACHE_FILE_NAME = '.build-cache.json'
+MANIFEST_FILE_NAME = 'asset-manifest.json'
+
+# import x from './a.js' / export * from '../b.js' / import './c.js' / import('./d.js')
+JS_SPECIFIER_PATTERN = re.compile(
+    r"""(\bfrom\s*|\bimport\s*\(?\s*)(['"])([^'"\n]+)\2"""
+)
+HTML_ATTRIBUTE_PATTERN = re.compile(r"""(\b(?:src|href)\s*=\s*)(['"])([^'"\n]+)\2""")
+CSS_URL_PATTERN = re.compile(r"""(url\(\s*)(['"]?)([^'")\s]+)\2""")
+
+SW_CACHE_NAME_PATTERN = re.compile(r"const CACHE_NAME = '[^']*';")
+SW_URLS_PATTERN = re.compile(r"const urlsToCache = \[.*?\];", re.DOTALL)
+SW_EXTERNAL_URL_PATTERN = re.compile(r"'(https?://[^']+)'")
+SW_HASHED_URLS_PATTERN = re.compile(r"const hashedUrls = new Set\(\[.*?\]\);", re.DOTALL)
+
+
+@dataclass
+class BuildReport:
+    """Build sonuç veri yapısı"""
+    files_total: int = 0
+    files_built: int = 0
+    files_skipped: int = 0
+    files_removed: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    bytes_gzip: int = 0
+    bytes_brotli: int = 0
+    duration: float = 0.0
+    cache_name: str = ""
+    manifest: Dict[str, str] = field(default_factory=dict)
+
+
+def content_hash(*parts: bytes) -> str:
+    """Verilen parçaların sha256 hex özeti"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def fingerprinted_name(rel_path: str, fingerprint: str) -> str:
+    """src/core/gameEngine.js -> src/core/gameEngine.<hash>.js"""
+    path = Path(rel_path)
+    if path.suffix not in FINGERPRINT_EXTENSIONS or rel_path in STABLE_NAMES:
+        return rel_path
+    return path.with_name(f"{path.stem}.{fingerprint[:HASH_LENGTH]}{path.suffix}").as_posix()
+
+
+class AssetPipeline:
+    """Content-hash tabanlı, artımlı statik build"""
+
+    def __init__(self, root: Path = PROJECT_ROOT, out_dir: Optional[Path] = None,
+                 includes: Tuple[str, ...] = DEFAULT_INCLUDES, max_workers: Optional[int] = None):
+        self.root = Path(root).resolve()
+        self.out_dir = Path(out_dir).resolve() if out_dir else self.root / 'dist'
+        self.includes = includes
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.cache_file = self.out_dir / CACHE_FILE_NAME
+        self.cache: Dict[str, dict] = {}
+
+    # ------------------------------------------------------------------
+    # Girdi toplama ve hash cache
+    # ------------------------------------------------------------------
+
+    def collect_sources(self) -> List[str]:
+        """Build'e girecek dosyaların root'a göre yolları"""
+        sources = []
+        for include in self.includes:
+            path = self.root / include
+            if path.is_file():
+                sources.append(include)
+            elif path.is_dir():
+                for file_path in sorted(path.rglob('*')):
+                    if file_path.is_file() and not file_path.name.startswith('.'):
+                        sources.append(file_path.relative_to(self.root).as_posix())
+        return sources
+
+    def load_cache(self):
+        """Önceki build'in hash cache'ini yükle"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.cache = json.load(f).get('files', {})
+        except (OSError, ValueError):
+            self.cache = {}
+
+    def save_cache(self, entries: Dict[str, dict]):
+        """Hash cache'i kaydet"""
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'files': entries}, f, indent=2, sort_keys=True)
+
+    def scan_source(self, rel_path: str, sources: Set[str]) -> dict:
+        """Kaynak hash'i ve bağımlılıklarını bul; mtime/boyut değişmediyse cache'ten al"""
+        stat = (self.root / rel_path).stat()
+        cached = self.cache.get(rel_path)
+        if cached and cached.get('mtime_ns') == stat.st_mtime_ns and cached.get('size') == stat.st_size:
+            return {key: cached[key] for key in ('mtime_ns', 'size', 'source_hash', 'deps')}
+
+        data = (self.root / rel_path).read_bytes()
+        return {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'source_hash': content_hash(data),
+            'deps': sorted(self.find_references(rel_path, data, sources)),
+        }
+
+    # ------------------------------------------------------------------
+    # Referans çözümleme ve yeniden yazma
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def reference_pattern(rel_path: str) -> Optional[re.Pattern]:
+        """Dosya tipine göre referans regex'i"""
+        suffix = Path(rel_path).suffix
+        if suffix == '.js':
+            return JS_SPECIFIER_PATTERN
+        if suffix == '.css':
+            return CSS_URL_PATTERN
+        if suffix == '.html':
+            return HTML_ATTRIBUTE_PATTERN
+        return None
+
+    @staticmethod
+    def resolve_reference(rel_path: str, specifier: str) -> Optional[str]:
+        """Bir import/href değerini root'a göre yola çevir (harici URL'ler None)"""
+        if re.match(r'^[a-z][a-z0-9+.-]*:', specifier, re.IGNORECASE) or specifier.startswith(('//', '#')):
+            return None
+        specifier = specifier.split('#', 1)[0].split('?', 1)[0]
+        if not specifier:
+            return None
+        if specifier.startswith('/'):
+            resolved = specifier.lstrip('/')
+        elif specifier.startswith(('./', '../')) or Path(rel_path).suffix != '.js':
+            resolved = os.path.normpath(os.path.join(os.path.dirname(rel_path), specifier))
+        else:
+            return None  # 'three' gibi bare specifier
+        return Path(resolved).as_posix()
+
+    def find_references(self, rel_path: str, data: bytes, sources: Set[str]) -> Set[str]:
+        """Dosyanın build'e dahil diğer asset'lere referansları"""
+        pattern = self.reference_pattern(rel_path)
+        if pattern is None:
+            return set()
+        text = data.decode('utf-8', errors='replace')
+        refs = set()
+        for match in pattern.finditer(text):
+            resolved = self.resolve_reference(rel_path, match.group(3))
+            if resolved in sources and resolved != rel_path:
+                refs.add(resolved)
+        if Path(rel_path).suffix == '.html':
+            # Inline <script type="module"> içindeki import'lar
+            for match in JS_SPECIFIER_PATTERN.finditer(text):
+                resolved = self.resolve_reference(rel_path, match.group(3))
+                if resolved in sources and resolved != rel_path:
+                    refs.add(resolved)
+        return refs
+
+    def rewrite_references(self, rel_path: str, text: str, names: Dict[str, str]) -> str:
+        """Referansları fingerprint'li isimlere çevir (yazım stili korunur)"""
+        def replace(match):
+            specifier = match.group(3)
+            resolved = self.resolve_reference(rel_path, specifier)
+            new_name = names.get(resolved)
+            if not new_name or new_name == resolved:
+                return match.group(0)
+            old_base = Path(resolved).name
+            new_base = Path(new_name).name
+            head, sep, tail = specifier.partition(old_base)
+            if not sep:
+                return match.group(0)
+            return f"{match.group(1)}{match.group(2)}{head}{new_base}{tail}{match.group(2)}"
+
+        pattern = self.reference_pattern(rel_path)
+        if pattern is not None:
+            text = pattern.sub(replace, text)
+        if Path(rel_path).suffix == '.html':
+            text = JS_SPECIFIER_PATTERN.sub(replace, text)
+        return text
+
+    # ------------------------------------------------------------------
+    # Fingerprint ve service worker manifest
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def closure_fingerprints(entries: Dict[str, dict]) -> Dict[str, str]:
+        """Dosya + tüm geçişli bağımlılıklarının hash'i (döngülere dayanıklı)"""
+        fingerprints = {}
+        for rel_path in entries:
+            seen = {rel_path}
+            stack = [rel_path]
+            while stack:
+                for dep in entries[stack.pop()]['deps']:
+                    if dep not in seen and dep in entries:
+                        seen.add(dep)
+                        stack.append(dep)
+            fingerprints[rel_path] = content_hash(
+                *(f"{path}={entries[path]['source_hash']}".encode() for path in sorted(seen))
+            )
+        return fingerprints
+
+    def render_service_worker(self, text: str, cache_name: str, urls: List[str], hashed_urls: List[str]) -> str:
+        """sw.js içindeki CACHE_NAME, urlsToCache ve hashedUrls'i güncelle
+
+        Sadece hashed_urls eski cache'ten yeniden kullanılabilir; sabit isimli
+        URL'ler (index.html, dokümanlar, sound bank) her kurulumda indirilir.
+        """
+        externals = []
+        match = SW_URLS_PATTERN.search(text)
+        if match:
+            externals = SW_EXTERNAL_URL_PATTERN.findall(match.group(0))
+        url_lines = ',\n'.join(f"  '{url}'" for url in ['/'] + urls + externals)
+        hashed_lines = ',\n'.join(f"  '{url}'" for url in hashed_urls)
+        text = SW_CACHE_NAME_PATTERN.sub(lambda _: f"const CACHE_NAME = '{cache_name}';", text, count=1)
+        text = SW_HASHED_URLS_PATTERN.sub(lambda _: f"const hashedUrls = new Set([\n{hashed_lines}\n]);", text, count=1)
+        return SW_URLS_PATTERN.sub(lambda _: f"const urlsToCache = [\n{url_lines}\n];", text, count=1)
+
+    def project_version(self) -> str:
+        """package.json sürümü"""
+        try:
+            with open(self.root / 'package.json', 'r', encoding='utf-8') as f:
+                return json.load(f).get('version', '0.0.0')
+        except (OSError, ValueError):
+            return '0.0.0'
+
+    # ------------------------------------------------------------------
+    # Çıktı üretimi
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def compress_output(path: Path) -> Tuple[int, int]:
+        """.gz ve (varsa) .br kardeş dosyalarını yaz"""
+        data = path.read_bytes()
+        gzip_size = brotli_size = 0
+        if path.suffix not in COMPRESS_EXTENSIONS or len(data) < MIN_COMPRESS_SIZE:
+            return gzip_size, brotli_size
+
+        gzipped = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(gzipped) < len(data):
+            path.with_name(path.name + '.gz').write_bytes(gzipped)
+            gzip_size = len(gzipped)
+
+        if brotli is not None:
+            compressed = brotli.compress(data, quality=11)
+            if len(compressed) < len(data):
+                path.with_name(path.name + '.br').write_bytes(compressed)
+                brotli_size = len(compressed)
+        return gzip_size, brotli_size
+
+    def outputs_exist(self, entry: dict) -> bool:
+        """Cache'teki çıktı dosyaları hâlâ diskte mi"""
+        return all((self.out_dir / name).exists() for name in entry.get('outputs', []))
+
+    def remove_stale_outputs(self, entries: Dict[str, dict]) -> int:
+        """Önceki build'den kalan, artık üretilmeyen dosyaları sil"""
+        current = {name for entry in entries.values() for name in entry['outputs']}
+        removed = 0
+        for entry in self.cache.values():
+            for name in entry.get('outputs', []):
+                if name not in current and (self.out_dir / name).exists():
+                    (self.out_dir / name).unlink()
+                    removed += 1
+        return removed
+
+    def build(self) -> BuildReport:
+        """Artımlı production build çalıştır"""
+        start_time = time.time()
+        report = BuildReport()
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.load_cache()
+
+        sources = self.collect_sources()
+        source_set = set(sources)
+        entries = {rel_path: self.scan_source(rel_path, source_set) for rel_path in sources}
+
+        fingerprints = self.closure_fingerprints(entries)
+        names = {rel_path: fingerprinted_name(rel_path, fingerprints[rel_path]) for rel_path in sources}
+
+        cacheable = sorted(names[rel_path] for rel_path in sources if rel_path not in STABLE_NAMES)
+        hashed = sorted(names[rel_path] for rel_path in sources if names[rel_path] != rel_path)
+        manifest_digest = content_hash(*(f"{rel}={names[rel]}={entries[rel]['source_hash']}".encode()
+                                         for rel in sorted(sources)))
+        report.cache_name = f"skyworld-v{self.project_version()}-{manifest_digest[:HASH_LENGTH]}"
+        report.manifest = {rel_path: names[rel_path] for rel_path in sources}
+
+        pending = []
+        for rel_path in sources:
+            entry = entries[rel_path]
+            build_key = content_hash(
+                entry['source_hash'].encode(),
+                *(f"{dep}={names[dep]}".encode() for dep in entry['deps']),
+                report.cache_name.encode() if rel_path in STABLE_NAMES else b'',
+            )
+            previous = self.cache.get(rel_path, {})
+            report.files_total += 1
+            report.bytes_in += entry['size']
+
+            if previous.get('build_key') == build_key and self.outputs_exist(previous):
+                entry.update(build_key=build_key, outputs=previous['outputs'], sizes=previous.get('sizes', {}))
+                report.files_skipped += 1
+                continue
+
+            data = (self.root / rel_path).read_bytes()
+            if Path(rel_path).suffix in TEXT_EXTENSIONS:
+                text = self.rewrite_references(rel_path, data.decode('utf-8'), names)
+                if rel_path == 'sw.js':
+                    text = self.render_service_worker(text, report.cache_name, ['/' + url for url in cacheable],
+                                                      ['/' + url for url in hashed])
+                data = text.encode('utf-8')
+
+            output_path = self.out_dir / names[rel_path]
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            for suffix in ('.gz', '.br'):
+                output_path.with_name(output_path.name + suffix).unlink(missing_ok=True)
+            output_path.write_bytes(data)
+            entry.update(build_key=build_key, sizes={'raw': len(data)})
+            pending.append((rel_path, output_path))
+            report.files_built += 1
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.compress_output, path): rel_path for rel_path, path in pending}
+            for future in concurrent.futures.as_completed(futures):
+                entries[futures[future]]['sizes'].update(zip(('gzip', 'brotli'), future.result()))
+
+        for rel_path, entry in entries.items():
+            name = names[rel_path]
+            sizes = entry.setdefault('sizes', {})
+            if 'outputs' not in entry:
+                entry['outputs'] = [name] + [name + suffix for suffix, key in (('.gz', 'gzip'), ('.br', 'brotli'))
+                                             if sizes.get(key)]
+            report.bytes_out += sizes.get('raw', 0)
+            report.bytes_gzip += sizes.get('gzip', 0)
+            report.bytes_brotli += sizes.get('brotli', 0)
+
+        report.files_removed = self.remove_stale_outputs(entries)
+        with open(self.out_dir / MANIFEST_FILE_NAME, 'w', encoding='utf-8') as f:
+            json.dump({'cacheName': report.cache_name, 'assets': report.manifest}, f, indent=2, sort_keys=True)
+        self.save_cache(entries)
+
+        report.duration = time.time() - start_time
+        logger.info(f"📦 Built {report.files_built}/{report.files_total} assets "
+                    f"({report.files_skipped} unchanged) in {report.duration:.2f}s → {report.cache_name}")
+        return report
+
+
+def main():
+    """Komut satırından build çalıştır"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='SkyWorld static asset build')
+    parser.add_argument('--root', type=Path, default=PROJECT_ROOT, help='Proje kök dizini')
+    parser.add_argument('--out', type=Path, default=None, help='Çıktı dizini (varsayılan: <root>/dist)')
+    parser.add_argument('--jobs', type=int, default=None, help='Paralel sıkıştırma iş sayısı')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    report = AssetPipeline(args.root, args.out, max_workers=args.jobs).build()
+    print(f"  Assets: {report.files_total} ({report.files_built} built, {report.files_skipped} skipped)")
+    print(f"  Size: {report.bytes_out} bytes, gzip: {report.bytes_gzip}, brotli: {report.bytes_brotli}")
+    print(f"  Cache: {report.cache_name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Offline Audio Bank Baker
+@author MiniMax Agent
+
+AudioSystem.loadSounds altı MP3'ü sırayla indirir, başarısız olursa
+createClickSound/createMusicLoop vb. ile sesleri ana thread'de örnek örnek
+sentezler. Bu modül aynı sesleri (ve src/constants/audio.js'teki her blok
+malzemesi için place/break varyantlarını) NumPy ile vektörel olarak önceden
+üretir, tepe seviyesine normalize eder ve tek bir indeksli sound bank
+dosyasına paketler. İstemci dosyayı tek istekle indirir ve PCM verisini
+decodeAudioData çağırmadan dilimleyerek AudioBuffer'lara kopyalar.
+
+Format (little-endian):
+    header  '<4sBBBBIHI'  magic, version, flags, channels, bits, sample rate,
+                          ses sayısı, indeks boyutu
+    indeks  ses başına    uint8 isim uzunluğu + utf-8 isim + '<II'
+                          (veri bölümündeki bayt ofseti, frame sayısı)
+    veri    4 bayta hizalı PCM (int16 ya da float32); FLAG_DEFLATE ise
+            zlib ile sıkıştırılmış (tarayıcıda DecompressionStream('deflate'))
+"""
+
+import re
+import json
+import math
+import time
+import struct
+import zlib
+import logging
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+AUDIO_CONSTANTS_PATH = PROJECT_ROOT / 'src' / 'constants' / 'audio.js'
+DEFAULT_BANK_PATH = PROJECT_ROOT / 'assets' / 'audio' / 'soundbank.bin'
+
+BANK_MAGIC = b'SKYA'
+BANK_VERSION = 1
+HEADER_FORMAT = '<4sBBBBIHI'  # magic, version, flags, channels, bits, sample rate, count, index size
+ENTRY_FORMAT = '<II'  # veri bölümündeki bayt ofseti, frame sayısı
+FLAG_DEFLATE = 0x01
+SAMPLE_FORMATS = {16: np.dtype('<i2'), 32: np.dtype('<f4')}
+DATA_ALIGNMENT = 4
+
+# Efektler -1 dBFS tepeye, müzik arka planda kalacak şekilde -12 dBFS'e normalize edilir
+EFFECT_PEAK_DBFS = -1.0
+MUSIC_PEAK_DBFS = -12.0
+DEFAULT_SEED = 'skyworld_audio'
+
+# AudioSystem.createAlternativeSound ile aynı süre
+BASE_VOICE_DURATION = 0.1
+NOTE_RAMP = 0.005
+REVERB_TAIL = 0.15
+
+# Başlangıç maliyeti modeli: istek başına gidiş-dönüş süresi ve bant genişliği
+MODEL_RTT = 0.05
+MODEL_BANDWIDTH = 2_000_000  # bayt/sn
+MODEL_DECODE_SPEED = 100.0  # decodeAudioData, gerçek zamanın katı
+# audioSystem.loadSounds'un bank yokken paralel indirdiği dosyalar
+FALLBACK_FILES = {
+    'click': 'click.mp3',
+    'place': 'place.mp3',
+    'break': 'break.mp3',
+    'step': 'step.mp3',
+    'jump': 'jump.mp3',
+    'music': 'ambient.mp3'
+}
+
+
+class AudioBankError(ValueError):
+    """Geçersiz ya da bozuk sound bank verisi"""
+
+
+@dataclass
+class AudioBankStats:
+    """Bake sonucu"""
+    voices: int
+    frames: int
+    bank_bytes: int
+    pcm_bytes: int
+    synth_time: float
+    pack_time: float
+
+    @property
+    def bake_time(self) -> float:
+        return self.synth_time + self.pack_time
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.pcm_bytes / self.bank_bytes if self.bank_bytes else 0.0
+
+
+# ----------------------------------------------------------------------
+# src/constants/audio.js okuma
+# ----------------------------------------------------------------------
+
+def _extract_object(source: str, name: str) -> str:
+    """`export const NAME = { ... };` literal'ini süslü parantez eşleyerek çıkar"""
+    match = re.search(rf'export\s+const\s+{name}\s*=\s*{{', source)
+    if match is None:
+        raise AudioBankError(f"{name} not found in audio constants")
+    depth = 0
+    for index in range(match.end() - 1, len(source)):
+        if source[index] == '{':
+            depth += 1
+        elif source[index] == '}':
+            depth -= 1
+            if depth == 0:
+                return source[match.end() - 1:index + 1]
+    raise AudioBankError(f"Unterminated object literal for {name}")
+
+
+def _js_literal_to_json(literal: str) -> Any:
+    """Sabit dosyasındaki basit JS nesne literal'ini JSON olarak çöz"""
+    text = re.sub(r'//[^\n]*', '', literal)
+    text = re.sub(r'\[BLOCK_TYPES\.([A-Z_]+)\]', lambda m: f'"{m.group(1).lower()}"', text)
+    text = re.sub(r'WAVE_TYPES\.([A-Z_]+)', lambda m: f'"{m.group(1).lower()}"', text)
+    text = re.sub(r"'([^']*)'", r'"\1"', text)
+    text = re.sub(r'([{,]\s*)([A-Za-z_][A-Za-z0-9_]*)\s*:', r'\1"\2":', text)
+    text = re.sub(r',\s*([}\]])', r'\1', text)
+    return json.loads(text)
+
+
+def load_audio_constants(path: Path = AUDIO_CONSTANTS_PATH) -> Dict[str, Any]:
+    """Bake için gereken ses sabitlerini JS kaynağından oku"""
+    source = Path(path).read_text(encoding='utf-8')
+    names = ('AUDIO_QUALITY', 'BLOCK_SOUND_FREQUENCIES', 'AUDIO_FILTERS',
+             'MUSIC_CONFIG', 'SFX_CONFIG', 'BLOCK_SOUND_PROPERTIES')
+    try:
+        return {name: _js_literal_to_json(_extract_object(source, name)) for name in names}
+    except json.JSONDecodeError as error:
+        raise AudioBankError(f"Could not parse audio constants: {error}") from None
+
+
+# ----------------------------------------------------------------------
+# Vektörel sentez
+# ----------------------------------------------------------------------
+
+def _time_axis(duration: float, sample_rate: int) -> np.ndarray:
+    return np.arange(int(duration * sample_rate), dtype=np.float64) / sample_rate
+
+
+def oscillator(waveform: str, frequency, duration: float, sample_rate: int) -> np.ndarray:
+    """AUDIO_UTILS.generateWave karşılığı; frequency sabit ya da örnek başına dizi olabilir"""
+    samples = int(duration * sample_rate)
+    frequency = np.broadcast_to(np.asarray(frequency, dtype=np.float64), (samples,))
+    # Değişken frekansta faz, anlık frekansın integrali
+    cycles = np.concatenate(([0.0], np.cumsum(frequency[:-1]))) / sample_rate
+    if waveform == 'square':
+        return np.where(np.sin(2 * np.pi * cycles) >= 0, 1.0, -1.0)
+    if waveform == 'sawtooth':
+        return 2 * (cycles - np.floor(cycles + 0.5))
+    if waveform == 'triangle':
+        return 2 * np.abs(2 * (cycles - np.floor(cycles + 0.5))) - 1
+    return np.sin(2 * np.pi * cycles)
+
+
+def adsr_envelope(samples: int, envelope: Dict[str, float]) -> np.ndarray:
+    """AUDIO_UTILS.applyEnvelope kazancı (aşamalar sesin uzunluğuna oransal)"""
+    attack, decay = envelope['attack'], envelope['decay']
+    sustain, release = envelope['sustain'], envelope['release']
+    t = np.arange(samples, dtype=np.float64) / samples
+    gain = np.select(
+        [t < attack, t < attack + decay, t < 1 - release],
+        [t / attack, 1 - (t - attack) / decay * (1 - sustain), np.full_like(t, sustain)],
+        sustain * (1 - (t - (1 - release)) / release)
+    )
+    return np.maximum(gain, 0)
+
+
+def biquad_filter(signal: np.ndarray, filter_type: str, frequency: float, q: float, sample_rate: int) -> np.ndarray:
+    """BiquadFilterNode (RBJ) yanıtını FFT ile uygula
+
+    IIR filtre örnek örnek çalışır; yerine filtrenin frekans yanıtı
+    sıfır doldurulmuş sinyalin spektrumuyla çarpılır.
+    """
+    w0 = 2 * np.pi * frequency / sample_rate
+    alpha = np.sin(w0) / (2 * q)
+    cos_w0 = np.cos(w0)
+    if filter_type == 'lowpass':
+        b = np.array([(1 - cos_w0) / 2, 1 - cos_w0, (1 - cos_w0) / 2])
+    elif filter_type == 'highpass':
+        b = np.array([(1 + cos_w0) / 2, -(1 + cos_w0), (1 + cos_w0) / 2])
+    elif filter_type == 'bandpass':
+        b = np.array([alpha, 0.0, -alpha])
+    else:
+        raise ValueError(f"Unsupported filter type: {filter_type}")
+    a = np.array([1 + alpha, -2 * cos_w0, 1 - alpha])
+
+    size = 1 << int(math.ceil(math.log2(signal.size * 2)))
+    z = np.exp(-1j * np.linspace(0, np.pi, size // 2 + 1))
+    response = np.polyval(b[::-1], z) / np.polyval(a[::-1], z)
+    return np.fft.irfft(np.fft.rfft(signal, size) * response, size)[:signal.size]
+
+
+def apply_reverb(signal: np.ndarray, amount: float, rng: np.random.Generator, sample_rate: int) -> np.ndarray:
+    """Üstel sönen gürültü impuls yanıtıyla FFT konvolüsyon reverb; kuyruk eklenir"""
+    if amount <= 0:
+        return signal
+    t = _time_axis(REVERB_TAIL, sample_rate)
+    impulse = rng.uniform(-1, 1, t.size) * np.exp(-t / (REVERB_TAIL / 5))
+    impulse /= np.sqrt(np.sum(impulse ** 2))
+    size = signal.size + impulse.size - 1
+    fft_size = 1 << int(math.ceil(math.log2(size)))
+    wet = np.fft.irfft(np.fft.rfft(signal, fft_size) * np.fft.rfft(impulse, fft_size), fft_size)[:size]
+    wet[:signal.size] = signal * (1 - amount) + wet[:signal.size] * amount
+    wet[signal.size:] *= amount
+    return wet
+
+
+def normalize_peak(signal: np.ndarray, peak_dbfs: float) -> np.ndarray:
+    """Tepe genliği peak_dbfs seviyesine ölçekle"""
+    peak = np.max(np.abs(signal)) if signal.size else 0.0
+    if peak == 0:
+        return signal
+    return signal * (10 ** (peak_dbfs / 20) / peak)
+
+
+def synthesize_base_voices(constants: Dict[str, Any], sample_rate: int,
+                           rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """AudioSystem.create*Sound seslerinin vektörel karşılıkları"""
+    t = _time_axis(BASE_VOICE_DURATION, sample_rate)
+    voices = OrderedDict()
+    voices['click'] = np.sin(2 * np.pi * 800 * t) * np.exp(-t / 0.01)
+    voices['place'] = rng.uniform(-1, 1, t.size) * np.exp(-t / 0.05)
+    voices['break'] = rng.uniform(-1, 1, t.size) * np.exp(-t / 0.03)
+    voices['step'] = np.sin(2 * np.pi * 100 * t) * np.exp(-t / 0.02)
+    voices['jump'] = np.sin(2 * np.pi * (200 + t * 300) * t) * np.exp(-t * 5)
+    voices['music'] = synthesize_music_loop(constants['MUSIC_CONFIG'], sample_rate)
+    return voices
+
+
+def synthesize_music_loop(music_config: Dict[str, Any], sample_rate: int) -> np.ndarray:
+    """MUSIC_CONFIG.PATTERN melodisini createMusicLoop armonikleriyle (1, 1.5, 2) tek döngüde sentezle"""
+    frequencies = np.array([note[0] for note in music_config['PATTERN']], dtype=np.float64)
+    lengths = np.array([int(note[1] * sample_rate) for note in music_config['PATTERN']])
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    # Her örneğin ait olduğu nota ve nota içindeki zamanı
+    note_index = np.repeat(np.arange(lengths.size), lengths)
+    local = (np.arange(note_index.size) - starts[note_index]) / sample_rate
+    frequency = frequencies[note_index]
+    tone = (np.sin(2 * np.pi * frequency * local) * 0.3
+            + np.sin(2 * np.pi * frequency * 1.5 * local) * 0.2
+            + np.sin(2 * np.pi * frequency * 2 * local) * 0.1)
+
+    # Nota geçişlerinde tıkırtı olmaması için kısa giriş/çıkış rampası
+    remaining = lengths[note_index] / sample_rate - local
+    ramp = np.minimum(np.minimum(local, remaining) / NOTE_RAMP, 1.0)
+    return tone * ramp
+
+
+def synthesize_block_voices(constants: Dict[str, Any], sample_rate: int,
+                            rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """BLOCK_SOUND_PROPERTIES'teki her malzeme için place_<blok> ve break_<blok>"""
+    frequencies = constants['BLOCK_SOUND_FREQUENCIES']
+    filters = constants['AUDIO_FILTERS']
+    place_duration = constants['SFX_CONFIG']['PLACE']['duration']
+    break_duration = constants['SFX_CONFIG']['LAND']['duration']
+
+    voices = OrderedDict()
+    for block, properties in constants['BLOCK_SOUND_PROPERTIES'].items():
+        low, high = frequencies.get(block, frequencies['DEFAULT'])
+        block_filter = filters.get(block, filters['DEFAULT'])
+        pitch = properties['pitch']
+
+        # Yerleştirme: malzeme frekans aralığında yukarı kayan ton
+        samples = int(place_duration * sample_rate)
+        sweep = np.linspace(low, high, samples) * pitch
+        place = oscillator(properties['waveform'], sweep, place_duration, sample_rate)
+        place *= adsr_envelope(samples, properties['envelope'])
+        voices[f'place_{block}'] = apply_reverb(place, properties['reverb'], rng, sample_rate)
+
+        # Kırma: malzeme filtresinden geçmiş gürültü + düşen ton
+        samples = int(break_duration * sample_rate)
+        t = _time_axis(break_duration, sample_rate)
+        noise = biquad_filter(rng.uniform(-1, 1, samples), block_filter['type'],
+                              block_filter['frequency'], block_filter['Q'], sample_rate)
+        noise /= max(np.max(np.abs(noise)), 1e-9)
+        tone = oscillator(properties['waveform'], np.linspace(high, low, samples) * pitch,
+                          break_duration, sample_rate)
+        crack = (noise * 0.7 + tone * 0.3) * np.exp(-t / 0.04)
+        crack *= adsr_envelope(samples, properties['envelope'])
+        voices[f'break_{block}'] = apply_reverb(crack, properties['reverb'], rng, sample_rate)
+    return voices
+
+
+def bake_voices(constants: Optional[Dict[str, Any]] = None, sample_rate: Optional[int] = None,
+                seed: str = DEFAULT_SEED) -> Dict[str, np.ndarray]:
+    """Tüm sesleri sentezle ve normalize et (aynı seed aynı örnekleri üretir)"""
+    constants = constants or load_audio_constants()
+    sample_rate = sample_rate or constants['AUDIO_QUALITY']['SAMPLE_RATE']
+    rng = np.random.default_rng(zlib.crc32(seed.encode('utf-8')))
+
+    voices = synthesize_base_voices(constants, sample_rate, rng)
+    voices.update(synthesize_block_voices(constants, sample_rate, rng))
+    return OrderedDict(
+        (name, normalize_peak(samples, MUSIC_PEAK_DBFS if name == 'music' else EFFECT_PEAK_DBFS).astype(np.float32))
+        for name, samples in voices.items()
+    )
+
+
+# ----------------------------------------------------------------------
+# Paketleme
+# ----------------------------------------------------------------------
+
+def encode_bank(voices: Dict[str, np.ndarray], sample_rate: int, bits: int = 16, compress: bool = False) -> bytes:
+    """Mono sesleri tek bank dosyasına paketle"""
+    if bits not in SAMPLE_FORMATS:
+        raise AudioBankError(f"Unsupported sample format: {bits} bits (expected 16 or 32)")
+    if len(voices) > 0xFFFF:
+        raise AudioBankError("Sound bank supports at most 65535 voices")
+    dtype = SAMPLE_FORMATS[bits]
+
+    index, chunks, offset = [], [], 0
+    for name, samples in voices.items():
+        encoded_name = name.encode('utf-8')
+        if len(encoded_name) > 255:
+            raise AudioBankError(f"Voice name too long: {name}")
+        samples = np.asarray(samples, dtype=np.float64)
+        if bits == 16:
+            pcm = np.clip(np.round(samples * 32768), -32768, 32767).astype(dtype)
+        else:
+            pcm = samples.astype(dtype)
+        index.append(struct.pack('<B', len(encoded_name)) + encoded_name + struct.pack(ENTRY_FORMAT, offset, pcm.size))
+        chunks.append(pcm.tobytes())
+        offset += pcm.nbytes
+
+    index_bytes = b''.join(index)
+    data = b''.join(chunks)
+    flags = 0
+    if compress:
+        flags |= FLAG_DEFLATE
+        data = zlib.compress(data, 9)
+
+    header = struct.pack(HEADER_FORMAT, BANK_MAGIC, BANK_VERSION, flags, 1, bits, sample_rate, len(voices), len(index_bytes))
+    padding = -(len(header) + len(index_bytes)) % DATA_ALIGNMENT
+    return header + index_bytes + b'\0' * padding + data
+
+
+def decode_bank(data: bytes) -> Tuple[int, Dict[str, np.ndarray]]:
+    """Bank'i (sample rate, isim -> float32 örnekler) olarak çöz
+
+    Sıkıştırılmamış int16/float32 veri kopyalanmadan dilimlenir; istemcideki
+    Int16Array/Float32Array görünümlerinin karşılığıdır.
+    """
+    header_size = struct.calcsize(HEADER_FORMAT)
+    if len(data) < header_size:
+        raise AudioBankError("Sound bank data is truncated")
+    magic, version, flags, channels, bits, sample_rate, count, index_size = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != BANK_MAGIC:
+        raise AudioBankError("Not a SkyWorld sound bank")
+    if version != BANK_VERSION:
+        raise AudioBankError(f"Unsupported sound bank version: {version}")
+    if bits not in SAMPLE_FORMATS or channels != 1:
+        raise AudioBankError(f"Unsupported sample layout: {channels} channel(s), {bits} bits")
+
+    entries, offset = [], header_size
+    entry_size = struct.calcsize(ENTRY_FORMAT)
+    for _ in range(count):
+        length = data[offset]
+        name = bytes(data[offset + 1:offset + 1 + length]).decode('utf-8')
+        offset += 1 + length
+        entries.append((name, *struct.unpack_from(ENTRY_FORMAT, data, offset)))
+        offset += entry_size
+    if offset != header_size + index_size:
+        raise AudioBankError("Sound bank index is corrupt")
+
+    data_start = offset + (-offset % DATA_ALIGNMENT)
+    body = memoryview(data)[data_start:]
+    if flags & FLAG_DEFLATE:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as error:
+            raise AudioBankError(f"Sound bank data is corrupt: {error}") from None
+
+    dtype = SAMPLE_FORMATS[bits]
+    voices = OrderedDict()
+    for name, byte_offset, frames in entries:
+        if byte_offset + frames * dtype.itemsize > len(body):
+            raise AudioBankError(f"Voice {name} extends past end of sound bank")
+        pcm = np.frombuffer(body, dtype=dtype, count=frames, offset=byte_offset)
+        voices[name] = pcm * np.float32(1 / 32768) if bits == 16 else pcm
+    return sample_rate, voices
+
+
+def bake_bank(path: Path = DEFAULT_BANK_PATH, constants: Optional[Dict[str, Any]] = None,
+              sample_rate: Optional[int] = None, bits: int = 16, compress: bool = False,
+              seed: str = DEFAULT_SEED) -> AudioBankStats:
+    """Sesleri sentezle, paketle ve dosyaya yaz"""
+    constants = constants or load_audio_constants()
+    sample_rate = sample_rate or constants['AUDIO_QUALITY']['SAMPLE_RATE']
+
+    synth_start = time.perf_counter()
+    voices = bake_voices(constants, sample_rate, seed)
+    synth_time = time.perf_counter() - synth_start
+
+    pack_start = time.perf_counter()
+    data = encode_bank(voices, sample_rate, bits, compress)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    pack_time = time.perf_counter() - pack_start
+
+    frames = sum(samples.size for samples in voices.values())
+    return AudioBankStats(
+        voices=len(voices),
+        frames=frames,
+        bank_bytes=len(data),
+        pcm_bytes=frames * bits // 8,
+        synth_time=synth_time,
+        pack_time=pack_time
+    )
+
+
+# ----------------------------------------------------------------------
+# Başlangıç maliyeti karşılaştırması
+# ----------------------------------------------------------------------
+
+def synthesize_per_sample(constants: Dict[str, Any], sample_rate: int, seed: str = DEFAULT_SEED,
+                          voices: Optional[Iterable[str]] = None) -> int:
+    """İstemcideki örnek örnek sentez döngülerinin Python karşılığı (karşılaştırma tabanı)
+
+    Temel sesler createClickSound vb. döngüleriyle, blok varyantları
+    AUDIO_UTILS.generateWave + applyEnvelope döngüleriyle üretilir. voices
+    verilirse yalnızca o isimler sentezlenir. Üretilen toplam örnek sayısını
+    döndürür.
+    """
+    wanted = None if voices is None else set(voices)
+    rng = np.random.default_rng(zlib.crc32(seed.encode('utf-8')))
+    noise = rng.uniform(-1, 1, int(sample_rate * BASE_VOICE_DURATION)).tolist()
+    length = int(sample_rate * BASE_VOICE_DURATION)
+    total = 0
+
+    for voice in ('click', 'place', 'break', 'step', 'jump'):
+        if wanted is not None and voice not in wanted:
+            continue
+        data = [0.0] * length
+        for i in range(length):
+            t = i / sample_rate
+            if voice == 'click':
+                data[i] = math.sin(2 * math.pi * 800 * t) * math.exp(-i / (sample_rate * 0.01))
+            elif voice == 'place':
+                data[i] = noise[i] * math.exp(-i / (sample_rate * 0.05))
+            elif voice == 'break':
+                data[i] = noise[i] * math.exp(-i / (sample_rate * 0.03))
+            elif voice == 'step':
+                data[i] = math.sin(2 * math.pi * 100 * t) * math.exp(-i / (sample_rate * 0.02))
+            else:
+                data[i] = math.sin(2 * math.pi * (200 + t * 300) * t) * math.exp(-t * 5)
+        total += length
+
+    for frequency, duration in constants['MUSIC_CONFIG']['PATTERN']:
+        if wanted is not None and 'music' not in wanted:
+            break
+        samples = int(duration * sample_rate)
+        data = [0.0] * samples
+        for i in range(samples):
+            t = i / sample_rate
+            data[i] = (math.sin(2 * math.pi * frequency * t) * 0.3
+                       + math.sin(2 * math.pi * frequency * 1.5 * t) * 0.2
+                       + math.sin(2 * math.pi * frequency * 2 * t) * 0.1)
+        total += samples
+
+    frequencies = constants['BLOCK_SOUND_FREQUENCIES']
+    for variant, key in (('place', 'PLACE'), ('break', 'LAND')):
+        duration = constants['SFX_CONFIG'][key]['duration']
+        samples = int(duration * sample_rate)
+        for block, properties in constants['BLOCK_SOUND_PROPERTIES'].items():
+            if wanted is not None and f'{variant}_{block}' not in wanted:
+                continue
+            frequency = frequencies.get(block, frequencies['DEFAULT'])[0] * properties['pitch']
+            envelope = properties['envelope']
+            attack, decay = envelope['attack'], envelope['decay']
+            sustain, release = envelope['sustain'], envelope['release']
+            data = [0.0] * samples
+            for i in range(samples):
+                t = i / sample_rate
+                phase = t * frequency
+                if properties['waveform'] == 'square':
+                    value = 1.0 if math.sin(2 * math.pi * phase) >= 0 else -1.0
+                elif properties['waveform'] == 'sawtooth':
+                    value = 2 * (phase - math.floor(phase + 0.5))
+                elif properties['waveform'] == 'triangle':
+                    value = 2 * abs(2 * (phase - math.floor(phase + 0.5))) - 1
+                else:
+                    value = math.sin(2 * math.pi * phase)
+                position = i / samples
+                if position < attack:
+                    gain = position / attack
+                elif position < attack + decay:
+                    gain = 1 - (position - attack) / decay * (1 - sustain)
+                elif position < 1 - release:
+                    gain = sustain
+                else:
+                    gain = sustain * (1 - (position - (1 - release)) / release)
+                data[i] = value * max(0.0, gain)
+            total += samples
+    return total
+
+
+def startup_comparison(bank: bytes, constants: Dict[str, Any], rtt: float = MODEL_RTT,
+                       bandwidth: float = MODEL_BANDWIDTH, decode_speed: float = MODEL_DECODE_SPEED) -> Dict[str, Any]:
+    """Aynı ses kümesi (FALLBACK_FILES) için bank ve dosya başına başlangıç maliyeti
+
+    Bank yolu bu sesleri içeren deflate bank'i tek istekte indirip çözer.
+    Dosya başına yol loadSounds gibi dosyaları paralel ister; diskte olanlar
+    aktarım ve decodeAudioData (decode_speed modeli), olmayanlar başarısız
+    isteğin ardından createAlternativeSound örnek örnek sentezi öder. Ağ
+    maliyetleri modeldir; çözme ve sentez süreleri bu makinede ölçülür.
+    Tam bank'in (blok varyantları dahil) boyutu ve çözme süresi ayrıca
+    raporlanır.
+    """
+    bits, sample_rate = struct.unpack_from(HEADER_FORMAT, bank)[4:6]
+
+    full_start = time.perf_counter()
+    _, samples = decode_bank(bank)
+    full_decode_time = time.perf_counter() - full_start
+
+    missing = [name for name in FALLBACK_FILES if name not in samples]
+    if missing:
+        raise AudioBankError(f"Sound bank is missing fallback voices: {', '.join(missing)}")
+    shared = encode_bank({name: samples[name] for name in FALLBACK_FILES}, sample_rate, bits, compress=True)
+
+    decode_start = time.perf_counter()
+    decode_bank(shared)
+    decode_time = time.perf_counter() - decode_start
+
+    audio_dir = DEFAULT_BANK_PATH.parent
+    present = [name for name in FALLBACK_FILES if (audio_dir / FALLBACK_FILES[name]).exists()]
+    absent = [name for name in FALLBACK_FILES if name not in present]
+    file_bytes = sum((audio_dir / FALLBACK_FILES[name]).stat().st_size for name in present)
+    file_decode_time = sum(len(samples[name]) / sample_rate for name in present) / decode_speed
+
+    synth_start = time.perf_counter()
+    synthesized = synthesize_per_sample(constants, sample_rate, voices=absent)
+    synth_time = time.perf_counter() - synth_start
+
+    full_synth_start = time.perf_counter()
+    synthesize_per_sample(constants, sample_rate)
+    full_synth_time = time.perf_counter() - full_synth_start
+
+    bank_startup = rtt + len(shared) / bandwidth + decode_time
+    per_file_startup = rtt + file_bytes / bandwidth + file_decode_time + synth_time
+    return {
+        'compared_voices': len(FALLBACK_FILES),
+        'bank_requests': 1,
+        'bank_bytes': len(shared),
+        'bank_decode_time': decode_time,
+        'bank_startup_time': bank_startup,
+        'per_file_requests': len(FALLBACK_FILES),
+        'per_file_missing': len(absent),
+        'per_file_bytes': file_bytes,
+        'per_file_decode_time': file_decode_time,
+        'per_file_synthesis_time': synth_time,
+        'per_file_synthesized_samples': synthesized,
+        'per_file_startup_time': per_file_startup,
+        'startup_speedup': per_file_startup / bank_startup,
+        'full_bank_voices': len(samples),
+        'full_bank_bytes': len(bank),
+        'full_bank_decode_time': full_decode_time,
+        'per_sample_synthesis_time': full_synth_time,
+        'model_rtt': rtt,
+        'model_bandwidth': bandwidth,
+        'model_decode_speed': decode_speed
+    }
+
+
+def main():
+    """Komut satırından sound bank üret"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Bake the SkyWorld sound bank')
+    parser.add_argument('-o', '--output', type=Path, default=DEFAULT_BANK_PATH, help='Bank dosyası')
+    parser.add_argument('--sample-rate', type=int, default=None, help='Örnekleme hızı (varsayılan: AUDIO_QUALITY.SAMPLE_RATE)')
+    parser.add_argument('--bits', type=int, choices=sorted(SAMPLE_FORMATS), default=16, help='Örnek formatı')
+    parser.add_argument('--compress', action='store_true', help='Veri bölümünü deflate ile sıkıştır')
+    parser.add_argument('--seed', default=DEFAULT_SEED, help='Gürültü seed değeri')
+    args = parser.parse_args()
+
+    stats = bake_bank(args.output, sample_rate=args.sample_rate, bits=args.bits,
+                      compress=args.compress, seed=args.seed)
+    print(f"  Voices: {stats.voices} ({stats.frames} frames)")
+    print(f"  Size: {stats.bank_bytes} bytes (PCM {stats.pcm_bytes} bytes, ratio {stats.compression_ratio:.2f})")
+    print(f"  Bake time: {stats.bake_time * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
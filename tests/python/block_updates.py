@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Block Update Engine
+@author MiniMax Agent
+
+Su/lava akışı ve yerçekimli bloklar (kum) için hücresel otomat. Her tick'te
+bütün yüklü chunk'ları taramak yerine bekleyen güncellemesi olan 16³'lük
+chunk section'ları aktif kümede tutulur; sadece bu section'lar işlenir:
+
+- Seçilen section'lar kenar payı (halo) ile birlikte tek bir numpy yığınına
+  okunur, kurallar yığının tamamına vektörel uygulanır, sonuçlar sadece
+  değişen hücrelere geri yazılır.
+- Kurallar tick başındaki duruma göre hesaplanır (Jacobi); section işlenme
+  sırası sonucu değiştirmez. Aktif section'lar (sy, cx, cz) sırasıyla
+  seçilir, bütçeyi aşanlar sırası korunarak bir sonraki tick'e taşınır.
+- Değişiklik yapan section aktif kalır; değişiklik section kenarına
+  değiyorsa komşu section'lar da uyandırılır.
+
+Kurallar:
+- Yerçekimi: kum altı hava ise bir blok düşer. Geçiş kaynağın section'ına
+  aittir; hedef alttaki section'da olabilir.
+- Akışkanlar Minecraft tarzı seviye alanıdır: kaynak 8, akan 1..7. Üstünde
+  akışkan olan hücre 7 olur; yatayda altı katı blok ya da kaynak olan
+  komşudan seviye - azalma kadar yayılır. Beslenmeyen akan hücre kurur.
+  Lava daha yavaş akar (LIQUID_CONSTANTS.*_FLOW_SPEED oranında daha seyrek
+  tick) ve daha kısa yayılır.
+- Etkileşimler: suya değen lava taşa döner, aynı hücreye su ve lava aynı
+  anda akarsa taş oluşur, lava komşu çimeni yakar (BLOCK_INTERACTIONS.AFFECTS).
+"""
+
+import time
+import zlib
+from dataclasses import dataclass
+from itertools import product
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from profiling import span
+from voxel_world import AIR, BLOCK_IDS, CHUNK_SIZE, WORLD_HEIGHT, ChunkKey, ChunkStore
+
+SECTION_SIZE = CHUNK_SIZE
+SECTIONS_PER_CHUNK = WORLD_HEIGHT // SECTION_SIZE
+# Yerçekimi dikeyde iki, akışkanlar yatayda bir hücre komşuluğa bakar
+HALO_Y = 2
+HALO_XZ = 1
+DEFAULT_SECTION_BUDGET = 512
+
+SOURCE_LEVEL = 8
+FALLING_LEVEL = 7
+
+# src/constants/world.js LIQUID_CONSTANTS ile aynı
+WATER_FLOW_SPEED = 0.5
+LAVA_FLOW_SPEED = 0.3
+
+WATER = BLOCK_IDS['water']
+LAVA = BLOCK_IDS['lava']
+STONE = BLOCK_IDS['stone']
+GRASS = BLOCK_IDS['grass']
+DIRT = BLOCK_IDS['dirt']
+# Dünyanın altı katı zemin sayılır, üstü hava
+BELOW_WORLD = STONE
+
+GRAVITY_BLOCKS = ('sand',)
+# akışkan -> (seviye azalması, kaç tick'te bir akar)
+FLUIDS = {
+    WATER: (1, 1),
+    LAVA: (2, max(1, round(WATER_FLOW_SPEED / LAVA_FLOW_SPEED))),
+}
+
+_GRAVITY_LUT = np.zeros(256, dtype=bool)
+_GRAVITY_LUT[[BLOCK_IDS[name] for name in GRAVITY_BLOCKS]] = True
+_FLUID_LUT = np.zeros(256, dtype=bool)
+_FLUID_LUT[list(FLUIDS)] = True
+
+SectionKey = Tuple[int, int, int]  # cx, sy, cz
+
+# Section sınırlarına değen değişikliğin uyandırdığı komşu ofsetleri
+_NEIGHBOR_OFFSETS = [offset for offset in product((-1, 0, 1), repeat=3) if offset != (0, 0, 0)]
+
+
+def section_of(x: int, y: int, z: int) -> SectionKey:
+    """Dünya koordinatının section anahtarı"""
+    return x // SECTION_SIZE, y // SECTION_SIZE, z // SECTION_SIZE
+
+
+def _order(key: SectionKey) -> Tuple[int, int, int]:
+    """Deterministik işlem sırası: alttan üste, sonra x, z"""
+    return key[1], key[0], key[2]
+
+
+@dataclass
+class TickStats:
+    """Tek tick'in özeti"""
+    tick: int
+    sections: int
+    carried: int
+    updates: int
+    seconds: float
+
+
+class BlockUpdateEngine:
+    """ChunkStore üzerinde aktif section kümesiyle çalışan blok güncelleme motoru"""
+
+    def __init__(self, store: ChunkStore, section_budget: int = DEFAULT_SECTION_BUDGET):
+        if section_budget <= 0:
+            raise ValueError("section_budget must be positive")
+        self.store = store
+        self.section_budget = section_budget
+        # Akışkan seviyeleri chunk ile aynı düzende; akışkan olmayan hücrelerde
+        # ve seviyesi olmayan (dışarıdan konmuş) akışkanlarda yok sayılır
+        self.levels: Dict[ChunkKey, np.ndarray] = {}
+        self.active: Set[SectionKey] = set()
+        self.carry: List[SectionKey] = []
+        self.tick_count = 0
+        self.total_updates = 0
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def schedule(self, key: SectionKey):
+        """Section'ı ve 26 komşusunu aktif kümeye ekle"""
+        cx, sy, cz = key
+        for dx, dy, dz in product((-1, 0, 1), repeat=3):
+            if 0 <= sy + dy < SECTIONS_PER_CHUNK:
+                self.active.add((cx + dx, sy + dy, cz + dz))
+
+    def schedule_block(self, x: int, y: int, z: int):
+        """Bir bloğun değişmesini bildir"""
+        if 0 <= y < WORLD_HEIGHT:
+            self.schedule(section_of(x, y, z))
+
+    def schedule_region(self, start: Tuple[int, int, int], end: Tuple[int, int, int]):
+        """[start, end) kutusuna değen section'ları ve komşularını aktif et"""
+        low = section_of(*start)
+        high = section_of(*(coord - 1 for coord in end))
+        for cx in range(low[0], high[0] + 1):
+            for sy in range(max(low[1], 0), min(high[1], SECTIONS_PER_CHUNK - 1) + 1):
+                for cz in range(low[2], high[2] + 1):
+                    self.schedule((cx, sy, cz))
+
+    def schedule_loaded(self) -> int:
+        """Akışkan ya da yerçekimli blok içeren tüm section'ları aktif et"""
+        before = len(self.active)
+        movable = _GRAVITY_LUT | _FLUID_LUT
+        for (cx, cz), chunk in self.store.chunks.items():
+            sections = movable[chunk].reshape(SECTIONS_PER_CHUNK, -1).any(axis=1)
+            for sy in np.flatnonzero(sections).tolist():
+                self.schedule((cx, sy, cz))
+        return len(self.active) - before
+
+    def set_block(self, x: int, y: int, z: int, block: int):
+        """Blok yaz ve çevresini güncellemeye al (akışkanlar kaynak olarak konur)"""
+        self.store.set_block(x, y, z, block)
+        levels = self.levels.get((x // CHUNK_SIZE, z // CHUNK_SIZE))
+        if levels is not None and 0 <= y < WORLD_HEIGHT:
+            levels[y, z % CHUNK_SIZE, x % CHUNK_SIZE] = SOURCE_LEVEL if _FLUID_LUT[block] else 0
+        self.schedule_block(x, y, z)
+
+    def level(self, x: int, y: int, z: int) -> int:
+        """Akışkan seviyesi (akışkan değilse 0)"""
+        if not _FLUID_LUT[self.store.get_block(x, y, z)]:
+            return 0
+        levels = self.levels.get((x // CHUNK_SIZE, z // CHUNK_SIZE))
+        level = 0 if levels is None else int(levels[y, z % CHUNK_SIZE, x % CHUNK_SIZE])
+        return level or SOURCE_LEVEL
+
+    @property
+    def pending(self) -> int:
+        return len(self.active)
+
+    # ------------------------------------------------------------------
+    # Tick
+    # ------------------------------------------------------------------
+
+    def tick(self) -> TickStats:
+        """Bütçe kadar aktif section'ı bir adım ilerlet"""
+        start = time.perf_counter()
+        self.tick_count += 1
+        carried = [key for key in self.carry if key in self.active]
+        queued = set(carried)
+        ordered = carried + sorted((key for key in self.active if key not in queued), key=_order)
+        selected, self.carry = ordered[:self.section_budget], ordered[self.section_budget:]
+        self.active.difference_update(selected)
+
+        updates = 0
+        if selected:
+            with span('blockupdates.gather'):
+                blocks, levels = self._gather(selected)
+            with span('blockupdates.step'):
+                new_blocks, new_levels, fallen, deferred = self._step(blocks, levels)
+            with span('blockupdates.apply'):
+                updates = self._apply(selected, blocks, levels, new_blocks, new_levels, fallen, deferred)
+        self.total_updates += updates
+        return TickStats(self.tick_count, len(selected), len(self.carry), updates, time.perf_counter() - start)
+
+    def run(self, max_ticks: int) -> List[TickStats]:
+        """Aktif küme boşalana ya da max_ticks dolana kadar tick at"""
+        stats = []
+        while self.active and len(stats) < max_ticks:
+            stats.append(self.tick())
+        return stats
+
+    def _gather(self, keys: List[SectionKey]) -> Tuple[np.ndarray, np.ndarray]:
+        """Section'ları halo ile (N, 16+2*HALO_Y, 16+2*HALO_XZ, 16+2*HALO_XZ) yığınlarına oku
+
+        Aynı chunk sütunundaki section'lar tek kutu okumasıyla alınır.
+        Akışkan seviyeleri normalize edilir: akışkan olmayan hücre 0,
+        seviyesiz akışkan kaynak.
+        """
+        height = SECTION_SIZE + 2 * HALO_Y
+        width = SECTION_SIZE + 2 * HALO_XZ
+        blocks = np.empty((len(keys), height, width, width), dtype=np.uint8)
+        levels = np.empty_like(blocks)
+
+        columns: Dict[ChunkKey, List[int]] = {}
+        for index, (cx, _, cz) in enumerate(keys):
+            columns.setdefault((cx, cz), []).append(index)
+        for (cx, cz), indices in columns.items():
+            sections = [keys[index][1] for index in indices]
+            y0 = min(sections) * SECTION_SIZE - HALO_Y
+            box_blocks, box_levels = self._read_box(cx, cz, y0, max(sections) * SECTION_SIZE + SECTION_SIZE + HALO_Y)
+            for index, sy in zip(indices, sections):
+                offset = sy * SECTION_SIZE - HALO_Y - y0
+                blocks[index] = box_blocks[offset:offset + height]
+                levels[index] = box_levels[offset:offset + height]
+
+        fluid = _FLUID_LUT[blocks]
+        levels[~fluid] = 0
+        levels[fluid & (levels == 0)] = SOURCE_LEVEL
+        return blocks, levels
+
+    def _read_box(self, cx: int, cz: int, y0: int, y1: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Chunk sütununu [y0, y1) aralığında yatay halo ile oku"""
+        width = SECTION_SIZE + 2 * HALO_XZ
+        blocks = np.zeros((y1 - y0, width, width), dtype=np.uint8)
+        levels = np.zeros_like(blocks)
+        blocks[:max(0, -y0)] = BELOW_WORLD
+        inner0, inner1 = max(y0, 0), min(y1, WORLD_HEIGHT)
+
+        for dx in (-1, 0, 1):
+            source_x = slice(CHUNK_SIZE - HALO_XZ, CHUNK_SIZE) if dx < 0 else slice(0, HALO_XZ) if dx > 0 else slice(None)
+            target_x = slice(0, HALO_XZ) if dx < 0 else slice(width - HALO_XZ, width) if dx > 0 else slice(HALO_XZ, width - HALO_XZ)
+            for dz in (-1, 0, 1):
+                chunk = self.store.chunks.get((cx + dx, cz + dz))
+                if chunk is None:
+                    continue
+                source_z = slice(CHUNK_SIZE - HALO_XZ, CHUNK_SIZE) if dz < 0 else slice(0, HALO_XZ) if dz > 0 else slice(None)
+                target_z = slice(0, HALO_XZ) if dz < 0 else slice(width - HALO_XZ, width) if dz > 0 else slice(HALO_XZ, width - HALO_XZ)
+                target_y = slice(inner0 - y0, inner1 - y0)
+                blocks[target_y, target_z, target_x] = chunk[inner0:inner1, source_z, source_x]
+                chunk_levels = self.levels.get((cx + dx, cz + dz))
+                if chunk_levels is not None:
+                    levels[target_y, target_z, target_x] = chunk_levels[inner0:inner1, source_z, source_x]
+        return blocks, levels
+
+    def _step(self, blocks: np.ndarray, levels: np.ndarray):
+        """Yığın üzerinde bir otomat adımı
+
+        Döndürür: yeni iç bloklar ve seviyeler (N, 16, 16, 16), alttaki
+        section'a düşen bloklar (N, 16, 16; hava = düşen yok) ve bu tick'te
+        sırası gelmediği için ertelenen akışkan değişikliği olan section maskesi.
+        """
+        # Yerçekimi: dikey komşuluk yeterli, halo içindeki kaynaklar da
+        # hesaplanır ki iç hücrelerin akışkan adımı aynı ara durumu görsün
+        gravity = _GRAVITY_LUT[blocks]
+        air = blocks == AIR
+        falling = gravity[:, 1:-1] & air[:, :-2]
+        receiving = air[:, 1:-1] & gravity[:, 2:]
+        moved = blocks[:, 1:-1].copy()
+        moved[falling] = AIR
+        moved[receiving] = blocks[:, 2:][receiving]
+        moved_levels = np.where(falling | receiving, 0, levels[:, 1:-1])
+        fallen = np.where(falling[:, HALO_Y - 1, 1:-1, 1:-1], blocks[:, HALO_Y, 1:-1, 1:-1], AIR)
+
+        # Akışkanlar: moved'un [1:-1] içi section iç bölgesidir
+        inner = (slice(None), slice(1, -1), slice(1, -1), slice(1, -1))
+        cell = moved[inner]
+        new_blocks = cell.copy()
+        new_levels = moved_levels[inner].copy()
+        # Üstteki section'dan düşen blok o section tarafından yazılır; bütçe
+        # yüzünden o işlenmezse blok çoğalmasın diye burada hava kalır
+        new_blocks[:, -1][receiving[:, -2, 1:-1, 1:-1]] = AIR
+        deferred = np.zeros(len(blocks), dtype=bool)
+        moved_air = moved == AIR
+        spread = {}
+        for fluid, (decay, interval) in FLUIDS.items():
+            strength = np.where(moved == fluid, moved_levels, 0)
+            result = np.where(strength[:, 2:, 1:-1, 1:-1] > 0, FALLING_LEVEL, 0).astype(np.uint8)
+            for dz, dx in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+                side = (slice(None), slice(1, -1), slice(1 + dz, moved.shape[2] - 1 + dz), slice(1 + dx, moved.shape[3] - 1 + dx))
+                below = (slice(None), slice(0, -2), side[2], side[3])
+                neighbor = strength[side]
+                under = strength[below]
+                # Akan akışkanın üstündeki akışkan yayılmaz, sadece düşer
+                supported = ~moved_air[below] & ((under == 0) | (under == SOURCE_LEVEL))
+                flows = (neighbor > decay) & supported
+                np.maximum(result, np.where(flows, neighbor - decay, 0).astype(np.uint8), out=result)
+
+            current = strength[inner]
+            open_cells = (cell == AIR) | ((cell == fluid) & (current < SOURCE_LEVEL))
+            changes = open_cells & (result != current)
+            if self.tick_count % interval:
+                deferred |= changes.reshape(len(blocks), -1).any(axis=1)
+                result = np.where(open_cells, current, 0)
+            spread[fluid] = np.where(open_cells, result, 0)
+
+            flowing = (cell == fluid) & (current < SOURCE_LEVEL)
+            new_levels[flowing] = result[flowing]
+            new_blocks[flowing & (result == 0)] = AIR
+
+        water, lava = spread[WATER], spread[LAVA]
+        empty = cell == AIR
+        new_blocks[empty & (water > 0)] = WATER
+        new_levels[empty & (water > 0)] = water[empty & (water > 0)]
+        new_blocks[empty & (lava > 0) & (water == 0)] = LAVA
+        new_levels[empty & (lava > 0) & (water == 0)] = lava[empty & (lava > 0) & (water == 0)]
+        collide = empty & (lava > 0) & (water > 0)
+        new_blocks[collide] = STONE
+        new_levels[collide] = 0
+
+        # Etkileşimler ara durumun 6 komşuluğuna bakar
+        touches_water = self._touches(moved == WATER)
+        touches_lava = self._touches(moved == LAVA)
+        quench = (cell == LAVA) & touches_water
+        new_blocks[quench] = STONE
+        new_levels[quench] = 0
+        new_blocks[(cell == GRASS) & touches_lava] = DIRT
+        return new_blocks, new_levels, fallen, deferred
+
+    @staticmethod
+    def _touches(mask: np.ndarray) -> np.ndarray:
+        """İç hücrelerden 6 komşusundan biri mask olanlar"""
+        return (mask[:, 2:, 1:-1, 1:-1] | mask[:, :-2, 1:-1, 1:-1]
+                | mask[:, 1:-1, 2:, 1:-1] | mask[:, 1:-1, :-2, 1:-1]
+                | mask[:, 1:-1, 1:-1, 2:] | mask[:, 1:-1, 1:-1, :-2])
+
+    def _apply(self, keys: List[SectionKey], blocks: np.ndarray, levels: np.ndarray,
+               new_blocks: np.ndarray, new_levels: np.ndarray, fallen: np.ndarray, deferred: np.ndarray) -> int:
+        """Değişen hücreleri yaz, değişiklik yapan section'ları ve komşularını uyandır"""
+        inner = (slice(None), slice(HALO_Y, -HALO_Y), slice(HALO_XZ, -HALO_XZ), slice(HALO_XZ, -HALO_XZ))
+        changed = (new_blocks != blocks[inner]) | (new_levels != levels[inner])
+        dropped = fallen != AIR
+
+        # Kenar bayrakları: [y-, y+, z-, z+, x-, x+]
+        edges = np.stack([
+            changed[:, 0].any(axis=(1, 2)) | dropped.any(axis=(1, 2)), changed[:, -1].any(axis=(1, 2)),
+            changed[:, :, 0].any(axis=(1, 2)), changed[:, :, -1].any(axis=(1, 2)),
+            changed[:, :, :, 0].any(axis=(1, 2)), changed[:, :, :, -1].any(axis=(1, 2)),
+        ], axis=1)
+        counts = changed.reshape(len(keys), -1).sum(axis=1) + dropped.reshape(len(keys), -1).sum(axis=1)
+
+        for index in np.flatnonzero(counts).tolist():
+            cx, sy, cz = keys[index]
+            chunk_key = (cx, cz)
+            y0 = sy * SECTION_SIZE
+            chunk = self.store.get_chunk(cx, cz, create=True)
+            np.copyto(chunk[y0:y0 + SECTION_SIZE], new_blocks[index], where=changed[index])
+            chunk_levels = self.levels.get(chunk_key)
+            if chunk_levels is None and new_levels[index].any():
+                chunk_levels = self.levels[chunk_key] = np.zeros_like(chunk)
+            if chunk_levels is not None:
+                chunk_levels[y0:y0 + SECTION_SIZE] = new_levels[index]
+            if dropped[index].any():
+                chunk[y0 - 1][dropped[index]] = fallen[index][dropped[index]]
+                if chunk_levels is not None:
+                    chunk_levels[y0 - 1][dropped[index]] = 0
+            self.store.dirty_chunks.add(chunk_key)
+
+            self.active.add(keys[index])
+            y_low, y_high, z_low, z_high, x_low, x_high = edges[index].tolist()
+            for dx, dy, dz in _NEIGHBOR_OFFSETS:
+                if ((dy < 0 and not y_low) or (dy > 0 and not y_high) or (dz < 0 and not z_low)
+                        or (dz > 0 and not z_high) or (dx < 0 and not x_low) or (dx > 0 and not x_high)):
+                    continue
+                if 0 <= sy + dy < SECTIONS_PER_CHUNK:
+                    self.active.add((cx + dx, sy + dy, cz + dz))
+
+        for index in np.flatnonzero(deferred).tolist():
+            self.active.add(keys[index])
+        return int(counts.sum())
+
+
+# ----------------------------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------------------------
+
+@dataclass
+class ScenarioResult:
+    """Senaryo koşusunun özeti"""
+    name: str
+    ticks: int
+    updates: int
+    seconds: float
+    max_tick_seconds: float
+    max_sections: int
+    settled: bool
+    checksum: int
+
+    @property
+    def updates_per_second(self) -> float:
+        return self.updates / self.seconds if self.seconds else 0.0
+
+    @property
+    def mean_tick_ms(self) -> float:
+        return self.seconds / self.ticks * 1000 if self.ticks else 0.0
+
+
+def world_checksum(store: ChunkStore, levels: Optional[Dict[ChunkKey, np.ndarray]] = None) -> int:
+    """Chunk'ların (ve varsa seviyelerin) sıralı adler32 özeti"""
+    checksum = 1
+    for key in sorted(store.chunks):
+        checksum = zlib.adler32(np.asarray(key, dtype=np.int32).tobytes(), checksum)
+        checksum = zlib.adler32(store.chunks[key].tobytes(), checksum)
+        if levels is not None and key in levels:
+            checksum = zlib.adler32(levels[key].tobytes(), checksum)
+    return checksum
+
+
+def dam_break_world(size: int = 96, reservoir: int = 12, depth: int = 6,
+                    platform_y: int = 120, floor_y: int = 40) -> Tuple[ChunkStore, Tuple[Tuple[int, int, int], Tuple[int, int, int]]]:
+    """Havada asılı bir platformun ucunda barajla tutulan su deposu
+
+    Platformun kısa kenarında korkuluk yoktur; baraj kalkınca su platforma
+    yayılır, kenardan aşağıdaki zemine dökülür. Döndürür: dünya ve
+    kaldırılacak baraj kutusu.
+    """
+    store = ChunkStore()
+    stone = BLOCK_IDS['stone']
+    floor = np.full((1, size, size), stone, dtype=np.uint8)
+    store.write_region((0, floor_y, 0), floor)
+
+    length = reservoir + 5
+    platform = np.zeros((depth + 2, size, length), dtype=np.uint8)
+    platform[0] = stone
+    platform[1:, [0, -1], :] = stone  # yan duvarlar
+    platform[1:, :, 0] = stone  # arka duvar
+    platform[1:, 1:-1, 1:reservoir] = WATER
+    platform[1:, 1:-1, reservoir] = stone  # baraj
+    store.write_region((0, platform_y, 0), platform)
+    dam = ((reservoir, platform_y + 1, 1), (reservoir + 1, platform_y + depth + 2, size - 1))
+    return store, dam
+
+
+def avalanche_world(size: int = 64, height: int = 24, slab_y: int = 100,
+                    floor_y: int = 20) -> Tuple[ChunkStore, Tuple[Tuple[int, int, int], Tuple[int, int, int]]]:
+    """Taş bir tabla üstünde kum yığını; tabla kalkınca kum zemine çöker
+
+    Döndürür: dünya ve kaldırılacak tabla kutusu.
+    """
+    store = ChunkStore()
+    store.write_region((0, floor_y, 0), np.full((1, size, size), STONE, dtype=np.uint8))
+    heights = height - (np.abs(np.arange(size) - size / 2)[:, None] + np.abs(np.arange(size) - size / 2)[None, :]) * height / size
+    ys = np.arange(height)[:, None, None]
+    pile = np.where(ys < heights[None], BLOCK_IDS['sand'], AIR).astype(np.uint8)
+    store.write_region((0, slab_y + 1, 0), pile)
+    store.write_region((0, slab_y, 0), np.full((1, size, size), STONE, dtype=np.uint8))
+    slab = ((0, slab_y, 0), (size, slab_y + 1, size))
+    return store, slab
+
+
+def run_scenario(name: str, store: ChunkStore, removed: Tuple[Tuple[int, int, int], Tuple[int, int, int]],
+                 section_budget: int = DEFAULT_SECTION_BUDGET, max_ticks: int = 400) -> Tuple[ScenarioResult, BlockUpdateEngine]:
+    """Kutuyu havaya çevir, otomatı durulana kadar çalıştır"""
+    engine = BlockUpdateEngine(store, section_budget)
+    (x0, y0, z0), (x1, y1, z1) = removed
+    store.write_region((x0, y0, z0), np.zeros((y1 - y0, z1 - z0, x1 - x0), dtype=np.uint8), skip_air=False)
+    engine.schedule_region(removed[0], removed[1])
+
+    stats = engine.run(max_ticks)
+    seconds = sum(tick.seconds for tick in stats)
+    result = ScenarioResult(
+        name=name,
+        ticks=len(stats),
+        updates=sum(tick.updates for tick in stats),
+        seconds=seconds,
+        max_tick_seconds=max((tick.seconds for tick in stats), default=0.0),
+        max_sections=max((tick.sections for tick in stats), default=0),
+        settled=not engine.active,
+        checksum=world_checksum(store, engine.levels),
+    )
+    return result, engine
+
+
+def full_scan_tick_seconds(store: ChunkStore, levels: Dict[ChunkKey, np.ndarray]) -> float:
+    """Yüklü chunk'ların tüm section'larını her tick işleyen saf tarama maliyeti"""
+    copy = ChunkStore()
+    copy.chunks = {key: chunk.copy() for key, chunk in store.chunks.items()}
+    engine = BlockUpdateEngine(copy, section_budget=len(copy.chunks) * SECTIONS_PER_CHUNK)
+    engine.levels = {key: value.copy() for key, value in levels.items()}
+    engine.active = {(cx, sy, cz) for cx, cz in copy.chunks for sy in range(SECTIONS_PER_CHUNK)}
+    return engine.tick().seconds
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Batched Inventory Engine
+@author MiniMax Agent
+
+InventorySystem.addItem/removeItem her çağrıda slot nesnelerini doğrusal
+tarar ve slot başına UI günceller. Sunucu tarafında her tick binlerce
+toplama, üretim ve blok yerleştirme uygulanır; bu modül tüm oyuncuların
+slotlarını struct-of-arrays (types[oyuncu, slot], counts[oyuncu, slot])
+olarak tutar:
+
+- totals[oyuncu, eşya] indeksi getItemCount'u O(1) yapar.
+- Toplu add/remove/transfer işlemleri oyuncu başına sıralı semantiği korur:
+  aynı oyuncuya ait işlemler ardışık turlara bölünür, her tur tüm oyuncular
+  için vektörel işlenir.
+- Yığın kuralları JS maxStackSize mantığıyla aynıdır: önce mevcut yığınlar
+  sırayla doldurulur, kalan boş slotlara sırayla yerleştirilir; yer yoksa
+  sığan kısım eklenir ve işlem başarısız sayılır. Çıkarma slotları sırayla
+  boşaltır.
+- Her toplu işlem sadece değişen slotların son hâlini (delta) döndürür.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from profiling import span
+from voxel_world import AIR, BLOCK_TYPES
+
+# src/systems/inventorySystem.js maxStackSize ile aynı
+MAX_STACK_SIZE = 64
+DEFAULT_SLOTS = 36
+
+
+@dataclass
+class SlotDeltas:
+    """Toplu işlemde değişen slotların son hâli"""
+    players: np.ndarray
+    slots: np.ndarray
+    types: np.ndarray
+    counts: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.players.size)
+
+
+@dataclass
+class BulkResult:
+    """İşlem başına uygulanan miktar, başarı durumu ve slot deltaları"""
+    applied: np.ndarray
+    success: np.ndarray
+    deltas: SlotDeltas
+
+
+def _exclusive_cumsum(values: np.ndarray) -> np.ndarray:
+    """Satır boyunca kendisinden önceki slotların toplamı
+
+    axis=1 cumsum kısa satırlarda yavaştır; düz dizide tek cumsum alınıp
+    her satırın başlangıç toplamı çıkarılır.
+    """
+    running = np.cumsum(values.ravel(), dtype=np.int32).reshape(values.shape)
+    row_start = running[:, -1:] - values.sum(axis=1, keepdims=True, dtype=np.int32)
+    return running - values - row_start
+
+
+def _operation_rounds(keys: np.ndarray) -> List[np.ndarray]:
+    """İşlemleri aynı oyuncuyu bir kez içeren turlara böl (oyuncu içi sıra korunur)"""
+    if keys.size == 0:
+        return []
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    position = np.arange(keys.size)
+    group_start = np.maximum.accumulate(np.where(np.diff(sorted_keys, prepend=sorted_keys[0] - 1) != 0, position, 0))
+    rank = np.empty(keys.size, dtype=np.int64)
+    rank[order] = position - group_start
+
+    by_round = np.argsort(rank, kind='stable')
+    bounds = np.flatnonzero(np.diff(rank[by_round])) + 1
+    return np.split(by_round, bounds)
+
+
+class InventoryEngine:
+    """Tüm oyuncuların envanteri için struct-of-arrays depo"""
+
+    def __init__(self, players: int, slots: int = DEFAULT_SLOTS, item_types: int = len(BLOCK_TYPES),
+                 max_stack_size: int = MAX_STACK_SIZE):
+        self.players = players
+        self.slots = slots
+        self.item_types = item_types
+        self.max_stack_size = max_stack_size
+        self.types = np.zeros((players, slots), dtype=np.uint8 if item_types <= 256 else np.uint16)
+        self.counts = np.zeros((players, slots), dtype=np.uint16)
+        self.totals = np.zeros((players, item_types), dtype=np.int32)
+        self._changed: List[np.ndarray] = []
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+
+    def get_item_count(self, player: int, item: int) -> int:
+        """InventorySystem.getItemCount karşılığı, O(1)"""
+        return int(self.totals[player, item])
+
+    def item_counts(self, players, items) -> np.ndarray:
+        """Toplu getItemCount"""
+        return self.totals[np.asarray(players), np.asarray(items)]
+
+    def slot_contents(self, player: int) -> List[Optional[Tuple[int, int]]]:
+        """Oyuncunun slotları JS slots dizisi gibi: (tip, adet) ya da None"""
+        return [(int(item), int(count)) if count else None
+                for item, count in zip(self.types[player].tolist(), self.counts[player].tolist())]
+
+    # ------------------------------------------------------------------
+    # Toplu işlemler
+    # ------------------------------------------------------------------
+
+    def _validate(self, players, items, counts) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        players, items, counts = (array.ravel() for array in np.broadcast_arrays(
+            np.asarray(players, dtype=np.int64), np.asarray(items, dtype=np.int64),
+            np.asarray(counts, dtype=np.int64)))
+        if players.size and (players.min() < 0 or players.max() >= self.players):
+            raise ValueError(f"Player index out of range (0..{self.players - 1})")
+        if items.size and (items.min() <= AIR or items.max() >= self.item_types):
+            raise ValueError(f"Item type out of range (1..{self.item_types - 1})")
+        if counts.size and counts.min() < 0:
+            raise ValueError("Item counts must be non-negative")
+        return players, items, counts
+
+    def _record_changes(self, players: np.ndarray, changed: np.ndarray):
+        """Değişen slotları delta listesine ekle"""
+        rows, slots = np.nonzero(changed)
+        if rows.size:
+            self._changed.append(players[rows] * self.slots + slots)
+
+    def _add_round(self, players: np.ndarray, items: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+        """Farklı oyunculara ait eklemeler; eklenen miktarı döndürür"""
+        cap = self.max_stack_size
+        # Slotlara sığabilecekten fazlası hiçbir zaman eklenemez; int32 taşmasını önler
+        amounts = np.minimum(amounts, self.slots * cap).astype(np.int32)
+        left = amounts.copy()
+
+        # 1. geçiş: aynı tipteki yığınlar slot sırasıyla doldurulur. Bu tipten
+        # hiç eşyası olmayan oyuncular totals indeksiyle atlanır; boş slotun
+        # tipi her zaman AIR olduğundan tip eşleşmesi dolu slot demektir.
+        stacked = np.flatnonzero(self.totals[players, items] > 0)
+        if stacked.size:
+            rows = players[stacked]
+            counts = self.counts[rows].astype(np.int32)
+            room = np.where(self.types[rows] == items[stacked, None], cap - counts, 0)
+            fill = np.minimum(np.maximum(left[stacked, None] - _exclusive_cumsum(room), 0), room)
+            self.counts[rows] = counts + fill
+            self._record_changes(rows, fill > 0)
+            left[stacked] -= fill.sum(axis=1, dtype=np.int32)
+
+        # 2. geçiş: kalan, boş slotlara sırayla en fazla cap kadar
+        pending = np.flatnonzero(left > 0)
+        if pending.size:
+            rows = players[pending]
+            counts = self.counts[rows].astype(np.int32)
+            empty = counts == 0
+            fresh = np.minimum(np.maximum(left[pending, None] - _exclusive_cumsum(empty) * cap, 0), cap)
+            fresh *= empty
+            placed = fresh > 0
+            self.counts[rows] = counts + fresh
+            self.types[rows] = np.where(placed, items[pending, None], self.types[rows])
+            self._record_changes(rows, placed)
+            left[pending] -= fresh.sum(axis=1, dtype=np.int32)
+
+        applied = amounts - left
+        self.totals[players, items] += applied
+        return applied
+
+    def _remove_round(self, players: np.ndarray, items: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+        """Farklı oyunculara ait çıkarmalar; çıkarılan miktarı döndürür"""
+        removed = np.zeros(players.size, dtype=np.int32)
+        active = np.flatnonzero((self.totals[players, items] > 0) & (amounts > 0))
+        if active.size == 0:
+            return removed
+
+        rows = players[active]
+        types, counts = self.types[rows], self.counts[rows].astype(np.int32)
+        have = np.where(types == items[active, None], counts, 0)
+        amount = np.minimum(amounts[active], self.slots * self.max_stack_size)[:, None].astype(np.int32)
+        take = np.minimum(np.maximum(amount - _exclusive_cumsum(have), 0), have)
+
+        counts -= take
+        self.counts[rows] = counts
+        self.types[rows] = np.where(counts == 0, AIR, types)
+        self._record_changes(rows, take > 0)
+        removed[active] = take.sum(axis=1, dtype=np.int32)
+        self.totals[players, items] -= removed
+        return removed
+
+    def _capacity(self, players: np.ndarray, items: np.ndarray) -> np.ndarray:
+        """Oyuncuların verilen tipten alabileceği en fazla adet"""
+        counts = self.counts[players].astype(np.int32)
+        room = np.where(self.types[players] == items[:, None], self.max_stack_size - counts, 0).sum(axis=1)
+        return room + np.count_nonzero(counts == 0, axis=1) * self.max_stack_size
+
+    def _take_deltas(self) -> SlotDeltas:
+        """Biriken değişiklikleri slot başına son hâle indir"""
+        if self._changed:
+            flat = np.unique(np.concatenate(self._changed))
+        else:
+            flat = np.empty(0, dtype=np.int64)
+        self._changed = []
+        players, slots = np.divmod(flat, self.slots)
+        return SlotDeltas(players, slots, self.types[players, slots], self.counts[players, slots])
+
+    def add_items(self, players, items, counts) -> BulkResult:
+        """Toplu addItem: her işlem sırayla, oyuncu başına JS semantiğiyle uygulanır"""
+        players, items, counts = self._validate(players, items, counts)
+        applied = np.zeros(players.size, dtype=np.int64)
+        with span('inventory.add'):
+            for ops in _operation_rounds(players):
+                applied[ops] = self._add_round(players[ops], items[ops], counts[ops])
+        return BulkResult(applied, applied >= counts, self._take_deltas())
+
+    def remove_items(self, players, items, counts, require_all: bool = False) -> BulkResult:
+        """Toplu removeItem
+
+        JS removeItem yetersiz stokta eldekini çıkarıp false döner; üretim ve
+        yerleştirme için require_all=True ile yetersiz işlemler hiç uygulanmaz.
+        """
+        players, items, counts = self._validate(players, items, counts)
+        applied = np.zeros(players.size, dtype=np.int64)
+        with span('inventory.remove'):
+            for ops in _operation_rounds(players):
+                amounts = counts[ops]
+                if require_all:
+                    amounts = np.where(self.totals[players[ops], items[ops]] >= amounts, amounts, 0)
+                applied[ops] = self._remove_round(players[ops], items[ops], amounts)
+        return BulkResult(applied, applied >= counts, self._take_deltas())
+
+    def transfer_items(self, sources, targets, items, counts) -> BulkResult:
+        """Oyuncudan oyuncuya aktarım: kaynaktaki ve hedefte sığan kadar taşınır"""
+        sources, items, counts = self._validate(sources, items, counts)
+        targets = np.broadcast_to(np.asarray(targets, dtype=np.int64), sources.shape).ravel()
+        if targets.size and (targets.min() < 0 or targets.max() >= self.players):
+            raise ValueError(f"Player index out of range (0..{self.players - 1})")
+
+        # Kaynak ve hedef aynı turda başka işlemde yer almamalı
+        rounds = np.empty(sources.size, dtype=np.int64)
+        next_round: Dict[int, int] = {}
+        for index, (source, target) in enumerate(zip(sources.tolist(), targets.tolist())):
+            current = max(next_round.get(source, 0), next_round.get(target, 0))
+            rounds[index] = current
+            next_round[source] = next_round[target] = current + 1
+
+        applied = np.zeros(sources.size, dtype=np.int64)
+        with span('inventory.transfer'):
+            by_round = np.argsort(rounds, kind='stable')
+            for ops in np.split(by_round, np.flatnonzero(np.diff(rounds[by_round])) + 1):
+                ops = ops[sources[ops] != targets[ops]]
+                if ops.size == 0:
+                    continue
+                source, target, item = sources[ops], targets[ops], items[ops]
+                moved = np.minimum(np.minimum(counts[ops], self.totals[source, item]), self._capacity(target, item))
+                self._remove_round(source, item, moved)
+                applied[ops] = self._add_round(target, item, moved)
+        return BulkResult(applied, applied >= counts, self._take_deltas())
+
+    def add_item(self, player: int, item: int, count: int = 1) -> bool:
+        """InventorySystem.addItem karşılığı"""
+        return bool(self.add_items([player], [item], [count]).success[0])
+
+    def remove_item(self, player: int, item: int, count: int = 1) -> bool:
+        """InventorySystem.removeItem karşılığı"""
+        return bool(self.remove_items([player], [item], [count]).success[0])
+
+
+class ReferenceInventory:
+    """InventorySystem.addItem/removeItem'in satır satır Python karşılığı (karşılaştırma tabanı)"""
+
+    def __init__(self, slots: int = DEFAULT_SLOTS, max_stack_size: int = MAX_STACK_SIZE):
+        self.slots: List[Optional[Dict[str, int]]] = [None] * slots
+        self.max_stack_size = max_stack_size
+
+    def add_item(self, block_type: int, count: int = 1) -> bool:
+        for slot in self.slots:
+            if slot and slot['type'] == block_type:
+                can_add = min(count, self.max_stack_size - slot['count'])
+                slot['count'] += can_add
+                count -= can_add
+                if count <= 0:
+                    return True
+
+        for i in range(len(self.slots)):
+            if count <= 0:
+                break
+            if not self.slots[i]:
+                can_add = min(count, self.max_stack_size)
+                self.slots[i] = {'type': block_type, 'count': can_add}
+                count -= can_add
+        return count <= 0
+
+    def remove_item(self, block_type: int, count: int = 1) -> bool:
+        for i, slot in enumerate(self.slots):
+            if count <= 0:
+                break
+            if slot and slot['type'] == block_type:
+                remove_count = min(count, slot['count'])
+                slot['count'] -= remove_count
+                count -= remove_count
+                if slot['count'] <= 0:
+                    self.slots[i] = None
+        return count <= 0
+
+    def get_item_count(self, block_type: int) -> int:
+        return sum(slot['count'] for slot in self.slots if slot and slot['type'] == block_type)
+
+    def capacity(self, block_type: int) -> int:
+        return sum(self.max_stack_size - slot['count'] if slot['type'] == block_type else 0
+                   for slot in self.slots if slot) + self.slots.count(None) * self.max_stack_size
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Floating Island Volume Generator
+@author MiniMax Agent
+
+components/island-generator.js'deki tek mesh'lik adaların yerine, seed'den
+üretilen adaları doğrudan chunk deposuna voxel olarak yazar:
+
+- Ada merkezleri Poisson-disc (Bridson) örnekleme ile yerleştirilir.
+- Ada şekli signed-distance field + value-noise fBm ile tanımlanır; aynı
+  yarıçap sınıfındaki tüm adalar tek bir [ada, y, z, x] dizisinde vektörel
+  hesaplanır.
+- Biome'a özgü dekorasyonlar (ağaç, kaktüs, kaya, mercan) JS'teki
+  createSmallTree/createCactus/createRockCluster/createCoralReef şablonlarıyla
+  aynı blokları kullanarak toplu basılır.
+"""
+
+import sys
+import time
+import zlib
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from profiling import span
+from voxel_world import AIR, BLOCK_IDS, ChunkStore
+
+logger = logging.getLogger(__name__)
+
+# defaultWorld.json generation.terrain ayarları
+NOISE_OCTAVES = 4
+NOISE_PERSISTENCE = 0.5
+NOISE_LACUNARITY = 2.0
+BIOME_SIZE = 128
+
+MIN_RADIUS = 4.0
+MAX_RADIUS = 12.0
+MIN_ISLAND_Y = 48
+MAX_ISLAND_Y = 112
+ISLAND_SPACING = 2 * MAX_RADIUS + 6
+DEPTH_FACTOR = 0.9
+EDGE_NOISE = 0.25
+SURFACE_NOISE = 3.0
+VOLUME_NOISE = 1.5
+SUBSURFACE_DEPTH = 3
+ORE_CHANCE = {'iron': 0.03, 'diamond': 0.005}
+MAX_BATCH_VOXELS = 4_000_000
+
+# JS island-generator.js ile aynı biome isimleri; yüzey blokları ve dekorasyon
+BIOMES: Dict[str, dict] = {
+    'forest':   {'surface': 'grass', 'subsurface': 'dirt', 'dome': 0.30, 'feature': 'tree', 'density': 0.040},
+    'mountain': {'surface': 'stone', 'subsurface': 'stone', 'dome': 0.90, 'feature': 'rock', 'density': 0.020},
+    'grass':    {'surface': 'grass', 'subsurface': 'dirt', 'dome': 0.20, 'feature': 'tree', 'density': 0.008},
+    'desert':   {'surface': 'sand', 'subsurface': 'sand', 'dome': 0.15, 'feature': 'cactus', 'density': 0.012},
+    'meadow':   {'surface': 'grass', 'subsurface': 'dirt', 'dome': 0.25, 'feature': 'tree', 'density': 0.004},
+    'ocean':    {'surface': 'sand', 'subsurface': 'dirt', 'dome': 0.10, 'feature': 'coral', 'density': 0.030},
+}
+BIOME_NAMES = tuple(BIOMES)
+
+# Dekorasyon şablonları: (dy, dz, dx, blok). JS'teki gibi yaprak yerine çimen,
+# kaktüs yerine ahşap, mercan yerine elmas/demir kullanılır.
+FEATURE_TEMPLATES: Dict[str, List[Tuple[int, int, int, str]]] = {
+    'tree': [(0, 0, 0, 'wood'), (1, 0, 0, 'wood'), (2, 0, -1, 'grass'), (2, 0, 1, 'grass'),
+             (2, -1, 0, 'grass'), (2, 1, 0, 'grass'), (3, 0, 0, 'grass')],
+    'cactus': [(0, 0, 0, 'wood'), (1, 0, 0, 'wood'), (2, 0, 0, 'wood')],
+    'rock': [(0, 0, 0, 'stone'), (0, 0, 1, 'stone'), (0, 1, 0, 'stone'), (0, 0, -1, 'stone'), (0, -1, 0, 'stone')],
+    'coral': [(0, 0, 0, 'diamond')],
+}
+CORAL_BLOCKS = ('diamond', 'iron')
+ROCK_FILL = 0.7  # createRockCluster: her pozisyon %70 ihtimalle
+
+
+@dataclass
+class IslandSpec:
+    """Tek bir adanın parametreleri"""
+    x: int
+    y: int
+    z: int
+    radius: float
+    biome: str
+
+
+@dataclass
+class IslandGenerationStats:
+    """Üretim sonuç veri yapısı"""
+    islands: int = 0
+    voxels: int = 0
+    features: int = 0
+    duration: float = 0.0
+    specs: List[IslandSpec] = field(default_factory=list)
+
+    @property
+    def islands_per_second(self) -> float:
+        return self.islands / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def voxels_per_second(self) -> float:
+        return self.voxels / self.duration if self.duration > 0 else 0.0
+
+
+def seed_to_int(seed) -> int:
+    """'skyworld_default' gibi string seed'leri 32-bit tamsayıya çevir"""
+    if isinstance(seed, (int, np.integer)):
+        return int(seed) & 0xFFFFFFFF
+    return zlib.crc32(str(seed).encode('utf-8'))
+
+
+# ----------------------------------------------------------------------
+# Vektörel value noise
+# ----------------------------------------------------------------------
+
+_HASH_PRIMES = (np.uint64(0x9E3779B185EBCA87), np.uint64(0xC2B2AE3D27D4EB4F), np.uint64(0x165667B19E3779F9))
+
+
+def lattice_hash(seed: int, *coords: np.ndarray) -> np.ndarray:
+    """Tamsayı koordinatlar için [0, 1) aralığında deterministik hash"""
+    h = np.uint64(seed * 0x27D4EB2F165667C5 & 0xFFFFFFFFFFFFFFFF)
+    for prime, coord in zip(_HASH_PRIMES, coords):
+        h = h ^ (np.asarray(coord, dtype=np.int64).astype(np.uint64) * prime)
+    h = h ^ (h >> np.uint64(33))
+    h = h * np.uint64(0xFF51AFD7ED558CCD)
+    h = h ^ (h >> np.uint64(33))
+    return (h >> np.uint64(40)).astype(np.float32) * np.float32(1.0 / (1 << 24))
+
+
+def value_noise(seed: int, *coords: np.ndarray) -> np.ndarray:
+    """2B/3B value noise, [-1, 1] aralığında (smoothstep interpolasyon)"""
+    floors = [np.floor(c) for c in coords]
+    cells = [f.astype(np.int64) for f in floors]
+    fracs = [(c - f).astype(np.float32) for c, f in zip(coords, floors)]
+    weights = [t * t * (3 - 2 * t) for t in fracs]
+
+    result = 0.0
+    for corner in range(1 << len(coords)):
+        weight = 1.0
+        corner_cells = []
+        for axis, (cell, w) in enumerate(zip(cells, weights)):
+            if corner >> axis & 1:
+                weight = weight * w
+                corner_cells.append(cell + 1)
+            else:
+                weight = weight * (1 - w)
+                corner_cells.append(cell)
+        result = result + weight * lattice_hash(seed, *corner_cells)
+    return result * 2 - 1
+
+
+def fbm(seed: int, *coords: np.ndarray, octaves: int = NOISE_OCTAVES,
+        persistence: float = NOISE_PERSISTENCE, lacunarity: float = NOISE_LACUNARITY) -> np.ndarray:
+    """Fractal Brownian motion; çıktı yaklaşık [-1, 1]"""
+    total = 0.0
+    amplitude = 1.0
+    frequency = 1.0
+    norm = 0.0
+    for octave in range(octaves):
+        total = total + amplitude * value_noise(seed + octave * 1013, *(c * frequency for c in coords))
+        norm += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+    return total / norm
+
+
+# ----------------------------------------------------------------------
+# Yerleşim
+# ----------------------------------------------------------------------
+
+def poisson_disc(rng: np.random.Generator, width: float, depth: float, spacing: float,
+                 attempts: int = 30) -> np.ndarray:
+    """Bridson Poisson-disc örnekleme; (n, 2) [x, z] noktaları döndürür"""
+    cell = spacing / np.sqrt(2)
+    grid_w = int(np.ceil(width / cell))
+    grid_d = int(np.ceil(depth / cell))
+    grid = np.full((grid_d, grid_w), -1, dtype=np.int64)
+
+    points = [rng.uniform((0, 0), (width, depth))]
+    grid[int(points[0][1] / cell), int(points[0][0] / cell)] = 0
+    active = [0]
+
+    while active:
+        index = active[rng.integers(len(active))]
+        angles = rng.uniform(0, 2 * np.pi, attempts)
+        radii = rng.uniform(spacing, 2 * spacing, attempts)
+        candidates = points[index] + np.stack((np.cos(angles) * radii, np.sin(angles) * radii), axis=1)
+        inside = (candidates[:, 0] >= 0) & (candidates[:, 0] < width) & (candidates[:, 1] >= 0) & (candidates[:, 1] < depth)
+
+        placed = False
+        for candidate in candidates[inside]:
+            gx, gz = int(candidate[0] / cell), int(candidate[1] / cell)
+            neighbours = grid[max(gz - 2, 0):gz + 3, max(gx - 2, 0):gx + 3]
+            neighbours = neighbours[neighbours >= 0]
+            if neighbours.size:
+                existing = np.asarray([points[i] for i in neighbours])
+                if (np.sum((existing - candidate) ** 2, axis=1) < spacing * spacing).any():
+                    continue
+            grid[gz, gx] = len(points)
+            active.append(len(points))
+            points.append(candidate)
+            placed = True
+            break
+
+        if not placed:
+            active.remove(index)
+
+    return np.asarray(points)
+
+
+# ----------------------------------------------------------------------
+# Üretici
+# ----------------------------------------------------------------------
+
+class IslandGenerator:
+    """Seed'den uçan ada voxel'leri üreten vektörel üretici"""
+
+    def __init__(self, seed='skyworld_default', store: ChunkStore = None,
+                 max_batch_voxels: int = MAX_BATCH_VOXELS):
+        self.seed = seed_to_int(seed)
+        self.store = store if store is not None else ChunkStore()
+        self.max_batch_voxels = max_batch_voxels
+
+    def place_islands(self, x0: int, z0: int, width: int, depth: int) -> List[IslandSpec]:
+        """Bölge için ada merkezlerini, yarıçapları ve biome'ları seç"""
+        rng = np.random.default_rng([self.seed, x0 & 0xFFFFFFFF, z0 & 0xFFFFFFFF])
+        points = poisson_disc(rng, width, depth, ISLAND_SPACING)
+        xs = np.floor(points[:, 0]).astype(np.int64) + x0
+        zs = np.floor(points[:, 1]).astype(np.int64) + z0
+        radii = rng.uniform(MIN_RADIUS, MAX_RADIUS, len(points))
+        ys = rng.integers(MIN_ISLAND_Y, MAX_ISLAND_Y + 1, len(points))
+
+        # Komşu adalar benzer biome'da olsun diye düşük frekanslı noise
+        biome_noise = fbm(self.seed ^ 0xB10E, xs / BIOME_SIZE, zs / BIOME_SIZE, octaves=2)
+        biome_index = np.clip(((biome_noise + 1) / 2 * len(BIOME_NAMES)).astype(int), 0, len(BIOME_NAMES) - 1)
+
+        return [IslandSpec(int(x), int(y), int(z), float(r), BIOME_NAMES[b])
+                for x, y, z, r, b in zip(xs, ys, zs, radii, biome_index)]
+
+    def generate_region(self, x0: int, z0: int, width: int, depth: int) -> IslandGenerationStats:
+        """Bölgedeki tüm adaları üretip chunk deposuna yaz"""
+        start_time = time.perf_counter()
+        stats = IslandGenerationStats()
+        with span('worldgen.islands.place'):
+            specs = self.place_islands(x0, z0, width, depth)
+        self.generate_islands(specs, stats)
+        stats.duration = time.perf_counter() - start_time
+        logger.info(f"🏝️ Generated {stats.islands} islands ({stats.voxels} voxels) in {stats.duration:.2f}s")
+        return stats
+
+    def generate_islands(self, specs: List[IslandSpec], stats: IslandGenerationStats = None) -> IslandGenerationStats:
+        """Ada listesini yarıçap sınıfına göre gruplayıp toplu voxel'le"""
+        stats = stats if stats is not None else IslandGenerationStats()
+        buckets: Dict[int, List[IslandSpec]] = {}
+        for spec in specs:
+            buckets.setdefault(int(np.ceil(spec.radius)), []).append(spec)
+
+        for bucket_radius, bucket in sorted(buckets.items()):
+            shape = self.grid_shape(bucket_radius)
+            per_batch = max(1, self.max_batch_voxels // int(np.prod(shape)))
+            for start in range(0, len(bucket), per_batch):
+                self.voxelize_batch(bucket[start:start + per_batch], bucket_radius, stats)
+
+        stats.islands += len(specs)
+        stats.specs.extend(specs)
+        return stats
+
+    @staticmethod
+    def grid_shape(radius: int) -> Tuple[int, int, int]:
+        """Bir yarıçap sınıfı için yerel [y, z, x] grid boyutu"""
+        half = int(np.ceil(radius * (1 + EDGE_NOISE))) + int(np.ceil(VOLUME_NOISE)) + 1
+        below = int(np.ceil(radius * DEPTH_FACTOR)) + 2
+        above = int(np.ceil(radius * max(b['dome'] for b in BIOMES.values()) + SURFACE_NOISE)) + 2
+        return below + above + 1, 2 * half + 1, 2 * half + 1
+
+    def voxelize_batch(self, specs: List[IslandSpec], radius: int, stats: IslandGenerationStats):
+        """Aynı yarıçap sınıfındaki adaları tek [ada, y, z, x] dizisinde üret"""
+        height, size, _ = self.grid_shape(radius)
+        half = size // 2
+        below = int(np.ceil(radius * DEPTH_FACTOR)) + 2
+
+        centers = np.asarray([(s.x, s.y, s.z) for s in specs], dtype=np.int64)
+        radii = np.asarray([s.radius for s in specs], dtype=np.float32)[:, None, None, None]
+        biome_params = [BIOMES[s.biome] for s in specs]
+        domes = np.asarray([b['dome'] for b in biome_params], dtype=np.float32)[:, None, None, None]
+
+        local_y = np.arange(-below, height - below, dtype=np.int64)[None, :, None, None]
+        local_h = np.arange(-half, half + 1, dtype=np.int64)
+        local_z = local_h[None, None, :, None]
+        local_x = local_h[None, None, None, :]
+        world_x = centers[:, 0, None, None, None] + local_x
+        world_y = centers[:, 1, None, None, None] + local_y
+        world_z = centers[:, 2, None, None, None] + local_z
+
+        with span('worldgen.islands.sdf'):
+            # Kolon alanları (ada, 1, z, x)
+            distance = np.sqrt((local_x ** 2 + local_z ** 2).astype(np.float32))
+            edge = fbm(self.seed, world_x * 0.08, world_z * 0.08, octaves=2)
+            effective_radius = radii * (1 + EDGE_NOISE * edge)
+            falloff = np.clip(1 - distance / effective_radius, 0, 1)
+            top = domes * radii * (1 - (1 - falloff) ** 2) \
+                + SURFACE_NOISE * fbm(self.seed + 7, world_x * 0.05, world_z * 0.05, octaves=3)
+            bottom = -DEPTH_FACTOR * radii * falloff ** 1.5
+
+            # SDF: kolon silindiri ∩ üst yüzey ∩ alt koni, 3B noise ile bozulmuş.
+            # Noise sadece işaret değiştirebileceği yüzey bandında hesaplanır.
+            sdf = np.maximum(np.maximum(distance - effective_radius, local_y - top), bottom - local_y)
+            solid = sdf <= -VOLUME_NOISE
+            band = (sdf <= VOLUME_NOISE) & ~solid
+            shape = sdf.shape
+            noise = fbm(self.seed + 13,
+                        np.broadcast_to(world_x, shape)[band] * 0.12,
+                        np.broadcast_to(world_y, shape)[band] * 0.12,
+                        np.broadcast_to(world_z, shape)[band] * 0.12, octaves=2)
+            solid[band] = sdf[band] + VOLUME_NOISE * noise <= 0
+
+        with span('worldgen.islands.materials'):
+            blocks = self.assign_materials(solid, biome_params, world_x, world_y, world_z)
+
+        with span('worldgen.islands.write'):
+            island, yi, zi, xi = np.nonzero(solid)
+            stats.voxels += self.store.write_voxels(
+                centers[island, 0] + xi - half,
+                centers[island, 1] + yi - below,
+                centers[island, 2] + zi - half,
+                blocks[island, yi, zi, xi]
+            )
+
+        with span('worldgen.islands.features'):
+            stats.features += self.stamp_features(solid, blocks, centers, biome_params, distance,
+                                                  effective_radius, below, half)
+
+    def assign_materials(self, solid: np.ndarray, biome_params: List[dict], world_x: np.ndarray,
+                         world_y: np.ndarray, world_z: np.ndarray) -> np.ndarray:
+        """Yüzey / alt katman / taş ve cevher bloklarını ata"""
+        height = solid.shape[1]
+        surface_ids = np.asarray([BLOCK_IDS[b['surface']] for b in biome_params], dtype=np.uint8)[:, None, None, None]
+        subsurface_ids = np.asarray([BLOCK_IDS[b['subsurface']] for b in biome_params], dtype=np.uint8)[:, None, None, None]
+
+        # Kolon tepesinden derinlik
+        column_top = height - 1 - np.argmax(solid[:, ::-1], axis=1)[:, None]
+        depth = column_top - np.arange(height)[None, :, None, None]
+
+        blocks = np.full(solid.shape, BLOCK_IDS['stone'], dtype=np.uint8)
+        ore_roll = lattice_hash(self.seed ^ 0x0BE, world_x, world_y, world_z)
+        threshold = 0.0
+        for ore, chance in ORE_CHANCE.items():
+            blocks[(ore_roll >= threshold) & (ore_roll < threshold + chance)] = BLOCK_IDS[ore]
+            threshold += chance
+
+        blocks = np.where(depth <= SUBSURFACE_DEPTH, np.broadcast_to(subsurface_ids, blocks.shape), blocks)
+        blocks = np.where(depth == 0, np.broadcast_to(surface_ids, blocks.shape), blocks)
+        blocks[~solid] = AIR
+        return blocks
+
+    def stamp_features(self, solid: np.ndarray, blocks: np.ndarray, centers: np.ndarray,
+                       biome_params: List[dict], distance: np.ndarray, effective_radius: np.ndarray,
+                       below: int, half: int) -> int:
+        """Biome dekorasyonlarını ada yüzeylerine toplu bas"""
+        height = solid.shape[1]
+        has_solid = solid.any(axis=1)
+        column_top = height - 1 - np.argmax(solid[:, ::-1], axis=1)
+        surface_block = np.take_along_axis(blocks, column_top[:, None], axis=1)[:, 0]
+        surface_ids = np.asarray([BLOCK_IDS[b['surface']] for b in biome_params], dtype=np.uint8)[:, None, None]
+
+        # Aday çekilişi ada başına (seed, cx, cz) ile; aynı batch'e düşen diğer adalardan bağımsız
+        rolls = np.stack([
+            np.random.default_rng([self.seed & 0xFFFFFFFF, int(cx) & 0xFFFFFFFF, int(cz) & 0xFFFFFFFF])
+            .random(has_solid.shape[1:], dtype=np.float32)
+            for cx, cz in centers[:, [0, 2]]
+        ])
+        densities = np.asarray([b['density'] for b in biome_params], dtype=np.float32)[:, None, None]
+        candidates = (has_solid & (surface_block == surface_ids)
+                      & (distance[:, 0] < 0.7 * effective_radius[:, 0])
+                      & (rolls < densities))
+
+        stamped = 0
+        features = np.asarray([b['feature'] for b in biome_params])
+        for feature, template in FEATURE_TEMPLATES.items():
+            island, zi, xi = np.nonzero(candidates & (features == feature)[:, None, None])
+            if island.size == 0:
+                continue
+            base_x = centers[island, 0] + xi - half
+            base_y = centers[island, 1] + column_top[island, zi, xi] - below + 1
+            base_z = centers[island, 2] + zi - half
+
+            offsets = np.asarray([t[:3] for t in template], dtype=np.int64)
+            ids = np.asarray([BLOCK_IDS[t[3]] for t in template], dtype=np.uint8)
+            block_ids = np.broadcast_to(ids, (island.size, len(template))).copy()
+            if feature == 'coral':
+                block_ids[:, 0] = np.asarray([BLOCK_IDS[b] for b in CORAL_BLOCKS], dtype=np.uint8)[np.arange(island.size) % 2]
+            voxel_x = base_x[:, None] + offsets[:, 2]
+            voxel_y = base_y[:, None] + offsets[:, 0]
+            voxel_z = base_z[:, None] + offsets[:, 1]
+            if feature == 'rock':
+                # Dolgu dünya konumuna bağlı; batch içeriğinden etkilenmez
+                block_ids[lattice_hash(self.seed ^ 0x50C, voxel_x, voxel_y, voxel_z) >= ROCK_FILL] = AIR
+
+            self.store.write_voxels(voxel_x, voxel_y, voxel_z, block_ids, skip_air=True)
+            stamped += island.size
+        return stamped
+
+
+def main():
+    """Bölge üretim benchmark'ı"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='SkyWorld floating island generator benchmark')
+    parser.add_argument('--seed', default='skyworld_default', help='Dünya seed değeri')
+    parser.add_argument('--size', type=int, default=512, help='Bölge kenar uzunluğu (blok)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    generator = IslandGenerator(args.seed)
+    stats = generator.generate_region(0, 0, args.size, args.size)
+    print(f"  Islands: {stats.islands} ({stats.islands_per_second:.1f} islands/sec)")
+    print(f"  Voxels: {stats.voxels} ({stats.voxels_per_second:.0f} voxels/sec)")
+    print(f"  Features: {stats.features}, chunks: {len(generator.store)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
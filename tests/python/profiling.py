@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Profiling Hooks
+@author MiniMax Agent
+
+Test suite için opsiyonel profil alma: her test cProfile ya da düşük maliyetli
+bir stack sampler ile sarılır, flamegraph araçlarının okuyabildiği collapsed
+stack (.folded) dosyaları ve top-N hotspot tablosu üretilir.
+
+Dünya/meshing/fizik kodu span() ile isimli ölçüm aralıkları açabilir; profil
+kapalıyken span() paylaşılan boş bir context manager döndürür.
+"""
+
+import cProfile
+import pstats
+import re
+import sys
+import time
+import threading
+import functools
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+PROFILE_MODES = ('cprofile', 'sample')
+DEFAULT_TOP_N = 15
+DEFAULT_SAMPLE_INTERVAL = 0.001
+
+# ----------------------------------------------------------------------
+# Named spans
+# ----------------------------------------------------------------------
+
+_spans_enabled = False
+_span_stats: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])  # count, total_ns, max_ns
+
+
+class _NullSpan:
+    """Profil kapalıyken kullanılan boş span"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Süresi _span_stats'a eklenen isimli ölçüm aralığı"""
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        elapsed = time.perf_counter_ns() - self.start
+        stats = _span_stats[self.name]
+        stats[0] += 1
+        stats[1] += elapsed
+        if elapsed > stats[2]:
+            stats[2] = elapsed
+        return False
+
+
+def span(name: str):
+    """İsimli ölçüm aralığı: `with span('meshing.build'): ...`"""
+    if not _spans_enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """Fonksiyonu span ile saran decorator"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _spans_enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable_spans():
+    """Span ölçümlerini aç"""
+    global _spans_enabled
+    _spans_enabled = True
+
+
+def disable_spans():
+    """Span ölçümlerini kapat"""
+    global _spans_enabled
+    _spans_enabled = False
+
+
+def reset_spans():
+    """Toplanan span istatistiklerini temizle"""
+    _span_stats.clear()
+
+
+def span_stats() -> Dict[str, Dict[str, float]]:
+    """Span istatistikleri (milisaniye)"""
+    return {
+        name: {
+            'count': count,
+            'total_ms': total_ns / 1e6,
+            'mean_ms': total_ns / count / 1e6 if count else 0.0,
+            'max_ms': max_ns / 1e6
+        }
+        for name, (count, total_ns, max_ns) in sorted(_span_stats.items())
+    }
+
+
+# ----------------------------------------------------------------------
+# Stack sampler
+# ----------------------------------------------------------------------
+
+def _frame_label(code) -> str:
+    """Flamegraph çerçeve etiketi: fonksiyon (dosya:satır)"""
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Hedef thread'in stack'ini arka planda periyodik olarak örnekler"""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+                self.samples += 1
+
+    def start(self):
+        """Örneklemeyi başlat"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='skyworld-stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Örneklemeyi durdur"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def hotspots(self, top_n: int = DEFAULT_TOP_N) -> List[Dict[str, Any]]:
+        """En çok örnek alınan yaprak fonksiyonlar"""
+        leaf_counts: Counter = Counter()
+        for stack, count in self.stacks.items():
+            leaf_counts[stack.rsplit(';', 1)[-1]] += count
+        return [
+            {'function': function, 'samples': count, 'self_pct': count / self.samples * 100}
+            for function, count in leaf_counts.most_common(top_n)
+        ]
+
+
+# ----------------------------------------------------------------------
+# Per-test capture
+# ----------------------------------------------------------------------
+
+def _pstats_label(func) -> str:
+    """pstats anahtarını (dosya, satır, isim) etikete çevir"""
+    filename, line, name = func
+    if filename == '~':
+        return name
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+class ProfileCapture:
+    """Tek bir testin profil kaydı"""
+
+    def __init__(self, name: str, mode: str, out_dir: Path, top_n: int):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode} (expected one of {', '.join(PROFILE_MODES)})")
+        self.name = name
+        self.mode = mode
+        self.out_dir = Path(out_dir)
+        self.top_n = top_n
+        self.result: Optional[Dict[str, Any]] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+
+    def start(self):
+        """Profil almayı başlat"""
+        reset_spans()
+        if self.mode == 'cprofile':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = StackSampler()
+            self._sampler.start()
+
+    def stop(self) -> Dict[str, Any]:
+        """Profil almayı bitir, .folded dosyasını yaz ve özet döndür"""
+        if self.result is not None:
+            return self.result
+
+        if self._profile is not None:
+            self._profile.disable()
+            stacks, hotspots = self._cprofile_output()
+        else:
+            self._sampler.stop()
+            stacks, hotspots = self._sampler.stacks, self._sampler.hotspots(self.top_n)
+
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        slug = re.sub(r'[^a-z0-9]+', '_', self.name.lower()).strip('_')
+        folded_path = self.out_dir / f"{slug}.{self.mode}.folded"
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            for stack, weight in sorted(stacks.items()):
+                if weight > 0:
+                    f.write(f"{stack} {weight}\n")
+
+        self.result = {
+            'mode': self.mode,
+            'collapsed_stacks': str(folded_path),
+            'hotspots': hotspots,
+            'spans': span_stats()
+        }
+        return self.result
+
+    def _cprofile_output(self):
+        """cProfile verisinden caller;callee ağırlıkları (µs) ve hotspot tablosu"""
+        stats = pstats.Stats(self._profile).stats
+        stacks: Counter = Counter()
+        for func, (_, _, tottime, _, callers) in stats.items():
+            label = _pstats_label(func)
+            if not callers:
+                stacks[label] += int(tottime * 1e6)
+            for caller, caller_stats in callers.items():
+                stacks[f"{_pstats_label(caller)};{label}"] += int(caller_stats[2] * 1e6)
+
+        ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:self.top_n]
+        hotspots = [
+            {
+                'function': _pstats_label(func),
+                'calls': primitive_calls if primitive_calls == total_calls else f"{total_calls}/{primitive_calls}",
+                'tottime': tottime,
+                'cumtime': cumtime
+            }
+            for func, (primitive_calls, total_calls, tottime, cumtime, _) in ranked
+        ]
+        return stacks, hotspots
+
+
+class TestProfiler:
+    """Suite'teki her testi sırayla profilleyen yardımcı"""
+    __test__ = False  # pytest bunu test sınıfı olarak toplamasın
+
+    def __init__(self, mode: str = 'cprofile', out_dir: Path = Path('test_profiles'), top_n: int = DEFAULT_TOP_N):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode} (expected one of {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.out_dir = Path(out_dir)
+        self.top_n = top_n
+
+    def capture(self, name: str) -> ProfileCapture:
+        """Yeni bir test için kayıt başlat"""
+        enable_spans()
+        capture = ProfileCapture(name, self.mode, self.out_dir, self.top_n)
+        capture.start()
+        return capture
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Streaming Test Report (NDJSON)
+@author MiniMax Agent
+
+Her TestResult tamamlandığı anda tek satırlık bir JSON kaydı olarak diske
+yazılır; uzun sayı dizileri (frame süreleri, chunk istatistikleri) .npy
+sidecar dosyalarına taşınır. Böylece çökme/timeout durumunda o ana kadarki
+sonuçlar kaybolmaz ve bellek kullanımı sınırlı kalır. summarize_report()
+akıştan eski test_report.json formatını üretir.
+"""
+
+import json
+import re
+import sys
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy yoksa diziler satır içinde kalır
+    np = None
+
+logger = logging.getLogger(__name__)
+
+REPORT_FORMAT_VERSION = 1
+SIDECAR_MIN_LENGTH = 64
+SIDECAR_KEY = '$npy'
+
+
+def _json_default(value: Any):
+    """numpy skaler/dizi ve diğer tipleri JSON'a çevir"""
+    if np is not None:
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+
+def _is_numeric_sequence(value: Any) -> bool:
+    """Sidecar'a taşınmaya uygun uzun sayı dizisi mi"""
+    if np is not None and isinstance(value, np.ndarray):
+        return value.size >= SIDECAR_MIN_LENGTH and value.dtype.kind in 'biuf'
+    if isinstance(value, (list, tuple)) and len(value) >= SIDECAR_MIN_LENGTH:
+        return all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in value)
+    return False
+
+
+class NDJSONReportWriter:
+    """TestResult kayıtlarını satır satır yazan rapor akışı"""
+
+    def __init__(self, path: Path, run_info: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.sidecar_dir = self.path.with_name(self.path.stem + '.sidecars')
+        self.records_written = 0
+        self.sidecars_written = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in self.sidecar_dir.glob('*.npy'):
+            stale.unlink()
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._write({
+            'type': 'run',
+            'version': REPORT_FORMAT_VERSION,
+            'timestamp': datetime.now().isoformat(),
+            **(run_info or {})
+        })
+
+    def _write(self, record: Dict[str, Any]):
+        """Tek kaydı yaz ve hemen flush et"""
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=_json_default))
+        self._file.write('\n')
+        self._file.flush()
+
+    def _sidecar_name(self, test_name: str, key_path: str) -> str:
+        """Sidecar dosya adı: <sıra>-<test>-<anahtar>.npy"""
+        slug = re.sub(r'[^a-z0-9]+', '-', f"{test_name}-{key_path}".lower()).strip('-')
+        return f"{self.records_written:04d}-{slug}.npy"
+
+    def _offload(self, value: Any, test_name: str, key_path: str) -> Any:
+        """Büyük dizileri .npy dosyasına yaz, yerine referans koy"""
+        if isinstance(value, dict):
+            return {key: self._offload(item, test_name, f"{key_path}.{key}" if key_path else str(key))
+                    for key, item in value.items()}
+        if np is None or not _is_numeric_sequence(value):
+            return value
+
+        array = np.asarray(value)
+        self.sidecar_dir.mkdir(parents=True, exist_ok=True)
+        name = self._sidecar_name(test_name, key_path)
+        np.save(self.sidecar_dir / name, array, allow_pickle=False)
+        self.sidecars_written += 1
+        return {
+            SIDECAR_KEY: f"{self.sidecar_dir.name}/{name}",
+            'dtype': str(array.dtype),
+            'shape': list(array.shape)
+        }
+
+    def write_result(self, result) -> Optional[Dict[str, Any]]:
+        """TestResult'ı akışa yaz; sidecar referanslı details döndür"""
+        details = self._offload(result.details, result.test_name, '') if result.details else result.details
+        self._write({
+            'type': 'result',
+            'test_name': result.test_name,
+            'status': result.status,
+            'duration': result.duration,
+            'message': result.message,
+            'details': details
+        })
+        self.records_written += 1
+        return details
+
+    def close(self):
+        """Akışı kapat"""
+        if not self._file.closed:
+            self._write({'type': 'end', 'timestamp': datetime.now().isoformat(), 'records': self.records_written})
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def iter_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """NDJSON kayıtlarını sırayla oku (yarım kalmış son satır atlanır)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping truncated record at {path}:{line_number}")
+
+
+def load_sidecar(report_path: Path, reference: Dict[str, Any]):
+    """Sidecar referansını numpy dizisi olarak yükle"""
+    if np is None:
+        raise ImportError("numpy is required to load report sidecars")
+    return np.load(Path(report_path).parent / reference[SIDECAR_KEY], allow_pickle=False)
+
+
+def summarize_report(path: Path) -> Dict[str, Any]:
+    """Akıştan test_report.json formatında özet üret"""
+    report = {'timestamp': None, 'summary': {}, 'test_results': []}
+    complete = False
+    counts = {'PASS': 0, 'FAIL': 0, 'SKIP': 0}
+
+    for record in iter_records(path):
+        record_type = record.get('type')
+        if record_type == 'run':
+            report['timestamp'] = record.get('timestamp')
+        elif record_type == 'result':
+            status = record.get('status')
+            counts[status if status in ('PASS', 'FAIL') else 'SKIP'] += 1
+            report['test_results'].append({
+                'test_name': record.get('test_name'),
+                'status': status,
+                'duration': record.get('duration'),
+                'message': record.get('message', ''),
+                'details': record.get('details')
+            })
+        elif record_type == 'end':
+            complete = True
+
+    if not complete:
+        logger.warning(f"⚠️ Report stream {path} has no end record; run was interrupted")
+
+    total_tests = len(report['test_results'])
+    report['summary'] = {
+        'total_tests': total_tests,
+        'passed': counts['PASS'],
+        'failed': counts['FAIL'],
+        'skipped': counts['SKIP'],
+        'success_rate': (counts['PASS'] / total_tests * 100) if total_tests > 0 else 0
+    }
+    return report
+
+
+def main():
+    """NDJSON akışını özet rapora çevir"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Summarize a streamed SkyWorld test report')
+    parser.add_argument('stream', type=Path, help='NDJSON rapor dosyası')
+    parser.add_argument('-o', '--output', type=Path, default=None, help='Özet JSON çıktısı (varsayılan: stdout)')
+    args = parser.parse_args()
+
+    report = summarize_report(args.stream)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Structure Schematics and Bridge Rasterizer
+@author MiniMax Agent
+
+IslandGenerator.createStructure/createBridge'in her yerleşimde primitiflerden
+yapı kurması yerine hazır şablon (schematic) sistemi:
+
+- Kompakt binary format: palet + yoğun (dense) ya da seyrek (sparse) voxel'ler,
+  opsiyonel zlib sıkıştırma.
+- Y ekseni etrafında 90° döndürme ve x/z aynalama.
+- Çözülmüş ve dönüştürülmüş şablonlar için LRU cache.
+- Yerleşimler blok blok değil, chunk başına tek dilim kopyasıyla basılır;
+  chunk sınırlarında kırpma write_region tarafından yapılır.
+- Köprüler iki uç arasında 3B Bresenham ile rasterize edilir.
+"""
+
+import struct
+import zlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from profiling import span
+from voxel_world import BLOCK_IDS, ChunkStore
+
+logger = logging.getLogger(__name__)
+
+SCHEMATIC_MAGIC = b'SKYS'
+SCHEMATIC_VERSION = 1
+HEADER_FORMAT = '<4sBBHHHB'  # magic, version, flags, height, depth, width, palette size
+FLAG_SPARSE = 0x01
+FLAG_ZLIB = 0x02
+DEFAULT_CACHE_SIZE = 64
+MIRROR_AXES = {None: None, 'x': 2, 'z': 1}
+
+
+class SchematicError(ValueError):
+    """Geçersiz ya da bozuk schematic verisi"""
+
+
+@dataclass
+class Schematic:
+    """Palet + [y, z, x] palet indeksleri; palette[0] her zaman 'air'"""
+    palette: Tuple[str, ...]
+    voxels: np.ndarray
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.voxels.shape
+
+    def transformed(self, rotation: int = 0, mirror: Optional[str] = None) -> 'Schematic':
+        """Y ekseni etrafında rotation*90° döndürülmüş ve/veya aynalanmış kopya"""
+        if mirror not in MIRROR_AXES:
+            raise ValueError(f"Unknown mirror axis: {mirror} (expected 'x', 'z' or None)")
+        voxels = self.voxels
+        if MIRROR_AXES[mirror] is not None:
+            voxels = np.flip(voxels, axis=MIRROR_AXES[mirror])
+        voxels = np.rot90(voxels, k=rotation % 4, axes=(1, 2))
+        return Schematic(self.palette, np.ascontiguousarray(voxels))
+
+    def block_volume(self) -> np.ndarray:
+        """Palet indekslerini dünya blok id'lerine çevir"""
+        try:
+            lookup = np.asarray([BLOCK_IDS[name] for name in self.palette], dtype=np.uint8)
+        except KeyError as error:
+            raise SchematicError(f"Unknown block in palette: {error.args[0]}") from None
+        return lookup[self.voxels]
+
+
+def encode_schematic(schematic: Schematic, compress: bool = True) -> bytes:
+    """Schematic'i binary formata çevir (dense/sparse otomatik seçilir)"""
+    if schematic.palette[0] != 'air':
+        raise SchematicError("Palette index 0 must be 'air'")
+    if len(schematic.palette) > 255:
+        raise SchematicError("Palette supports at most 255 entries")
+
+    height, depth, width = schematic.shape
+    flat = schematic.voxels.astype(np.uint8, copy=False).ravel()
+    filled = np.flatnonzero(flat)
+
+    # Seyrek kayıt voxel başına 5 bayt (uint32 indeks + uint8 değer)
+    flags = 0
+    if filled.size * 5 + 4 < flat.size:
+        flags |= FLAG_SPARSE
+        body = struct.pack('<I', filled.size) + filled.astype('<u4').tobytes() + flat[filled].tobytes()
+    else:
+        body = flat.tobytes()
+    if compress:
+        flags |= FLAG_ZLIB
+        body = zlib.compress(body, 9)
+
+    palette = b''.join(struct.pack('<B', len(name.encode('utf-8'))) + name.encode('utf-8')
+                       for name in schematic.palette)
+    header = struct.pack(HEADER_FORMAT, SCHEMATIC_MAGIC, SCHEMATIC_VERSION, flags,
+                         height, depth, width, len(schematic.palette))
+    return header + palette + body
+
+
+def decode_schematic(data: bytes) -> Schematic:
+    """Binary veriden Schematic oluştur"""
+    header_size = struct.calcsize(HEADER_FORMAT)
+    if len(data) < header_size:
+        raise SchematicError("Schematic data is truncated")
+    magic, version, flags, height, depth, width, palette_size = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != SCHEMATIC_MAGIC:
+        raise SchematicError("Not a SkyWorld schematic")
+    if version != SCHEMATIC_VERSION:
+        raise SchematicError(f"Unsupported schematic version: {version}")
+
+    offset = header_size
+    palette = []
+    size = height * depth * width
+    try:
+        for _ in range(palette_size):
+            length = data[offset]
+            name = data[offset + 1:offset + 1 + length]
+            if len(name) != length:
+                raise SchematicError("Schematic palette is truncated")
+            palette.append(name.decode('utf-8'))
+            offset += 1 + length
+
+        body = data[offset:]
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+
+        if flags & FLAG_SPARSE:
+            (count,) = struct.unpack_from('<I', body)
+            indices = np.frombuffer(body, dtype='<u4', count=count, offset=4)
+            values = np.frombuffer(body, dtype=np.uint8, count=count, offset=4 + 4 * count)
+            if count and int(indices.max()) >= size:
+                raise SchematicError("Sparse voxel index is out of bounds")
+            flat = np.zeros(size, dtype=np.uint8)
+            flat[indices] = values
+        else:
+            flat = np.frombuffer(body, dtype=np.uint8, count=size).copy()
+    except SchematicError:
+        raise
+    except (IndexError, UnicodeDecodeError, ValueError, struct.error, zlib.error) as error:
+        raise SchematicError(f"Corrupt schematic: {error}") from None
+
+    if flat.size and flat.max() >= palette_size:
+        raise SchematicError("Voxel references a palette entry that does not exist")
+    return Schematic(tuple(palette), flat.reshape(height, depth, width))
+
+
+class SchematicCache:
+    """Çözülmüş + dönüştürülmüş şablonlar için LRU cache"""
+
+    def __init__(self, library: Dict[str, bytes], maxsize: int = DEFAULT_CACHE_SIZE):
+        self.library = library
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[tuple, Tuple[np.ndarray, np.ndarray]]' = OrderedDict()
+
+    def get(self, name: str, rotation: int = 0, mirror: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(blok hacmi, dolu voxel ofsetleri [k, 3] x/y/z) döndür"""
+        key = (name, rotation % 4, mirror)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        try:
+            data = self.library[name]
+        except KeyError:
+            raise KeyError(f"Unknown schematic: {name}") from None
+        volume = decode_schematic(data).transformed(rotation, mirror).block_volume()
+        yi, zi, xi = np.nonzero(volume)
+        entry = (volume, np.stack((xi, yi, zi), axis=1).astype(np.int64))
+
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+
+# ----------------------------------------------------------------------
+# Yerleşik şablonlar (JS structureConfigs ile aynı boyutlar)
+# ----------------------------------------------------------------------
+
+def build_castle() -> Schematic:
+    """6x8x6 boş taş kale, mazgallı duvarlar"""
+    voxels = np.zeros((9, 6, 6), dtype=np.uint8)
+    voxels[:8, :, :] = 1
+    voxels[1:8, 1:-1, 1:-1] = 0
+    voxels[8, ::2, 0] = voxels[8, ::2, -1] = voxels[8, 0, ::2] = voxels[8, -1, ::2] = 1
+    voxels[1:3, 0, 2:4] = 0  # kapı
+    return Schematic(('air', 'stone'), voxels)
+
+
+def build_tower() -> Schematic:
+    """Yarıçap 2, 15 blok yüksekliğinde silindir kule"""
+    offsets = np.arange(5) - 2
+    disc = (offsets[:, None] ** 2 + offsets[None, :] ** 2) <= 2 ** 2 + 1
+    voxels = np.zeros((15, 5, 5), dtype=np.uint8)
+    voxels[:, disc] = 1
+    voxels[-1, disc] = 2
+    return Schematic(('air', 'stone', 'iron'), voxels)
+
+
+def build_pyramid() -> Schematic:
+    """Taban yarıçapı 5, 8 blok yüksekliğinde basamaklı piramit"""
+    size = 11
+    offsets = np.abs(np.arange(size) - size // 2)
+    ring = np.maximum(offsets[:, None], offsets[None, :])
+    levels = np.arange(8)[:, None, None]
+    voxels = (ring[None] <= (5 - levels * 5 / 8)).astype(np.uint8)
+    return Schematic(('air', 'sand'), voxels)
+
+
+BUILTIN_SCHEMATICS = {
+    'castle': build_castle,
+    'tower': build_tower,
+    'pyramid': build_pyramid,
+}
+
+
+def builtin_library(compress: bool = True) -> Dict[str, bytes]:
+    """Yerleşik şablonların encode edilmiş hali"""
+    return {name: encode_schematic(build(), compress) for name, build in BUILTIN_SCHEMATICS.items()}
+
+
+# ----------------------------------------------------------------------
+# Basma (stamping)
+# ----------------------------------------------------------------------
+
+@dataclass
+class Placement:
+    """Bir şablonun dünyadaki yerleşimi (origin = dönüştürülmüş şablonun min köşesi)"""
+    name: str
+    x: int
+    y: int
+    z: int
+    rotation: int = 0
+    mirror: Optional[str] = None
+
+
+class StructureStamper:
+    """Şablonları ve köprüleri chunk deposuna toplu basar"""
+
+    def __init__(self, store: ChunkStore, cache: SchematicCache = None):
+        self.store = store
+        self.cache = cache if cache is not None else SchematicCache(builtin_library())
+
+    def stamp_many(self, placements: Iterable[Placement]) -> int:
+        """Yerleşimleri sırayla bas; her biri chunk başına tek dilim kopyası"""
+        written = 0
+        with span('worldgen.structures.stamp'):
+            for placement in placements:
+                volume, _ = self.cache.get(placement.name, placement.rotation, placement.mirror)
+                written += self.store.write_region((placement.x, placement.y, placement.z), volume)
+        return written
+
+    def stamp_per_block(self, placements: Iterable[Placement]) -> int:
+        """Karşılaştırma için blok blok basma (BlockSystem.setBlock döngüsü)"""
+        written = 0
+        for placement in placements:
+            volume, offsets = self.cache.get(placement.name, placement.rotation, placement.mirror)
+            for x, y, z in offsets.tolist():
+                self.store.set_block(placement.x + x, placement.y + y, placement.z + z, int(volume[y, z, x]))
+                written += 1
+        return written
+
+    def stamp_bridge(self, start: Sequence[int], end: Sequence[int], block: str = 'wood', width: int = 1) -> int:
+        """İki uç arasına köprü rasterize et (JS bridgeConfigs gibi)"""
+        path = bresenham_3d(start, end)
+        # Güverte, ana eksene dik yatay yönde genişler
+        delta = np.abs(np.asarray(end) - np.asarray(start))
+        side_axis = 2 if delta[0] >= delta[2] else 0
+        side = np.arange(width) - (width - 1) // 2
+        positions = np.repeat(path[:, None, :], width, axis=1)
+        positions[:, :, side_axis] += side[None, :]
+        return self.store.write_voxels(positions[..., 0], positions[..., 1], positions[..., 2], BLOCK_IDS[block])
+
+
+def bresenham_3d(start: Sequence[int], end: Sequence[int]) -> np.ndarray:
+    """3B Bresenham çizgisi; uçlar dahil (n, 3) [x, y, z] tamsayı noktaları"""
+    x0, y0, z0 = (int(v) for v in start)
+    x1, y1, z1 = (int(v) for v in end)
+    dx, dy, dz = abs(x1 - x0), abs(y1 - y0), abs(z1 - z0)
+    sx, sy, sz = (1 if x1 > x0 else -1), (1 if y1 > y0 else -1), (1 if z1 > z0 else -1)
+
+    points = [(x0, y0, z0)]
+    if dx >= dy and dx >= dz:
+        err_y, err_z = 2 * dy - dx, 2 * dz - dx
+        for _ in range(dx):
+            x0 += sx
+            if err_y >= 0:
+                y0 += sy
+                err_y -= 2 * dx
+            if err_z >= 0:
+                z0 += sz
+                err_z -= 2 * dx
+            err_y += 2 * dy
+            err_z += 2 * dz
+            points.append((x0, y0, z0))
+    elif dy >= dx and dy >= dz:
+        err_x, err_z = 2 * dx - dy, 2 * dz - dy
+        for _ in range(dy):
+            y0 += sy
+            if err_x >= 0:
+                x0 += sx
+                err_x -= 2 * dy
+            if err_z >= 0:
+                z0 += sz
+                err_z -= 2 * dy
+            err_x += 2 * dx
+            err_z += 2 * dz
+            points.append((x0, y0, z0))
+    else:
+        err_x, err_y = 2 * dx - dz, 2 * dy - dz
+        for _ in range(dz):
+            z0 += sz
+            if err_x >= 0:
+                x0 += sx
+                err_x -= 2 * dz
+            if err_y >= 0:
+                y0 += sy
+                err_y -= 2 * dz
+            err_x += 2 * dx
+            err_y += 2 * dy
+            points.append((x0, y0, z0))
+    return np.asarray(points, dtype=np.int64)
@@ -0,0 +1,694 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Session Recording and Headless Replay
+@author MiniMax Agent
+
+Seed'li bir oyun oturumunun girdi ve düzenleme akışını kompakt bir kayda
+yazar; headless replayer aynı akışı dünya (ChunkStore + BlockUpdateEngine),
+fizik ve meshing katmanlarından gerçek zamandan hızlı geçirir:
+
+- Kayıt sadece değişiklikleri tutar: tuş maskesi, bakış açısı ve blok
+  düzenlemeleri tick farkı + varint olarak kodlanır, gövde deflate ile
+  sıkıştırılır. Kayıt sırasında her N tick'te bir alınan dünya checksum'ı
+  da akışa yazılır.
+- Replay her tick'te alt sistem sürelerini ölçer ve checkpoint'lerde
+  checksum'ı karşılaştırır; ilk uyuşmazlık tick'i raporlanır. N=1 ile (ya
+  da iki replay'in tick izleri karşılaştırılarak) tam tick bulunur.
+- Fizik PhysicsSystem'in voxel çarpışmalı headless karşılığıdır, meshing
+  buildChunkMesh'in yüz ayıklamalı (face culling) karşılığıdır.
+
+Dosya düzeni:
+    '<4sBBHHIQ' header (magic, sürüm, bayraklar, tick hızı, checkpoint
+    aralığı, meta uzunluğu, seed) + meta JSON + olay akışı
+"""
+
+import sys
+import json
+import math
+import time
+import zlib
+import random
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from block_updates import BlockUpdateEngine, world_checksum
+from island_generator import IslandGenerator, seed_to_int
+from profiling import span
+from voxel_world import AIR, BLOCK_IDS, CHUNK_SIZE, WORLD_HEIGHT, ChunkKey, ChunkStore
+
+SESSION_MAGIC = b'SKYR'
+SESSION_VERSION = 1
+SESSION_HEADER = struct.Struct('<4sBBHHIQ')
+FLAG_DEFLATE = 1
+
+# src/constants/physics.js PHYSICS_ENGINE.UPDATE_RATE ile aynı
+TICK_RATE = 60
+DEFAULT_CHECKSUM_INTERVAL = 20
+# Blok güncellemeleri 20 Hz (her 3 fizik tick'inde bir)
+BLOCK_UPDATE_INTERVAL = 3
+DEFAULT_REGION = (0, 0, 128, 128)
+
+EVENT_END = 0
+EVENT_INPUT = 1
+EVENT_LOOK = 2
+EVENT_EDIT = 3
+EVENT_CHECKSUM = 4
+
+# Tuş maskesi bitleri
+INPUT_FORWARD = 1
+INPUT_BACKWARD = 2
+INPUT_LEFT = 4
+INPUT_RIGHT = 8
+INPUT_JUMP = 16
+INPUT_RUN = 32
+
+# src/constants/world.js PHYSICS_CONSTANTS ile aynı
+GRAVITY = -9.81
+TERMINAL_VELOCITY = -50.0
+WALK_SPEED = 4.3
+RUN_SPEED = 5.6
+JUMP_VELOCITY = 8.0
+PLAYER_WIDTH = 0.6
+PLAYER_HEIGHT = 1.8
+GROUND_FRICTION = 0.8
+AIR_FRICTION = 0.1
+VOID_Y = -64.0
+
+SUBSYSTEMS = ('input', 'physics', 'blocks', 'meshing', 'checksum')
+
+_WATER = BLOCK_IDS['water']
+_LAVA = BLOCK_IDS['lava']
+_PASSABLE = np.zeros(256, dtype=bool)
+_PASSABLE[[AIR, _WATER, _LAVA]] = True
+_TRANSPARENT = np.zeros(256, dtype=bool)
+_TRANSPARENT[[AIR, _WATER, _LAVA]] = True
+PLAYER_STATE = struct.Struct('<ddddddHB?')
+
+
+class SessionFormatError(ValueError):
+    """Oturum kaydı okunamıyor"""
+
+
+@dataclass
+class SessionEvent:
+    """Tek kayıt olayı; data türe göre (oyuncu, ...) ya da (checksum,)"""
+    tick: int
+    kind: int
+    data: Tuple[int, ...]
+
+
+@dataclass
+class SessionRecording:
+    """Bellekteki oturum kaydı"""
+    seed: int
+    ticks: int
+    meta: dict
+    events: List[SessionEvent] = field(default_factory=list)
+    tick_rate: int = TICK_RATE
+    checksum_interval: int = DEFAULT_CHECKSUM_INTERVAL
+
+    @property
+    def checkpoints(self) -> List[Tuple[int, int]]:
+        return [(event.tick, event.data[0]) for event in self.events if event.kind == EVENT_CHECKSUM]
+
+
+# ----------------------------------------------------------------------
+# Encoding
+# ----------------------------------------------------------------------
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+class _Reader:
+    """Bayt dizisi üzerinde varint okuyucu"""
+    __slots__ = ('data', 'pos')
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def varint(self) -> int:
+        result = shift = 0
+        data = self.data
+        while True:
+            if self.pos >= len(data):
+                raise SessionFormatError("Truncated session event stream")
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def byte(self) -> int:
+        if self.pos >= len(self.data):
+            raise SessionFormatError("Truncated session event stream")
+        self.pos += 1
+        return self.data[self.pos - 1]
+
+    def uint32(self) -> int:
+        if self.pos + 4 > len(self.data):
+            raise SessionFormatError("Truncated session event stream")
+        self.pos += 4
+        return int.from_bytes(self.data[self.pos - 4:self.pos], 'little')
+
+
+def encode_session(recording: SessionRecording, compress: bool = True) -> bytes:
+    """Kaydı binary formata çevir
+
+    Olaylar tick sırasıyla yazılır: tick farkı, tür ve yük varint olarak;
+    düzenleme koordinatları bir önceki düzenlemeye göre zigzag farktır.
+    """
+    body = bytearray()
+    last_tick = 0
+    last_edit = (0, 0, 0)
+    for event in recording.events:
+        if event.tick < last_tick:
+            raise SessionFormatError("Session events must be ordered by tick")
+        _write_varint(body, event.tick - last_tick)
+        last_tick = event.tick
+        body.append(event.kind)
+        if event.kind == EVENT_INPUT:
+            player, mask = event.data
+            _write_varint(body, player)
+            body.append(mask)
+        elif event.kind == EVENT_LOOK:
+            player, yaw = event.data
+            _write_varint(body, player)
+            _write_varint(body, yaw)
+        elif event.kind == EVENT_EDIT:
+            player, x, y, z, block = event.data
+            _write_varint(body, player)
+            for coord, previous in zip((x, y, z), last_edit):
+                _write_varint(body, _zigzag(coord - previous))
+            body.append(block)
+            last_edit = (x, y, z)
+        elif event.kind == EVENT_CHECKSUM:
+            body += struct.pack('<I', event.data[0])
+        else:
+            raise SessionFormatError(f"Unknown session event kind: {event.kind}")
+    if recording.ticks < last_tick:
+        raise SessionFormatError("Session ends before its last event")
+    _write_varint(body, recording.ticks - last_tick)
+    body.append(EVENT_END)
+
+    meta = json.dumps(recording.meta, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    flags = FLAG_DEFLATE if compress else 0
+    if compress:
+        body = zlib.compress(bytes(body), 9)
+    header = SESSION_HEADER.pack(SESSION_MAGIC, SESSION_VERSION, flags, recording.tick_rate,
+                                 recording.checksum_interval, len(meta), recording.seed)
+    return header + meta + bytes(body)
+
+
+def decode_session(data: bytes) -> SessionRecording:
+    """encode_session çıktısını geri oku"""
+    if len(data) < SESSION_HEADER.size:
+        raise SessionFormatError("Session file is too short")
+    magic, version, flags, tick_rate, checksum_interval, meta_length, seed = SESSION_HEADER.unpack_from(data)
+    if magic != SESSION_MAGIC:
+        raise SessionFormatError("Not a SkyWorld session recording")
+    if version != SESSION_VERSION:
+        raise SessionFormatError(f"Unsupported session version: {version}")
+    meta_end = SESSION_HEADER.size + meta_length
+    try:
+        meta = json.loads(data[SESSION_HEADER.size:meta_end].decode('utf-8'))
+        body = data[meta_end:]
+        if flags & FLAG_DEFLATE:
+            body = zlib.decompress(body)
+    except (UnicodeDecodeError, ValueError, zlib.error) as error:
+        raise SessionFormatError(f"Corrupt session recording: {error}") from None
+
+    reader = _Reader(body)
+    events = []
+    tick = 0
+    last_edit = (0, 0, 0)
+    while True:
+        tick += reader.varint()
+        kind = reader.byte()
+        if kind == EVENT_END:
+            break
+        if kind == EVENT_INPUT:
+            event_data = (reader.varint(), reader.byte())
+        elif kind == EVENT_LOOK:
+            event_data = (reader.varint(), reader.varint())
+        elif kind == EVENT_EDIT:
+            player = reader.varint()
+            last_edit = tuple(previous + _unzigzag(reader.varint()) for previous in last_edit)
+            event_data = (player, *last_edit, reader.byte())
+        elif kind == EVENT_CHECKSUM:
+            event_data = (reader.uint32(),)
+        else:
+            raise SessionFormatError(f"Unknown session event kind: {kind}")
+        events.append(SessionEvent(tick, kind, event_data))
+
+    return SessionRecording(seed=seed, ticks=tick, meta=meta, events=events,
+                            tick_rate=tick_rate, checksum_interval=checksum_interval)
+
+
+def save_session(recording: SessionRecording, path: Path) -> int:
+    """Kaydı dosyaya yaz, bayt sayısını döndür"""
+    data = encode_session(recording)
+    Path(path).write_bytes(data)
+    return len(data)
+
+
+def load_session(path: Path) -> SessionRecording:
+    return decode_session(Path(path).read_bytes())
+
+
+# ----------------------------------------------------------------------
+# Headless subsystems
+# ----------------------------------------------------------------------
+
+@dataclass
+class PlayerState:
+    """Oyuncunun fizik durumu ve o anki girdisi"""
+    x: float
+    y: float
+    z: float
+    spawn: Tuple[float, float, float]
+    vx: float = 0.0
+    vy: float = 0.0
+    vz: float = 0.0
+    yaw: int = 0  # 1/65536 tur
+    mask: int = 0
+    on_ground: bool = False
+
+    def pack(self) -> bytes:
+        return PLAYER_STATE.pack(self.x, self.y, self.z, self.vx, self.vy, self.vz, self.yaw, self.mask, self.on_ground)
+
+
+class PlayerPhysics:
+    """PhysicsSystem.update'in voxel çarpışmalı headless karşılığı"""
+
+    def __init__(self, store: ChunkStore, dt: float = 1.0 / TICK_RATE):
+        self.store = store
+        self.dt = dt
+
+    def step(self, player: PlayerState):
+        """Girdi, yerçekimi, sürtünme, eksen eksen hareket ve çarpışma"""
+        angle = player.yaw / 65536.0 * 2.0 * math.pi
+        forward = ((player.mask & INPUT_FORWARD) != 0) - ((player.mask & INPUT_BACKWARD) != 0)
+        strafe = ((player.mask & INPUT_RIGHT) != 0) - ((player.mask & INPUT_LEFT) != 0)
+        wish_x = -math.sin(angle) * forward + math.cos(angle) * strafe
+        wish_z = -math.cos(angle) * forward - math.sin(angle) * strafe
+        length = math.hypot(wish_x, wish_z)
+        if length > 0:
+            speed = (RUN_SPEED if player.mask & INPUT_RUN else WALK_SPEED) / length
+            wish_x *= speed
+            wish_z *= speed
+
+        friction = GROUND_FRICTION if player.on_ground else AIR_FRICTION
+        player.vx += (wish_x - player.vx) * friction
+        player.vz += (wish_z - player.vz) * friction
+        if player.mask & INPUT_JUMP and player.on_ground:
+            player.vy = JUMP_VELOCITY
+        player.vy = max(player.vy + GRAVITY * self.dt, TERMINAL_VELOCITY)
+
+        player.on_ground = False
+        new_y = player.y + player.vy * self.dt
+        if self.collides(player.x, new_y, player.z):
+            if player.vy < 0:
+                player.y = float(math.floor(new_y) + 1)
+                player.on_ground = True
+            player.vy = 0.0
+        else:
+            player.y = new_y
+        new_x = player.x + player.vx * self.dt
+        if self.collides(new_x, player.y, player.z):
+            player.vx = 0.0
+        else:
+            player.x = new_x
+        new_z = player.z + player.vz * self.dt
+        if self.collides(player.x, player.y, new_z):
+            player.vz = 0.0
+        else:
+            player.z = new_z
+
+        if player.y < VOID_Y:
+            player.x, player.y, player.z = player.spawn
+            player.vx = player.vy = player.vz = 0.0
+
+    def collides(self, x: float, y: float, z: float) -> bool:
+        """Oyuncu AABB'si katı bir blokla kesişiyor mu"""
+        half = PLAYER_WIDTH / 2
+        get_block = self.store.get_block
+        for block_y in range(math.floor(y), math.floor(y + PLAYER_HEIGHT) + 1):
+            for block_z in range(math.floor(z - half), math.floor(z + half) + 1):
+                for block_x in range(math.floor(x - half), math.floor(x + half) + 1):
+                    if not _PASSABLE[get_block(block_x, block_y, block_z)]:
+                        return True
+        return False
+
+
+class ChunkMesher:
+    """ChunkManager.buildChunkMesh'in yüz ayıklamalı karşılığı
+
+    Her chunk için görünür yüzler paketlenmiş uint32 dizisi olarak tutulur:
+    x | z << 4 | y << 8 | yön << 16 | blok << 19. Sadece chunk'ın dolu
+    y aralığı (bir blok payla) taranır.
+    """
+
+    # (dy, dz, dx) yönleri: +y, -y, +z, -z, +x, -x
+    DIRECTIONS = ((1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1))
+
+    def __init__(self, store: ChunkStore):
+        self.store = store
+        self.meshes: Dict[ChunkKey, np.ndarray] = {}
+
+    def build(self, key: ChunkKey) -> np.ndarray:
+        """Chunk'ın görünür yüzlerini yeniden üret"""
+        chunk = self.store.chunks.get(key)
+        if chunk is None:
+            self.meshes.pop(key, None)
+            return np.empty(0, dtype=np.uint32)
+        filled = np.flatnonzero(chunk.reshape(WORLD_HEIGHT, -1).any(axis=1))
+        if filled.size == 0:
+            self.meshes[key] = faces = np.empty(0, dtype=np.uint32)
+            return faces
+        y0, y1 = int(filled[0]), int(filled[-1]) + 1
+
+        # Bir blok paylı kutu: komşu chunk kenarları ve dolu aralığın altı/üstü
+        padded = np.zeros((y1 - y0 + 2, CHUNK_SIZE + 2, CHUNK_SIZE + 2), dtype=np.uint8)
+        lo, hi = max(y0 - 1, 0), min(y1 + 1, WORLD_HEIGHT)
+        padded[lo - y0 + 1:hi - y0 + 1, 1:-1, 1:-1] = chunk[lo:hi]
+        cx, cz = key
+        for dz, dx, target, source in (
+                (0, -1, (slice(1, -1), 0), (slice(None), CHUNK_SIZE - 1)),
+                (0, 1, (slice(1, -1), -1), (slice(None), 0)),
+                (-1, 0, (0, slice(1, -1)), (CHUNK_SIZE - 1, slice(None))),
+                (1, 0, (-1, slice(1, -1)), (0, slice(None)))):
+            neighbor = self.store.chunks.get((cx + dx, cz + dz))
+            if neighbor is not None:
+                padded[(slice(lo - y0 + 1, hi - y0 + 1),) + target] = neighbor[(slice(lo, hi),) + source]
+
+        inner = padded[1:-1, 1:-1, 1:-1]
+        visible = inner != AIR
+        parts = []
+        for direction, (dy, dz, dx) in enumerate(self.DIRECTIONS):
+            neighbor = padded[1 + dy:padded.shape[0] - 1 + dy, 1 + dz:CHUNK_SIZE + 1 + dz, 1 + dx:CHUNK_SIZE + 1 + dx]
+            exposed = visible & _TRANSPARENT[neighbor] & (neighbor != inner)
+            y, z, x = np.nonzero(exposed)
+            parts.append(x.astype(np.uint32) | (z.astype(np.uint32) << 4) | ((y + y0).astype(np.uint32) << 8)
+                         | np.uint32(direction << 16) | (inner[exposed].astype(np.uint32) << 19))
+        self.meshes[key] = faces = np.concatenate(parts)
+        return faces
+
+    def rebuild(self, keys) -> int:
+        """Verilen chunk'ları (sıralı) yeniden meshle, toplam yüz sayısını döndür"""
+        return sum(int(self.build(key).size) for key in sorted(keys))
+
+    @property
+    def face_count(self) -> int:
+        return sum(int(faces.size) for faces in self.meshes.values())
+
+
+class HeadlessWorld:
+    """Kaydın meta bilgisinden kurulan dünya, fizik ve meshing katmanları"""
+
+    def __init__(self, meta: dict, tick_rate: int = TICK_RATE):
+        world_seed = meta.get('world_seed', 'skyworld_default')
+        region = meta.get('region', DEFAULT_REGION)
+        generator = IslandGenerator(world_seed)
+        generator.generate_region(*region)
+        self.store = generator.store
+        self.blocks = BlockUpdateEngine(self.store)
+        self.physics = PlayerPhysics(self.store, 1.0 / tick_rate)
+        self.mesher = ChunkMesher(self.store)
+        self.block_update_interval = int(meta.get('block_update_interval', BLOCK_UPDATE_INTERVAL))
+        self.tick_count = 0
+
+        # Oyuncular adaların üstünde, sırayla doğar
+        specs = sorted(generator.place_islands(*region), key=lambda spec: (spec.x, spec.z))
+        self.players: List[PlayerState] = []
+        for index in range(int(meta.get('players', 1))):
+            spec = specs[index % len(specs)]
+            spawn = (spec.x + 0.5, float(self.surface_height(spec.x, spec.z, spec.y)), spec.z + 0.5)
+            self.players.append(PlayerState(*spawn, spawn=spawn))
+
+        self.mesher.rebuild(self.store.chunks)
+        self.store.dirty_chunks.clear()
+
+    def surface_height(self, x: int, z: int, fallback: int) -> int:
+        """Sütundaki en üst katı bloğun bir üstü"""
+        chunk = self.store.chunks.get((x // CHUNK_SIZE, z // CHUNK_SIZE))
+        if chunk is None:
+            return fallback
+        solid = np.flatnonzero(~_PASSABLE[chunk[:, z % CHUNK_SIZE, x % CHUNK_SIZE]])
+        return int(solid[-1]) + 1 if solid.size else fallback
+
+    def apply(self, event: SessionEvent):
+        """Girdi/düzenleme olayını uygula (checksum olayları burada yok sayılır)"""
+        if event.kind == EVENT_INPUT:
+            player, mask = event.data
+            self.players[player].mask = mask
+        elif event.kind == EVENT_LOOK:
+            player, yaw = event.data
+            self.players[player].yaw = yaw
+        elif event.kind == EVENT_EDIT:
+            _, x, y, z, block = event.data
+            self.blocks.set_block(x, y, z, block)
+
+    def tick(self, events: List[SessionEvent], timings: Optional[np.ndarray] = None):
+        """Bir tick ilerlet; timings verilirse alt sistem süreleri yazılır"""
+        clock = time.perf_counter
+        start = clock()
+        for event in events:
+            self.apply(event)
+        after_input = clock()
+        with span('replay.physics'):
+            for player in self.players:
+                self.physics.step(player)
+        after_physics = clock()
+        if self.tick_count % self.block_update_interval == 0:
+            with span('replay.blocks'):
+                self.blocks.tick()
+        after_blocks = clock()
+        with span('meshing.build'):
+            self.mesher.rebuild(self.store.dirty_chunks)
+            self.store.dirty_chunks.clear()
+        after_meshing = clock()
+        self.tick_count += 1
+        if timings is not None:
+            timings[:4] = (after_input - start, after_physics - after_input,
+                           after_blocks - after_physics, after_meshing - after_blocks)
+
+    def checksum(self) -> int:
+        """Dünya, akışkan seviyeleri ve oyuncu durumlarının özeti"""
+        value = world_checksum(self.store, self.blocks.levels)
+        for player in self.players:
+            value = zlib.adler32(player.pack(), value)
+        return value
+
+
+# ----------------------------------------------------------------------
+# Recording
+# ----------------------------------------------------------------------
+
+# Bot'un seçtiği tuş kombinasyonları
+BOT_INPUTS = (0, INPUT_FORWARD, INPUT_FORWARD | INPUT_RUN, INPUT_FORWARD | INPUT_JUMP,
+              INPUT_LEFT, INPUT_RIGHT, INPUT_BACKWARD, INPUT_FORWARD | INPUT_LEFT)
+BOT_PLACE_BLOCKS = ('stone', 'dirt', 'wood', 'sand', 'sand', 'water', 'lava')
+BOT_EDIT_CHANCE = 0.04
+
+
+def record_session(seed: int = 42, ticks: int = 1200, players: int = 4, world_seed='skyworld_default',
+                   region: Tuple[int, int, int, int] = DEFAULT_REGION,
+                   checksum_interval: int = DEFAULT_CHECKSUM_INTERVAL) -> SessionRecording:
+    """Seed'li bot oyuncularla bir oturum oynat ve kaydet
+
+    Üretim ortamında yakalanan oturumların yerine geçer: her bot arada
+    yön değiştirir, yürür/koşar/zıplar ve önüne blok koyar ya da kırar.
+    Kayıt oynatılırken alınan checksum'lar akışa eklenir.
+    """
+    seed = seed_to_int(seed)
+    rng = random.Random(seed)
+    meta = {'world_seed': world_seed, 'region': list(region), 'players': players,
+            'block_update_interval': BLOCK_UPDATE_INTERVAL}
+    recording = SessionRecording(seed=seed, ticks=ticks, meta=meta, checksum_interval=checksum_interval)
+    world = HeadlessWorld(meta)
+    next_input = [0] * players
+
+    for tick in range(ticks):
+        events = []
+        for index, player in enumerate(world.players):
+            if tick >= next_input[index]:
+                next_input[index] = tick + rng.randint(20, 90)
+                mask = rng.choice(BOT_INPUTS)
+                if mask != player.mask:
+                    events.append(SessionEvent(tick, EVENT_INPUT, (index, mask)))
+                if rng.random() < 0.5:
+                    yaw = (player.yaw + rng.randint(-8192, 8192)) & 0xFFFF
+                    events.append(SessionEvent(tick, EVENT_LOOK, (index, yaw)))
+            if rng.random() < BOT_EDIT_CHANCE:
+                angle = player.yaw / 65536.0 * 2.0 * math.pi
+                reach = rng.randint(1, 4)
+                x = math.floor(player.x - math.sin(angle) * reach)
+                z = math.floor(player.z - math.cos(angle) * reach)
+                y = math.floor(player.y) + rng.randint(-2, 1)
+                block = AIR if rng.random() < 0.4 else BLOCK_IDS[rng.choice(BOT_PLACE_BLOCKS)]
+                events.append(SessionEvent(tick, EVENT_EDIT, (index, x, y, z, block)))
+
+        world.tick(events)
+        recording.events.extend(events)
+        if (tick + 1) % checksum_interval == 0:
+            recording.events.append(SessionEvent(tick, EVENT_CHECKSUM, (world.checksum(),)))
+    return recording
+
+
+# ----------------------------------------------------------------------
+# Replay
+# ----------------------------------------------------------------------
+
+@dataclass
+class ReplayReport:
+    """Replay sonucu"""
+    ticks: int
+    tick_rate: int
+    setup_seconds: float
+    seconds: float
+    timings: np.ndarray  # [tick, SUBSYSTEMS] saniye
+    checkpoints: int = 0
+    divergence_tick: Optional[int] = None
+    last_verified_tick: Optional[int] = None
+    trace: List[Tuple[int, int]] = field(default_factory=list)
+    faces: int = 0
+
+    @property
+    def realtime_factor(self) -> float:
+        """Simüle edilen oyun süresi / duvar saati süresi"""
+        return self.ticks / self.tick_rate / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def diverged(self) -> bool:
+        return self.divergence_tick is not None
+
+    def subsystem_summary(self) -> Dict[str, Dict[str, float]]:
+        """Alt sistem başına tick süresi ortalama/p95/maksimum (ms)"""
+        if len(self.timings) == 0:
+            return {}
+        milliseconds = self.timings * 1000
+        return {
+            name: {
+                'mean_ms': float(milliseconds[:, index].mean()),
+                'p95_ms': float(np.percentile(milliseconds[:, index], 95)),
+                'max_ms': float(milliseconds[:, index].max()),
+            }
+            for index, name in enumerate(SUBSYSTEMS)
+        }
+
+
+def replay_session(recording: SessionRecording, checksum_interval: Optional[int] = None,
+                   stop_on_divergence: bool = True) -> ReplayReport:
+    """Kaydı headless olarak olabildiğince hızlı yeniden oynat
+
+    Kayıttaki checksum'lar kendi tick'lerinde doğrulanır. checksum_interval
+    verilirse her N tick'te bir checksum ayrıca trace'e yazılır (iki
+    replay'i first_divergence ile karşılaştırmak için).
+    """
+    setup_start = time.perf_counter()
+    world = HeadlessWorld(recording.meta, recording.tick_rate)
+    setup_seconds = time.perf_counter() - setup_start
+
+    by_tick: Dict[int, List[SessionEvent]] = {}
+    expected: Dict[int, int] = {}
+    for event in recording.events:
+        if event.kind == EVENT_CHECKSUM:
+            expected[event.tick] = event.data[0]
+        else:
+            by_tick.setdefault(event.tick, []).append(event)
+
+    timings = np.zeros((recording.ticks, len(SUBSYSTEMS)))
+    report = ReplayReport(recording.ticks, recording.tick_rate, setup_seconds, 0.0, timings)
+    start = time.perf_counter()
+    for tick in range(recording.ticks):
+        row = timings[tick]
+        world.tick(by_tick.get(tick, ()), row)
+        traced = checksum_interval is not None and (tick + 1) % checksum_interval == 0
+        if tick in expected or traced:
+            checksum_start = time.perf_counter()
+            checksum = world.checksum()
+            row[4] = time.perf_counter() - checksum_start
+            if traced:
+                report.trace.append((tick, checksum))
+            if tick in expected:
+                report.checkpoints += 1
+                if checksum != expected[tick]:
+                    if report.divergence_tick is None:
+                        report.divergence_tick = tick
+                    if stop_on_divergence:
+                        report.ticks = tick + 1
+                        report.timings = timings[:tick + 1]
+                        break
+                elif report.divergence_tick is None:
+                    report.last_verified_tick = tick
+    report.seconds = time.perf_counter() - start
+    report.faces = world.mesher.face_count
+    return report
+
+
+def first_divergence(trace: List[Tuple[int, int]], reference: List[Tuple[int, int]]) -> Optional[int]:
+    """İki checksum izinin ayrıştığı ilk tick (aynıysa None)"""
+    for (tick, checksum), (reference_tick, reference_checksum) in zip(trace, reference):
+        if tick != reference_tick or checksum != reference_checksum:
+            return min(tick, reference_tick)
+    if len(trace) != len(reference):
+        shorter = min(trace, reference, key=len)
+        return shorter[-1][0] + 1 if shorter else 0
+    return None
+
+
+def main():
+    """Oturum kaydet ya da kaydı headless oynat"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='SkyWorld session recorder and headless replayer')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    record_parser = subparsers.add_parser('record', help='Seed\'li bot oturumu kaydet')
+    record_parser.add_argument('output', type=Path, help='Kayıt dosyası')
+    record_parser.add_argument('--seed', type=int, default=42, help='Oturum seed değeri')
+    record_parser.add_argument('--ticks', type=int, default=1200, help='Tick sayısı')
+    record_parser.add_argument('--players', type=int, default=4, help='Bot oyuncu sayısı')
+    record_parser.add_argument('--checksum-interval', type=int, default=DEFAULT_CHECKSUM_INTERVAL,
+                               help='Kaç tick\'te bir checksum alınır')
+    replay_parser = subparsers.add_parser('replay', help='Kaydı headless oynat')
+    replay_parser.add_argument('input', type=Path, help='Kayıt dosyası')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        recording = record_session(args.seed, args.ticks, args.players, checksum_interval=args.checksum_interval)
+        size = save_session(recording, args.output)
+        print(f"  Events: {len(recording.events)} over {recording.ticks} ticks")
+        print(f"  Size: {size} bytes ({size / recording.ticks:.2f} bytes/tick)")
+        return 0
+
+    report = replay_session(load_session(args.input))
+    print(f"  Replayed {report.ticks} ticks in {report.seconds:.2f}s ({report.realtime_factor:.1f}x real time)")
+    for name, summary in report.subsystem_summary().items():
+        print(f"  {name}: mean {summary['mean_ms']:.3f} ms, p95 {summary['p95_ms']:.3f} ms, max {summary['max_ms']:.3f} ms")
+    if report.diverged:
+        print(f"  ❌ Diverged at tick {report.divergence_tick} (last verified: {report.last_verified_tick})")
+        return 1
+    print(f"  ✅ {report.checkpoints} checkpoints verified")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
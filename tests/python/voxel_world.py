@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - Voxel Chunk Store
+@author MiniMax Agent
+
+BlockSystem'in Python karşılığı: chunk'lar (cx, cz) anahtarıyla tutulan
+uint8 blok id dizileridir. Dizi düzeni JS Chunk.getIndex ile aynıdır
+(x + z * size + y * size * size), yani numpy ekseni [y, z, x] sırasındadır.
+Dünya üretimi ve toplu düzenlemeler write_voxels/write_region ile chunk
+bazında vektörel yazılır.
+"""
+
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+import numpy as np
+
+# src/constants/world.js ile aynı
+CHUNK_SIZE = 16
+WORLD_HEIGHT = 256
+SEA_LEVEL = 32
+
+# Blok id tablosu: 0 her zaman hava. İlk yedisi src/constants/blocks.js BLOCK_TYPES
+# sırasındadır; DIRT BlockSystem.generateTerrain ve defaultWorld.json'da, SAND
+# çöl/okyanus adalarında kullanılır. WATER sadece blok güncelleme motorunda
+# (block_updates.py) akışkan olarak simüle edilir.
+BLOCK_TYPES = ('air', 'grass', 'stone', 'wood', 'iron', 'diamond', 'lava', 'dirt', 'sand', 'water')
+BLOCK_IDS = {name: block_id for block_id, name in enumerate(BLOCK_TYPES)}
+AIR = BLOCK_IDS['air']
+
+ChunkKey = Tuple[int, int]
+
+
+def block_id(block_type: str) -> int:
+    """Blok adını id'ye çevir"""
+    try:
+        return BLOCK_IDS[block_type.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown block type: {block_type}") from None
+
+
+def chunk_key(x: int, z: int) -> ChunkKey:
+    """Dünya koordinatının chunk anahtarı (WORLD_UTILS.worldToChunkCoords)"""
+    return x // CHUNK_SIZE, z // CHUNK_SIZE
+
+
+class ChunkStore:
+    """(cx, cz) -> uint8[WORLD_HEIGHT, CHUNK_SIZE, CHUNK_SIZE] chunk deposu"""
+
+    def __init__(self):
+        self.chunks: Dict[ChunkKey, np.ndarray] = {}
+        self.dirty_chunks: Set[ChunkKey] = set()
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def __iter__(self) -> Iterator[ChunkKey]:
+        return iter(self.chunks)
+
+    def get_chunk(self, cx: int, cz: int, create: bool = False) -> Optional[np.ndarray]:
+        """Chunk dizisini döndür (create=True ise boş chunk oluştur)"""
+        chunk = self.chunks.get((cx, cz))
+        if chunk is None and create:
+            chunk = np.zeros((WORLD_HEIGHT, CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+            self.chunks[(cx, cz)] = chunk
+        return chunk
+
+    def get_block(self, x: int, y: int, z: int) -> int:
+        """Tek blok oku (yüklü olmayan chunk veya sınır dışı = hava)"""
+        if y < 0 or y >= WORLD_HEIGHT:
+            return AIR
+        chunk = self.chunks.get((x // CHUNK_SIZE, z // CHUNK_SIZE))
+        if chunk is None:
+            return AIR
+        return int(chunk[y, z % CHUNK_SIZE, x % CHUNK_SIZE])
+
+    def set_block(self, x: int, y: int, z: int, block: int):
+        """Tek blok yaz (BlockSystem.setBlock karşılığı)"""
+        if y < 0 or y >= WORLD_HEIGHT:
+            return
+        key = (x // CHUNK_SIZE, z // CHUNK_SIZE)
+        self.get_chunk(*key, create=True)[y, z % CHUNK_SIZE, x % CHUNK_SIZE] = block
+        self.dirty_chunks.add(key)
+
+    def write_voxels(self, x: np.ndarray, y: np.ndarray, z: np.ndarray, blocks, skip_air: bool = False) -> int:
+        """Dünya koordinatlarındaki voxel'leri chunk bazında toplu yaz
+
+        Aynı konuma birden fazla yazım varsa sondaki kazanır. Yazılan voxel
+        sayısını döndürür.
+        """
+        x, y, z, blocks = (array.ravel() for array in np.broadcast_arrays(
+            np.asarray(x, dtype=np.int64), np.asarray(y, dtype=np.int64),
+            np.asarray(z, dtype=np.int64), np.asarray(blocks, dtype=np.uint8)))
+
+        keep = (y >= 0) & (y < WORLD_HEIGHT)
+        if skip_air:
+            keep &= blocks != AIR
+        if not keep.all():
+            x, y, z, blocks = x[keep], y[keep], z[keep], blocks[keep]
+        if x.size == 0:
+            return 0
+
+        cx = x // CHUNK_SIZE
+        cz = z // CHUNK_SIZE
+        keys = (cx - cx.min()) * (int(cz.max() - cz.min()) + 1) + (cz - cz.min())
+        if keys.max() < 1 << 16:
+            keys = keys.astype(np.uint16)  # numpy 16-bit anahtarlarda radix sort kullanır
+        # Kararlı sıralama: chunk içinde yazım sırası korunur
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        bounds = np.flatnonzero(np.diff(keys)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [keys.size]))
+
+        # Chunk içi düz indeks: JS Chunk.getIndex ile aynı
+        local = (y * (CHUNK_SIZE * CHUNK_SIZE) + (z % CHUNK_SIZE) * CHUNK_SIZE + x % CHUNK_SIZE)[order]
+        sorted_blocks = blocks[order]
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            first = order[start]
+            key = (int(cx[first]), int(cz[first]))
+            self.get_chunk(*key, create=True).reshape(-1)[local[start:end]] = sorted_blocks[start:end]
+            self.dirty_chunks.add(key)
+        return int(x.size)
+
+    def write_region(self, origin: Tuple[int, int, int], volume: np.ndarray, skip_air: bool = True) -> int:
+        """[y, z, x] düzenli bir hacmi origin'den itibaren yaz (chunk sınırlarında kırpılır)
+
+        skip_air=True iken hava voxel'leri mevcut blokları ezmez. Yazılan
+        voxel sayısını döndürür.
+        """
+        ox, oy, oz = origin
+        height, depth, width = volume.shape
+        y0, y1 = max(oy, 0), min(oy + height, WORLD_HEIGHT)
+        if y0 >= y1:
+            return 0
+
+        written = 0
+        for cx in range(ox // CHUNK_SIZE, (ox + width - 1) // CHUNK_SIZE + 1):
+            x0, x1 = max(ox, cx * CHUNK_SIZE), min(ox + width, (cx + 1) * CHUNK_SIZE)
+            for cz in range(oz // CHUNK_SIZE, (oz + depth - 1) // CHUNK_SIZE + 1):
+                z0, z1 = max(oz, cz * CHUNK_SIZE), min(oz + depth, (cz + 1) * CHUNK_SIZE)
+                source = volume[y0 - oy:y1 - oy, z0 - oz:z1 - oz, x0 - ox:x1 - ox]
+                if skip_air:
+                    mask = source != AIR
+                    count = int(np.count_nonzero(mask))
+                    if count == 0:
+                        continue
+                else:
+                    mask, count = True, source.size
+                chunk = self.get_chunk(cx, cz, create=True)
+                target = chunk[y0:y1, z0 - cz * CHUNK_SIZE:z1 - cz * CHUNK_SIZE, x0 - cx * CHUNK_SIZE:x1 - cx * CHUNK_SIZE]
+                np.copyto(target, source, where=mask)
+                self.dirty_chunks.add((cx, cz))
+                written += count
+        return written
+
+    def block_count(self) -> int:
+        """Havadan farklı toplam blok sayısı"""
+        return sum(int(np.count_nonzero(chunk)) for chunk in self.chunks.values())
@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+"""
+SkyWorld v2.0 - World Edit Journal
+@author MiniMax Agent
+
+Dünya durumu sadece bellekte (BlockSystem.chunks) tutulduğu için kaydetmek
+bütün dünyayı yeniden yazmak demekti. Bu modül blok değişikliklerini ve
+envanter deltalarını append-only bir write-ahead journal'a yazar:
+
+- Kayıtlar kompakt binary'dir (blok 11 bayt, envanter 8 bayt) ve bir
+  flusher thread tarafından çerçeveler hâlinde toplanıp tek fsync ile
+  diske yazılır (group commit).
+- Snapshot'lar oyun thread'inde sadece kirli chunk'ların kopyasını alır;
+  sıkıştırma, yazma ve fsync arka plan thread'inde yapılır. Her snapshot
+  bir öncekinin üzerine sadece değişen chunk dosyalarını ekler.
+- Snapshot'ın LSN'inden eski journal segmentleri silinir (compaction).
+- Açılışta son snapshot yüklenir ve kalan journal çerçeveleri tekrar
+  oynatılır; yarım yazılmış (torn) son çerçeve kesilip atılır.
+
+Dizin düzeni:
+    journal-<ilk LSN>.wal   segment: '<4sBxxxQ' header + çerçeveler
+    snapshot.json           son snapshot manifestosu (atomik değiştirilir)
+    snapshots/              chunk.<cx>.<cz>.<lsn>.bin, inventory.<lsn>.bin
+"""
+
+import os
+import json
+import time
+import zlib
+import queue
+import struct
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from profiling import span
+from voxel_world import CHUNK_SIZE, WORLD_HEIGHT, ChunkKey, ChunkStore
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_VERSION = 1
+SEGMENT_MAGIC = b'SKYJ'
+SEGMENT_HEADER = struct.Struct('<4sBxxxQ')  # magic, version, ilk LSN
+FRAME_HEADER = struct.Struct('<IQII')  # crc32, ilk LSN, blok kaydı sayısı, envanter kaydı sayısı
+FRAME_META = struct.Struct('<QII')  # CRC'ye dahil edilen header alanları
+BLOCK_RECORD = struct.Struct('<iHiB')  # x, y, z, blok
+INVENTORY_RECORD = struct.Struct('<IBBh')  # oyuncu, slot, eşya, delta
+
+# Kayıt yapıları ile aynı paketlenmiş düzen; toplu kodlama/çözme için
+BLOCK_DTYPE = np.dtype([('x', '<i4'), ('y', '<u2'), ('z', '<i4'), ('block', 'u1')])
+INVENTORY_DTYPE = np.dtype([('player', '<u4'), ('slot', 'u1'), ('item', 'u1'), ('delta', '<i2')])
+INVENTORY_SNAPSHOT_DTYPE = np.dtype([('player', '<u4'), ('slot', 'u1'), ('item', 'u1'), ('count', '<i4')])
+
+MANIFEST_NAME = 'snapshot.json'
+SNAPSHOT_DIR = 'snapshots'
+DEFAULT_SEGMENT_SIZE = 8 * 1024 * 1024
+DEFAULT_COMMIT_INTERVAL = 0.005
+DEFAULT_MAX_BATCH_RECORDS = 16384
+REPLAY_BATCH_RECORDS = 1 << 20
+SNAPSHOT_COMPRESSION_LEVEL = 1
+
+InventoryKey = Tuple[int, int]
+
+
+class JournalError(RuntimeError):
+    """Journal dizini okunamıyor ya da tutarsız"""
+
+
+@dataclass
+class JournalStats:
+    """Yazma istatistikleri"""
+    records: int = 0
+    logical_bytes: int = 0
+    frames: int = 0
+    fsyncs: int = 0
+    journal_bytes: int = 0
+    snapshots: int = 0
+    snapshot_bytes: int = 0
+    snapshot_chunks: int = 0
+    compacted_segments: int = 0
+    compacted_bytes: int = 0
+
+    @property
+    def write_amplification(self) -> float:
+        """Diske yazılan toplam bayt / kaydedilen mantıksal bayt"""
+        if self.logical_bytes == 0:
+            return 0.0
+        return (self.journal_bytes + self.snapshot_bytes) / self.logical_bytes
+
+
+@dataclass
+class RecoveryStats:
+    """Açılıştaki kurtarma sonucu"""
+    snapshot_lsn: int = 0
+    snapshot_chunks: int = 0
+    segments: int = 0
+    frames: int = 0
+    records: int = 0
+    torn_bytes: int = 0
+    last_lsn: int = 0
+    duration: float = 0.0
+
+    @property
+    def seconds_per_million(self) -> float:
+        return self.duration / self.records * 1e6 if self.records else 0.0
+
+
+@dataclass
+class _SnapshotTask:
+    """Oyun thread'inde yakalanmış, arka planda yazılacak snapshot"""
+    lsn: int
+    chunks: Dict[ChunkKey, np.ndarray]
+    inventory: np.ndarray
+    failures: int = 0  # yakalama anındaki başarısız snapshot sayısı
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+def _fsync_directory(directory: Path):
+    """Dizin girdilerini (yeni/silinen dosyalar) kalıcı yap"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # Windows dizin açmayı desteklemez
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _segment_name(first_lsn: int) -> str:
+    return f"journal-{first_lsn:016d}.wal"
+
+
+class WorldJournal:
+    """Blok ve envanter değişiklikleri için write-ahead journal
+
+    Oyun thread'i set_block/set_blocks/inventory_delta çağırır; değişiklik
+    bellekteki duruma hemen uygulanır ve döndürülen LSN flusher thread'in
+    bir sonraki group commit'iyle kalıcı olur (wait_durable ile beklenebilir).
+    """
+
+    def __init__(self, directory: Path, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 commit_interval: float = DEFAULT_COMMIT_INTERVAL,
+                 max_batch_records: int = DEFAULT_MAX_BATCH_RECORDS,
+                 snapshot_every: Optional[int] = None):
+        self.directory = Path(directory)
+        self.snapshot_dir = self.directory / SNAPSHOT_DIR
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.commit_interval = commit_interval
+        self.max_batch_records = max_batch_records
+        self.snapshot_every = snapshot_every
+
+        self.store = ChunkStore()
+        self.inventory: Dict[InventoryKey, List[int]] = {}
+        self.stats = JournalStats()
+        self._manifest: Dict[str, object] = {'version': JOURNAL_VERSION, 'lsn': 0, 'chunks': {}, 'inventory': None}
+
+        # Eklenen ama henüz yazılmamış kayıtlar (_append_lock), dosya yazımı (_io_lock)
+        self._append_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._durable = threading.Condition()
+        self._pending_blocks: List[bytes] = []
+        self._pending_inventory: List[bytes] = []
+        self._pending_block_count = 0
+        self._pending_inventory_count = 0
+        self._pending_first_lsn = 1
+        self._segment = None
+        self._segment_bytes = 0
+        self._since_snapshot = 0
+        self._snapshot_failures = 0
+        self._closed = False
+
+        self.recovery = self._recover()
+        self._next_lsn = self.recovery.last_lsn + 1
+        self._pending_first_lsn = self._next_lsn
+        self.durable_lsn = self.recovery.last_lsn
+        self.snapshot_lsn = self.recovery.snapshot_lsn
+
+        self._wake = threading.Event()
+        self._snapshot_queue: "queue.Queue[Optional[_SnapshotTask]]" = queue.Queue()
+        self._flusher = threading.Thread(target=self._flush_loop, name='skyworld-journal-flusher', daemon=True)
+        self._snapshotter = threading.Thread(target=self._snapshot_loop, name='skyworld-journal-snapshot', daemon=True)
+        self._flusher.start()
+        self._snapshotter.start()
+
+    # ------------------------------------------------------------------
+    # Değişiklik kaydı
+    # ------------------------------------------------------------------
+
+    @property
+    def last_lsn(self) -> int:
+        """Son eklenen kaydın LSN'i"""
+        return self._next_lsn - 1
+
+    def set_block(self, x: int, y: int, z: int, block: int) -> int:
+        """Tek blok değişikliği; LSN döndürür (dünya dışı y yok sayılır)"""
+        if y < 0 or y >= WORLD_HEIGHT:
+            return self.last_lsn
+        with self._append_lock:
+            self.store.set_block(x, y, z, block)
+            self._pending_blocks.append(BLOCK_RECORD.pack(x, y, z, block))
+            self._pending_block_count += 1
+            lsn = self._next_lsn
+            self._next_lsn += 1
+        self._after_append(1)
+        return lsn
+
+    def set_blocks(self, x, y, z, blocks) -> int:
+        """Toplu blok değişikliği (aynı konumda sondaki kazanır); son LSN'i döndürür"""
+        x, y, z, blocks = (array.ravel() for array in np.broadcast_arrays(
+            np.asarray(x, dtype=np.int64), np.asarray(y, dtype=np.int64),
+            np.asarray(z, dtype=np.int64), np.asarray(blocks, dtype=np.uint8)))
+        keep = (y >= 0) & (y < WORLD_HEIGHT)
+        if not keep.all():
+            x, y, z, blocks = x[keep], y[keep], z[keep], blocks[keep]
+        if x.size == 0:
+            return self.last_lsn
+
+        records = np.empty(x.size, dtype=BLOCK_DTYPE)
+        records['x'], records['y'], records['z'], records['block'] = x, y, z, blocks
+        with self._append_lock:
+            self.store.write_voxels(x, y, z, blocks)
+            self._pending_blocks.append(records.tobytes())
+            self._pending_block_count += x.size
+            self._next_lsn += x.size
+            lsn = self._next_lsn - 1
+        self._after_append(int(x.size))
+        return lsn
+
+    def inventory_delta(self, player: int, slot: int, item: int, delta: int) -> int:
+        """Oyuncu envanter slotuna delta uygula; LSN döndürür"""
+        with self._append_lock:
+            self._apply_inventory(player, slot, item, delta)
+            self._pending_inventory.append(INVENTORY_RECORD.pack(player, slot, item, delta))
+            self._pending_inventory_count += 1
+            lsn = self._next_lsn
+            self._next_lsn += 1
+        self._after_append(1)
+        return lsn
+
+    def _apply_inventory(self, player: int, slot: int, item: int, delta: int):
+        key = (player, slot)
+        entry = self.inventory.get(key)
+        count = (entry[1] if entry is not None else 0) + delta
+        if count > 0:
+            self.inventory[key] = [item, count]
+        elif entry is not None:
+            del self.inventory[key]
+
+    def _after_append(self, records: int):
+        """Batch dolduysa flusher'ı uyandır, gerekiyorsa snapshot al"""
+        if self._pending_block_count + self._pending_inventory_count >= self.max_batch_records:
+            self._wake.set()
+        if self.snapshot_every:
+            self._since_snapshot += records
+            if self._since_snapshot >= self.snapshot_every:
+                self.snapshot()
+
+    # ------------------------------------------------------------------
+    # Group commit
+    # ------------------------------------------------------------------
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wake.wait(self.commit_interval)
+            self._wake.clear()
+            self._flush()
+
+    def _flush(self, roll: bool = False):
+        """Bekleyen kayıtları tek çerçeve olarak yaz ve fsync et"""
+        with self._io_lock:
+            with self._append_lock:
+                frame = self._take_pending()
+            self._write_frame(frame, roll)
+
+    def _take_pending(self):
+        """Bekleyen kayıtları çerçeve için devral (_append_lock altında)"""
+        frame = (self._pending_first_lsn, self._pending_block_count, self._pending_inventory_count,
+                 b''.join(self._pending_blocks), b''.join(self._pending_inventory))
+        self._pending_blocks, self._pending_inventory = [], []
+        self._pending_block_count = self._pending_inventory_count = 0
+        self._pending_first_lsn = self._next_lsn
+        return frame
+
+    def _write_frame(self, frame, roll: bool = False):
+        """Çerçeveyi aktif segmente ekle (_io_lock altında)"""
+        first_lsn, block_count, inventory_count, block_bytes, inventory_bytes = frame
+        records = block_count + inventory_count
+        if records:
+            if self._segment is None:
+                path = self.directory / _segment_name(first_lsn)
+                # Aynı isimli segment varsa ortasına ikinci header yazılmasın
+                self._segment = open(path, 'xb')
+                self._segment.write(SEGMENT_HEADER.pack(SEGMENT_MAGIC, JOURNAL_VERSION, first_lsn))
+                self._segment_bytes = SEGMENT_HEADER.size
+                self.stats.journal_bytes += SEGMENT_HEADER.size
+                _fsync_directory(self.directory)
+
+            crc = zlib.crc32(FRAME_META.pack(first_lsn, block_count, inventory_count))
+            crc = zlib.crc32(inventory_bytes, zlib.crc32(block_bytes, crc))
+            header = FRAME_HEADER.pack(crc, first_lsn, block_count, inventory_count)
+            with span('journal.commit'):
+                self._segment.write(header + block_bytes + inventory_bytes)
+                self._segment.flush()
+                os.fsync(self._segment.fileno())
+
+            written = FRAME_HEADER.size + len(block_bytes) + len(inventory_bytes)
+            self._segment_bytes += written
+            self.stats.records += records
+            self.stats.logical_bytes += len(block_bytes) + len(inventory_bytes)
+            self.stats.journal_bytes += written
+            self.stats.frames += 1
+            self.stats.fsyncs += 1
+            with self._durable:
+                self.durable_lsn = first_lsn + records - 1
+                self._durable.notify_all()
+
+        if self._segment is not None and (roll or self._segment_bytes >= self.segment_size):
+            self._segment.close()
+            self._segment = None
+
+    def commit(self) -> int:
+        """Şu ana kadar eklenen her şeyi hemen kalıcı yap; kalıcı LSN'i döndürür"""
+        self._flush()
+        return self.durable_lsn
+
+    def wait_durable(self, lsn: int, timeout: Optional[float] = None) -> bool:
+        """LSN kalıcı olana kadar bekle"""
+        self._wake.set()
+        with self._durable:
+            return self._durable.wait_for(lambda: self.durable_lsn >= lsn, timeout)
+
+    # ------------------------------------------------------------------
+    # Snapshot ve compaction
+    # ------------------------------------------------------------------
+
+    def snapshot(self, wait: bool = False) -> int:
+        """Kirli chunk'ları yakala ve arka planda snapshot olarak yaz
+
+        Oyun thread'indeki maliyet bekleyen kayıtların commit'i ve kirli
+        chunk'ların bellek kopyasıdır. Snapshot'ın LSN'ini döndürür.
+        """
+        with span('journal.snapshot.capture'):
+            with self._io_lock:
+                with self._append_lock:
+                    # Snapshot sınırı çerçeve ve segment sınırına denk gelir
+                    self._write_frame(self._take_pending(), roll=True)
+                    lsn = self.last_lsn
+                    chunks = {key: self.store.chunks[key].copy() for key in self.store.dirty_chunks
+                              if key in self.store.chunks}
+                    self.store.dirty_chunks.clear()
+                    inventory = np.array([(player, slot, item, count)
+                                          for (player, slot), (item, count) in self.inventory.items()],
+                                         dtype=INVENTORY_SNAPSHOT_DTYPE)
+                    self._since_snapshot = 0
+                    failures = self._snapshot_failures
+        task = _SnapshotTask(lsn, chunks, inventory, failures)
+        self._snapshot_queue.put(task)
+        if wait:
+            task.done.wait()
+        return lsn
+
+    def import_world(self, store: ChunkStore) -> int:
+        """Journal dışında üretilmiş dünyayı (ör. IslandGenerator) taban snapshot olarak al"""
+        with self._append_lock:
+            self.store.chunks.update(store.chunks)
+            self.store.dirty_chunks.update(store.chunks)
+        return self.compact()
+
+    def compact(self) -> int:
+        """Snapshot al, yazılmasını bekle ve eski segmentleri sil"""
+        return self.snapshot(wait=True)
+
+    def _snapshot_loop(self):
+        while True:
+            task = self._snapshot_queue.get()
+            if task is None:
+                return
+            try:
+                if task.failures != self._snapshot_failures:
+                    # Önceki snapshot başarısız olduğunda yakalanmış: onun
+                    # chunk'larını içermez, yazılırsa o düzenlemeler kaybolur
+                    self._restore_dirty(task)
+                    logger.warning(f"⚠️ Skipping snapshot at LSN {task.lsn} captured before a failed snapshot")
+                    continue
+                self._write_snapshot(task)
+                self._compact_segments(task.lsn)
+            except OSError as error:
+                logger.error(f"❌ Snapshot at LSN {task.lsn} failed: {error}")
+                with self._append_lock:
+                    self._snapshot_failures += 1
+                self._restore_dirty(task)
+            finally:
+                task.done.set()
+
+    def _restore_dirty(self, task: _SnapshotTask):
+        """Yazılamayan snapshot'ın chunk'larını bir sonraki snapshot için tekrar kirlet"""
+        with self._append_lock:
+            self.store.dirty_chunks.update(task.chunks)
+
+    def _write_snapshot(self, task: _SnapshotTask):
+        """Chunk dosyalarını yaz, manifestoyu atomik olarak değiştir, eski dosyaları sil"""
+        with span('journal.snapshot.write'):
+            chunks = dict(self._manifest['chunks'])
+            written = 0
+            for (cx, cz), chunk in task.chunks.items():
+                name = f"chunk.{cx}.{cz}.{task.lsn}.bin"
+                written += self._write_durable(self.snapshot_dir / name,
+                                               zlib.compress(chunk.tobytes(), SNAPSHOT_COMPRESSION_LEVEL))
+                chunks[f"{cx},{cz}"] = name
+            inventory_name = f"inventory.{task.lsn}.bin"
+            written += self._write_durable(self.snapshot_dir / inventory_name,
+                                           zlib.compress(task.inventory.tobytes(), SNAPSHOT_COMPRESSION_LEVEL))
+            _fsync_directory(self.snapshot_dir)
+
+            manifest = {'version': JOURNAL_VERSION, 'lsn': task.lsn, 'chunks': chunks, 'inventory': inventory_name}
+            temp_path = self.directory / (MANIFEST_NAME + '.tmp')
+            written += self._write_durable(temp_path, json.dumps(manifest, separators=(',', ':')).encode('utf-8'))
+            os.replace(temp_path, self.directory / MANIFEST_NAME)
+            _fsync_directory(self.directory)
+
+            # Yeni manifestonun referans vermediği eski sürümler artık gereksiz
+            referenced = set(chunks.values()) | {inventory_name}
+            for path in self.snapshot_dir.iterdir():
+                if path.name not in referenced:
+                    path.unlink()
+
+        self._manifest = manifest
+        self.snapshot_lsn = task.lsn
+        self.stats.snapshots += 1
+        self.stats.snapshot_chunks += len(task.chunks)
+        self.stats.snapshot_bytes += written
+
+    @staticmethod
+    def _write_durable(path: Path, data: bytes) -> int:
+        with open(path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        return len(data)
+
+    def _compact_segments(self, snapshot_lsn: int):
+        """Tüm kayıtları snapshot'ta olan kapalı segmentleri sil"""
+        with span('journal.compact'):
+            removed = 0
+            for path, first_lsn in self._segments():
+                # Snapshot segment sınırında alındığı için snapshot_lsn'den
+                # önce başlayan her segment tamamen snapshot'a katlanmıştır
+                if first_lsn > snapshot_lsn:
+                    continue
+                self.stats.compacted_bytes += path.stat().st_size
+                path.unlink()
+                removed += 1
+            if removed:
+                _fsync_directory(self.directory)
+                self.stats.compacted_segments += removed
+
+    def _segments(self) -> List[Tuple[Path, int]]:
+        """Segment dosyaları, ilk LSN sırasıyla"""
+        segments = []
+        for path in self.directory.glob('journal-*.wal'):
+            try:
+                segments.append((path, int(path.stem.split('-', 1)[1])))
+            except ValueError:
+                logger.warning(f"⚠️ Ignoring unexpected journal file {path.name}")
+        return sorted(segments, key=lambda item: item[1])
+
+    # ------------------------------------------------------------------
+    # Kurtarma
+    # ------------------------------------------------------------------
+
+    def _recover(self) -> RecoveryStats:
+        """Son snapshot'ı yükle ve sonrasındaki journal çerçevelerini oynat"""
+        start = time.perf_counter()
+        stats = RecoveryStats()
+        manifest_path = self.directory / MANIFEST_NAME
+        if manifest_path.exists():
+            with span('journal.recover.snapshot'):
+                self._load_snapshot(manifest_path, stats)
+
+        with span('journal.recover.replay'):
+            block_batches: List[np.ndarray] = []
+            last_lsn = stats.snapshot_lsn
+            segments = self._segments()
+            for index, (path, _) in enumerate(segments):
+                intact, segment_last = self._replay_segment(path, stats, block_batches)
+                last_lsn = max(last_lsn, segment_last)
+                if sum(batch.size for batch in block_batches) >= REPLAY_BATCH_RECORDS:
+                    self._apply_block_batches(block_batches)
+                    block_batches = []
+                if not intact:
+                    # Bozulmanın ardından gelen segmentler LSN sürekliliğini bozar
+                    for later, _ in segments[index + 1:]:
+                        stats.torn_bytes += later.stat().st_size
+                        later.unlink()
+                    break
+            self._apply_block_batches(block_batches)
+
+        stats.last_lsn = last_lsn
+        stats.duration = time.perf_counter() - start
+        if stats.torn_bytes:
+            logger.warning(f"⚠️ Discarded {stats.torn_bytes} bytes of torn journal data")
+        return stats
+
+    def _load_snapshot(self, manifest_path: Path, stats: RecoveryStats):
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        except ValueError as error:
+            raise JournalError(f"Snapshot manifest is corrupt: {error}") from None
+        if manifest.get('version') != JOURNAL_VERSION:
+            raise JournalError(f"Unsupported journal version: {manifest.get('version')}")
+
+        shape = (WORLD_HEIGHT, CHUNK_SIZE, CHUNK_SIZE)
+        for key, name in manifest['chunks'].items():
+            cx, cz = (int(part) for part in key.split(','))
+            data = zlib.decompress((self.snapshot_dir / name).read_bytes())
+            self.store.chunks[(cx, cz)] = np.frombuffer(data, dtype=np.uint8).reshape(shape).copy()
+        if manifest.get('inventory'):
+            rows = np.frombuffer(zlib.decompress((self.snapshot_dir / manifest['inventory']).read_bytes()),
+                                 dtype=INVENTORY_SNAPSHOT_DTYPE)
+            for player, slot, item, count in rows.tolist():
+                self.inventory[(player, slot)] = [item, count]
+
+        self._manifest = manifest
+        stats.snapshot_lsn = manifest['lsn']
+        stats.snapshot_chunks = len(manifest['chunks'])
+
+    def _replay_segment(self, path: Path, stats: RecoveryStats, block_batches: List[np.ndarray]) -> Tuple[bool, int]:
+        """Segmentteki sağlam çerçeveleri oynat; (bozulmasız mı, son LSN) döndürür"""
+        data = path.read_bytes()
+        last_lsn = 0
+        if len(data) < SEGMENT_HEADER.size or SEGMENT_HEADER.unpack_from(data)[0] != SEGMENT_MAGIC:
+            stats.torn_bytes += len(data)
+            path.unlink()
+            return False, last_lsn
+
+        stats.segments += 1
+        offset = SEGMENT_HEADER.size
+        while offset < len(data):
+            if offset + FRAME_HEADER.size > len(data):
+                break
+            crc, first_lsn, block_count, inventory_count = FRAME_HEADER.unpack_from(data, offset)
+            block_end = offset + FRAME_HEADER.size + block_count * BLOCK_RECORD.size
+            frame_end = block_end + inventory_count * INVENTORY_RECORD.size
+            if frame_end > len(data):
+                break
+            meta = data[offset + FRAME_HEADER.size - FRAME_META.size:offset + FRAME_HEADER.size]
+            if zlib.crc32(data[offset + FRAME_HEADER.size:frame_end], zlib.crc32(meta)) != crc:
+                break
+
+            records = block_count + inventory_count
+            last_lsn = first_lsn + records - 1
+            if first_lsn > stats.snapshot_lsn:
+                if block_count:
+                    block_batches.append(np.frombuffer(data, dtype=BLOCK_DTYPE, count=block_count,
+                                                       offset=offset + FRAME_HEADER.size))
+                if inventory_count:
+                    # Envanter blok durumundan bağımsız; sırası blok kayıtlarıyla karışabilir
+                    inventory = np.frombuffer(data, dtype=INVENTORY_DTYPE, count=inventory_count, offset=block_end)
+                    for player, slot, item, delta in inventory.tolist():
+                        self._apply_inventory(player, slot, item, delta)
+                stats.frames += 1
+                stats.records += records
+            offset = frame_end
+
+        if offset == SEGMENT_HEADER.size:
+            # Sağlam çerçevesi olmayan segment silinir; aynı ilk LSN ile
+            # yeniden açılacak segmentle isim çakışmasın
+            stats.torn_bytes += len(data) - offset
+            path.unlink()
+            return offset == len(data), last_lsn
+        if offset < len(data):
+            # Yarım kalmış son çerçeve: sağlam kısma kadar kes
+            stats.torn_bytes += len(data) - offset
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+                os.fsync(f.fileno())
+            return False, last_lsn
+        return True, last_lsn
+
+    def _apply_block_batches(self, block_batches: List[np.ndarray]):
+        """Biriken blok kayıtlarını tek write_voxels çağrısıyla uygula"""
+        if not block_batches:
+            return
+        records = np.concatenate(block_batches) if len(block_batches) > 1 else block_batches[0]
+        self.store.write_voxels(records['x'], records['y'], records['z'], records['block'])
+
+    # ------------------------------------------------------------------
+    # Kapatma
+    # ------------------------------------------------------------------
+
+    def close(self, snapshot: bool = False):
+        """Bekleyen kayıtları yaz, snapshot thread'ini bitir ve dosyaları kapat"""
+        if self._closed:
+            return
+        if snapshot:
+            self.snapshot()
+        self._closed = True
+        self._wake.set()
+        self._flusher.join()
+        self._snapshot_queue.put(None)
+        self._snapshotter.join()
+        with self._io_lock:
+            with self._append_lock:
+                frame = self._take_pending()
+            self._write_frame(frame, roll=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()